@@ -21,8 +21,18 @@ from .couchdb_session_authenticator import CouchDbSessionAuthenticator
 from .couchdb_session_get_authenticator_patch import new_construct_authenticator
 from .couchdb_session_token_manager import CouchDbSessionTokenManager
 from .cloudant_v1 import CloudantV1
+from .async_cloudant_v1 import AsyncCloudantV1
+from .features.bulk_reader import BulkReader
+from .features.bulk_writer import BulkWriter
 from .features.changes_follower import ChangesFollower
+from .features.checkpoint import (CheckpointStore, FileCheckpointStore, LocalDocumentCheckpointStore,
+                                  MemoryCheckpointStore)
+from .features.document_cache import DocumentCache
+from .features.document_cache_follower import DocumentCacheFollower
+from .features.multi_database_changes_follower import MultiDatabaseChangesFollower
 from .features.pagination import Pager, PagerType, Pagination
+from .features.parallel_changes_follower import ParallelChangesFollower
+from .features.selector import Selector
 
 # sdk-core's __construct_authenticator works with a long switch-case so monkey-patching is required
 get_authenticator.__construct_authenticator = new_construct_authenticator
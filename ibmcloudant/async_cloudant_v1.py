@@ -0,0 +1,251 @@
+# coding: utf-8
+
+# © Copyright IBM Corporation 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Module for an asyncio variant of the Cloudant V1 service.
+
+The AsyncCloudantV1 service shares the operation definitions, request building
+and validation of CloudantV1, but sends the prepared requests on a non-blocking
+aiohttp transport. Every operation returns a coroutine that must be awaited.
+
+This module requires the optional aiohttp dependency, install it with:
+    pip install "ibmcloudant[async]"
+"""
+import json
+import logging
+from io import BytesIO
+
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+from ibm_cloud_sdk_core.authenticators import Authenticator
+from ibm_cloud_sdk_core.utils import is_json_mimetype
+from requests import Request, Response
+from requests.cookies import get_cookie_header
+from requests.structures import CaseInsensitiveDict
+
+from .cloudant_base_service import _error_response_hook
+from .cloudant_v1 import CloudantV1
+
+# pylint: disable=missing-docstring
+
+# Default size of the connection pool shared by all requests of a client
+MAX_CONNECTIONS = 100
+# Default number of seconds an idle pooled connection is kept open
+KEEPALIVE_TIMEOUT = 15
+
+_MISSING_AIOHTTP_MSG = 'AsyncCloudantV1 requires the aiohttp package, ' \
+    'install it with: pip install "ibmcloudant[async]"'
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncCloudantV1(CloudantV1):
+    """
+    The Cloudant V1 service with an asyncio transport.
+
+    All the CloudantV1 operations are available with the same arguments,
+    but return a coroutine of the DetailedResponse, for example:
+
+        async with AsyncCloudantV1.new_instance() as client:
+            response = await client.post_all_docs(db='orders')
+
+    Arguments are validated and the request is prepared when the operation
+    is called, so invalid arguments raise a ValueError before awaiting.
+
+    Requests are sent on a dedicated aiohttp connection pool, bound to the event
+    loop that sends the first request. Close the client with close() or use it
+    as an async context manager to release the pooled connections.
+
+    Note that authenticators still obtain tokens synchronously, so a token
+    request briefly blocks the event loop when a token expires.
+    Automatic retries configured with enable_retries() are not applied by the
+    asyncio transport. The *_as_stream operations return the
+    aiohttp.ClientResponse to read the body from instead of a BinaryIO.
+    The iter_*_rows helpers, the document cache, pagination and the
+    changes followers are only available for the synchronous client.
+
+    :param Authenticator authenticator: The authenticator specifies the authentication mechanism.
+    :param int max_connections: The maximum number of simultaneous connections in the pool.
+    :param int max_connections_per_host: The maximum number of simultaneous
+           connections to the same host, 0 for no additional limit.
+    :param float keepalive_timeout: The number of seconds to keep an idle connection open.
+    """
+
+    def __init__(
+        self,
+        authenticator: Authenticator = None,
+        *,
+        max_connections: int = MAX_CONNECTIONS,
+        max_connections_per_host: int = 0,
+        keepalive_timeout: float = KEEPALIVE_TIMEOUT,
+    ) -> None:
+        CloudantV1.__init__(self, authenticator=authenticator)
+        if max_connections < 1:
+            raise ValueError('max_connections must be at least 1.')
+        if max_connections_per_host < 0:
+            raise ValueError('max_connections_per_host must not be negative.')
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self._async_session = None
+        # Replaced sessions that are closed on the next send or close
+        self._stale_sessions = []
+
+    async def __aenter__(self) -> 'AsyncCloudantV1':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Close the connection pool of this client.
+        """
+        await self._close_stale_sessions()
+        if self._async_session is not None:
+            await self._async_session.close()
+            self._async_session = None
+
+    def set_disable_ssl_verification(self, status: bool = False) -> None:
+        super().set_disable_ssl_verification(status)
+        # The connector holds the SSL configuration so the session is replaced on the
+        # next send, the replaced session cannot be closed without awaiting so it is
+        # closed then
+        if getattr(self, '_async_session', None) is not None:
+            self._stale_sessions.append(self._async_session)
+            self._async_session = None
+
+    async def _close_stale_sessions(self) -> None:
+        while self._stale_sessions:
+            await self._stale_sessions.pop().close()
+
+    def _get_async_session(self):
+        if self._async_session is None or self._async_session.closed:
+            try:
+                import aiohttp  # pylint: disable=import-outside-toplevel
+            except ImportError as exc:
+                raise ImportError(_MISSING_AIOHTTP_MSG) from exc
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_connections_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ssl=False if self.disable_ssl_verification else True,
+            )
+            # Cookies are supplied from the service cookie jar for each request
+            self._async_session = aiohttp.ClientSession(
+                connector=connector,
+                cookie_jar=aiohttp.DummyCookieJar(),
+                auto_decompress=True,
+            )
+        return self._async_session
+
+    @staticmethod
+    def _client_timeout(timeout):
+        import aiohttp  # pylint: disable=import-outside-toplevel
+        if isinstance(timeout, (tuple, list)):
+            connect_timeout, read_timeout = timeout
+        else:
+            connect_timeout, read_timeout = timeout, timeout
+        return aiohttp.ClientTimeout(total=None, sock_connect=connect_timeout, sock_read=read_timeout)
+
+    @staticmethod
+    def _to_requests_response(method: str, url: str, response, body: bytes) -> Response:
+        # Non-JSON results and errors are surfaced with a requests Response in
+        # the same way as the synchronous client, including the error augmentation.
+        requests_response = Response()
+        requests_response.status_code = response.status
+        requests_response.headers = CaseInsensitiveDict(response.headers)
+        requests_response.url = url
+        requests_response.reason = response.reason
+        requests_response.encoding = response.charset or 'utf-8'
+        requests_response.request = Request(method=method, url=url).prepare()
+        requests_response.raw = BytesIO(body)
+        return _error_response_hook(requests_response)
+
+    async def send(self, request: dict, **kwargs) -> DetailedResponse:
+        """Send a request asynchronously and wrap the response in a DetailedResponse or ApiException.
+
+        The result of a non-JSON response is a requests Response with the
+        read body. The result of a stream request, for example of the
+        *_as_stream operations, is the open aiohttp ClientResponse and the
+        caller must release it, for example by reading the body or with
+        "async with".
+
+        :param dict request: The prepared request to send to the service endpoint.
+        :raises ApiException: The exception from the API.
+        :return: The response from the request.
+        :rtype: DetailedResponse
+        """
+        kwargs = dict({'timeout': 60}, **kwargs)
+        kwargs = dict(kwargs, **self.http_config)
+        stream_response = kwargs.get('stream') or False
+        method = request['method']
+        url = request['url']
+
+        headers = dict(request['headers'])
+        cookie = get_cookie_header(self.jar, Request(method=method, url=url, headers=headers))
+        if cookie is not None:
+            headers['Cookie'] = cookie
+        proxy = None
+        proxies = kwargs.get('proxies')
+        if proxies:
+            proxy = proxies.get(url.split(':', 1)[0])
+
+        await self._close_stale_sessions()
+        session = self._get_async_session()
+        logger.debug('Sending HTTP request message')
+        response = await session.request(
+            method,
+            url,
+            headers=headers,
+            params=request.get('params'),
+            data=request.get('data'),
+            timeout=self._client_timeout(kwargs['timeout']),
+            proxy=proxy,
+        )
+        logger.debug('Received HTTP response message, status code %d', response.status)
+        try:
+            if 200 <= response.status <= 299:
+                if response.status == 204 or method == 'HEAD':
+                    result = None
+                elif stream_response:
+                    # The caller reads the body from the response content stream
+                    return DetailedResponse(response=response, headers=response.headers,
+                                            status_code=response.status)
+                else:
+                    body = await response.read()
+                    if not body:
+                        result = None
+                    elif is_json_mimetype(response.headers.get('Content-Type')):
+                        try:
+                            if self._json_loads is None:
+                                result = json.loads(body, strict=False)
+                            else:
+                                result = self._json_loads(body)
+                        except ValueError as err:
+                            raise ApiException(
+                                code=response.status,
+                                http_response=self._to_requests_response(method, url, response, body),
+                                message='Error processing the HTTP response',
+                            ) from err
+                    else:
+                        # The connection is released so return the read body
+                        result = self._to_requests_response(method, url, response, body)
+                return DetailedResponse(response=result, headers=response.headers, status_code=response.status)
+            body = b'' if method == 'HEAD' else await response.read()
+            raise ApiException(response.status,
+                               http_response=self._to_requests_response(method, url, response, body))
+        finally:
+            if not stream_response:
+                response.release()
@@ -17,19 +17,27 @@
 Module to patch sdk core base service for session authentication
 and other helpful features.
 """
+import json
+import socket
 from collections import namedtuple
-from typing import Dict, Optional, Union, Tuple, List
+from typing import Any, Callable, Dict, Optional, Union, Tuple, List
 from urllib.parse import urlsplit, unquote
 from json import dumps
 from json.decoder import JSONDecodeError
 from io import BytesIO
 
-from ibm_cloud_sdk_core import BaseService
+from ibm_cloud_sdk_core import ApiException, BaseService, DetailedResponse
 from ibm_cloud_sdk_core.authenticators import Authenticator
+from ibm_cloud_sdk_core.http_adapter import SSLHTTPAdapter
+from ibm_cloud_sdk_core.utils import is_json_mimetype
 from requests import Response, Session
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, DEFAULT_RETRIES
+from urllib3.connection import HTTPConnection
 
-from .common import get_sdk_headers
+from .common import get_operation_id, get_sdk_headers
 from .couchdb_session_authenticator import CouchDbSessionAuthenticator
+from .features.document_cache import DocumentCache, _DocumentCacheEntry
+from .features.json_stream import JsonStreamItems
 
 # pylint: disable=missing-docstring
 
@@ -71,6 +79,45 @@ for rule in [doc_id_rule, att_name_rule]:
         # Since Py3.6 dict is ordered so use a key only dict for our set
         rules_by_operation.setdefault(operation_id, dict()).setdefault(rule)
 
+# Operations that write the document in the path segment after the database
+document_write_operation_ids = frozenset([
+    'delete_document',
+    'put_document',
+    'delete_attachment',
+    'put_attachment'
+])
+# Operations that write the documents with the IDs in their result
+documents_result_operation_ids = frozenset([
+    'post_document',
+    'post_bulk_docs'
+])
+
+class _ConnectionPoolHTTPAdapter(SSLHTTPAdapter):
+    """
+    HTTP adapter that also sets the socket options of the pooled connections.
+    """
+    def __init__(self, *args, socket_options: Optional[List[tuple]] = None, **kwargs):
+        self._socket_options = socket_options
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=DEFAULT_POOLBLOCK, **pool_kwargs):
+        if self._socket_options is not None:
+            pool_kwargs['socket_options'] = self._socket_options
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+
+def _keep_alive_socket_options(idle: int) -> List[tuple]:
+    # Send TCP keep-alive probes after idle seconds so that idle pooled
+    # connections are not dropped by proxies and load balancers
+    options = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    if hasattr(socket, 'TCP_KEEPIDLE'):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, idle))
+    elif hasattr(socket, 'TCP_KEEPALIVE'):
+        # The macOS name of TCP_KEEPIDLE
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPALIVE, idle))
+    if hasattr(socket, 'TCP_KEEPINTVL'):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, idle))
+    return options
+
 class CloudantBaseService(BaseService):
     """
     The base class for service classes.
@@ -87,6 +134,10 @@ class CloudantBaseService(BaseService):
                Get up to date information from https://github.com/IBM/python-sdk-core/blob/main/README.md
                about initializing the authenticator of your choice.
         """
+        self._connection_pool_options: Optional[dict] = None
+        self._json_dumps: Optional[Callable[[Any], Union[str, bytes]]] = None
+        self._json_loads: Optional[Callable[[bytes], Any]] = None
+        self._document_cache: Optional[DocumentCache] = None
         BaseService.__init__(self, service_url=service_url, authenticator=authenticator)
         # Overwrite default read timeout to 2.5 minutes
         if not ('timeout' in self.http_config):
@@ -121,15 +172,251 @@ class CloudantBaseService(BaseService):
 
     def set_disable_ssl_verification(self, status: bool = False) -> None:
         super().set_disable_ssl_verification(status)
+        self._mount_connection_pool()
         if isinstance(self.authenticator, CouchDbSessionAuthenticator):
             self.authenticator.token_manager.set_disable_ssl_verification(status)
 
     def set_http_client(self, http_client: Session) -> None:
         super().set_http_client(http_client)
+        self._mount_connection_pool()
         if isinstance(self.authenticator, CouchDbSessionAuthenticator):
             self.authenticator._set_http_client(self.get_http_client(), self.jar)
         add_hooks(self)
 
+    def enable_retries(self, max_retries: int = 4, retry_interval: float = 30.0) -> None:
+        super().enable_retries(max_retries, retry_interval)
+        self._mount_connection_pool()
+
+    def disable_retries(self):
+        super().disable_retries()
+        self._mount_connection_pool()
+
+    def set_connection_pool(self,
+                            pool_connections: int = DEFAULT_POOLSIZE,
+                            pool_maxsize: int = DEFAULT_POOLSIZE,
+                            pool_block: bool = DEFAULT_POOLBLOCK,
+                            keep_alive_idle: Optional[int] = None) -> None:
+        """
+        Set the sizes of the HTTP connection pools.
+
+        Set pool_maxsize to at least the number of threads making concurrent
+        requests, otherwise connections are discarded when the pool is full
+        and new connections are made for later requests.
+        The authenticators that share the client, for example
+        CouchDbSessionAuthenticator, use the same connection pools.
+
+        :param int pool_connections: The number of hosts to keep connection pools for.
+        :param int pool_maxsize: The maximum number of connections to keep in each pool.
+        :param bool pool_block: True to wait for a free connection when the pool has
+               pool_maxsize connections in use, instead of making a new connection.
+        :param int keep_alive_idle: (optional) Send TCP keep-alive probes on connections
+               that are idle for this number of seconds. The default of None uses the
+               system settings.
+        """
+        for name, value in (('pool_connections', pool_connections),
+                            ('pool_maxsize', pool_maxsize),
+                            ('keep_alive_idle', keep_alive_idle)):
+            if value is not None and value < 1:
+                raise ValueError(f'The provided {name} {value} must be at least 1.')
+        self._connection_pool_options = {
+            'pool_connections': pool_connections,
+            'pool_maxsize': pool_maxsize,
+            'pool_block': pool_block,
+            'socket_options': None if keep_alive_idle is None else _keep_alive_socket_options(keep_alive_idle),
+        }
+        self._mount_connection_pool()
+
+    def _mount_connection_pool(self) -> None:
+        # The core replaces the HTTP adapter when the retries or SSL verification
+        # change so the connection pool options are applied to each new adapter
+        if self._connection_pool_options is None:
+            return
+        previous_adapter = self.http_adapter
+        # requests turns max_retries=None into the urllib3 default of 3 retries
+        # so the disabled retries are passed as the requests default of none
+        self.http_adapter = _ConnectionPoolHTTPAdapter(
+            max_retries=self.retry_config if self.retry_config is not None else DEFAULT_RETRIES,
+            _disable_ssl_verification=self.disable_ssl_verification,
+            **self._connection_pool_options
+        )
+        self.http_client.mount('http://', self.http_adapter)
+        self.http_client.mount('https://', self.http_adapter)
+        if previous_adapter is not self.http_adapter:
+            previous_adapter.close()
+
+    def get_connection_pool_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Return the occupancy of the HTTP connection pools.
+
+        The stats of each pool are keyed by the scheme, host and port and are:
+            maxsize: the maximum number of connections kept in the pool.
+            in_use: the number of connections taken from the pool.
+            idle: the number of open connections waiting in the pool.
+            connections: the number of connections made by the pool.
+            requests: the number of requests made by the pool.
+
+        :return: The stats of each connection pool.
+        :rtype: dict
+        """
+        stats = {}
+        pools = self.http_adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            # The pool queue is filled with None for connections not yet made
+            queued = list(pool.pool.queue) if pool.pool is not None else []
+            stats[f'{pool.scheme}://{pool.host}:{pool.port}'] = {
+                'maxsize': pool.pool.maxsize if pool.pool is not None else 0,
+                'in_use': (pool.pool.maxsize - len(queued)) if pool.pool is not None else 0,
+                'idle': sum(1 for conn in queued if conn is not None),
+                'connections': pool.num_connections,
+                'requests': pool.num_requests,
+            }
+        return stats
+
+    def set_json_codec(self,
+                       dumps: Optional[Callable[[Any], Union[str, bytes]]] = None,
+                       loads: Optional[Callable[[bytes], Any]] = None) -> None:
+        """
+        Set the functions to encode request bodies and decode response bodies
+        as JSON, for example the dumps and loads of a faster JSON library.
+
+        The loads function decodes the JSON responses of every operation and
+        the rows of the stream helpers and the changes follower. It is called
+        with the bytes of the body.
+        The dumps function encodes the documents of the BulkWriter and the
+        JSON request bodies of the operations. The operations first encode
+        their bodies with the json module, so the codec sets the sent bytes
+        but does not save that encoding. It may return str or bytes.
+        The bodies of error responses are augmented with the json module.
+        The default of None uses the json module.
+
+        :param dumps: The function to encode JSON request bodies.
+        :param loads: The function to decode JSON response bodies.
+        """
+        self._json_dumps = dumps
+        self._json_loads = loads
+
+    def _dumps_json(self, obj: Any) -> bytes:
+        data = dumps(obj) if self._json_dumps is None else self._json_dumps(obj)
+        return data.encode('utf-8') if isinstance(data, str) else data
+
+    def _loads_json(self, data: bytes) -> Any:
+        # Like the core, allow control characters in strings
+        return json.loads(data, strict=False) if self._json_loads is None else self._json_loads(data)
+
+    def set_document_cache(self, document_cache: Optional[DocumentCache]) -> None:
+        """
+        Set a cache for the documents got by get_document.
+
+        The documents written by this client are removed from the cache.
+        A cache can be shared by clients for the same service URL.
+        The default of None does not cache documents.
+
+        :param DocumentCache document_cache: The cache for documents.
+        """
+        self._document_cache = document_cache
+
+    def send(self, request: dict, **kwargs) -> DetailedResponse:
+        document_cache = self._document_cache
+        if document_cache is None or kwargs.get('stream'):
+            return self._send(request, **kwargs)
+        operation_id = get_operation_id(request.get('headers'))
+        if operation_id == 'get_document':
+            return self._send_cached_document(document_cache, request, **kwargs)
+        detailed_response = self._send(request, **kwargs)
+        self._invalidate_documents(document_cache, operation_id, request, detailed_response)
+        return detailed_response
+
+    def _send(self, request: dict, **kwargs) -> DetailedResponse:
+        if self._json_loads is None or kwargs.get('stream'):
+            return super().send(request, **kwargs)
+        # Take the response undecoded to decode the body with the codec
+        detailed_response = super().send(request, **dict(kwargs, stream=True))
+        response = detailed_response.get_result()
+        if not isinstance(response, Response):
+            return detailed_response
+        return self._decode_response(response, response.content)
+
+    def _decode_response(self, response: Response, body: bytes) -> DetailedResponse:
+        if not body:
+            result = None
+        elif is_json_mimetype(response.headers.get('Content-Type')):
+            try:
+                result = self._loads_json(body)
+            except ValueError as err:
+                raise ApiException(
+                    code=response.status_code,
+                    http_response=response,
+                    message='Error processing the HTTP response',
+                ) from err
+        else:
+            result = response
+        return DetailedResponse(response=result, headers=response.headers, status_code=response.status_code)
+
+    def _document_path_segments(self, request: dict) -> List[str]:
+        # The decoded path segments of the request URL after the service URL
+        path = urlsplit(request['url']).path
+        service_path = urlsplit(self.service_url).path.rstrip('/')
+        return [unquote(segment) for segment in path[len(service_path):].strip('/').split('/')]
+
+    def _send_cached_document(self, document_cache: DocumentCache, request: dict, **kwargs) -> DetailedResponse:
+        headers = request['headers']
+        if 'If-None-Match' in headers:
+            # The caller handles the conditional request
+            return self._send(request, **kwargs)
+        db, doc_id = self._document_path_segments(request)[:2]
+        key = (db, doc_id, tuple(sorted(request['params'].items())))
+        entry, fresh, generation = document_cache._lookup(key)
+        if entry is not None:
+            if fresh:
+                return self._cached_document_response(entry)
+            headers['If-None-Match'] = entry.etag
+        try:
+            detailed_response = super().send(request, **dict(kwargs, stream=True))
+        except ApiException as err:
+            if err.status_code == 304 and entry is not None:
+                document_cache._revalidated(key, entry)
+                return self._cached_document_response(entry)
+            raise
+        response = detailed_response.get_result()
+        body = response.content
+        detailed_response = self._decode_response(response, body)
+        result = detailed_response.get_result()
+        etag = response.headers.get('ETag')
+        if etag is None and isinstance(result, dict) and '_rev' in result:
+            etag = f'"{result["_rev"]}"'
+        if etag is not None and isinstance(result, dict):
+            document_cache._store(key, _DocumentCacheEntry(etag, body, response.headers), generation)
+        return detailed_response
+
+    def _cached_document_response(self, entry: _DocumentCacheEntry) -> DetailedResponse:
+        # Decode the body for each get so that callers can change their result
+        return DetailedResponse(response=self._loads_json(entry.body), headers=entry.headers, status_code=200)
+
+    def _invalidate_documents(self,
+                              document_cache: DocumentCache,
+                              operation_id: Optional[str],
+                              request: dict,
+                              detailed_response: DetailedResponse) -> None:
+        if operation_id in document_write_operation_ids:
+            db, doc_id = self._document_path_segments(request)[:2]
+            document_cache.invalidate(db, doc_id)
+        elif operation_id in documents_result_operation_ids:
+            db = self._document_path_segments(request)[0]
+            result = detailed_response.get_result()
+            if isinstance(result, dict):
+                result = [result]
+            if isinstance(result, list) and result:
+                for document_result in result:
+                    document_cache.invalidate(db, document_result.get('id'))
+            else:
+                # For example the empty result of post_bulk_docs with new_edits false
+                document_cache.invalidate(db)
+        elif operation_id == 'delete_database':
+            document_cache.invalidate(self._document_path_segments(request)[0])
+
     def prepare_request(self,
                             method: str,
                             url: str,
@@ -142,14 +429,15 @@ class CloudantBaseService(BaseService):
                                                             Tuple[str,
                                                                 ...]]]]] = None,
                             **kwargs) -> dict:
-        # Extract the operation ID from the request headers.
-        operation_id = None
-        header = headers.get('X-IBMCloud-SDK-Analytics')
-        if header is not None:
-            for element in header.split(';'):
-                if element.startswith('operation_id'):
-                    operation_id = element.split('=')[1]
-                    break
+        if isinstance(data, str) and data and self._json_dumps is not None:
+            content_type = next((value for name, value in (headers or {}).items()
+                                 if name.lower() == 'content-type'), None)
+            if is_json_mimetype(content_type):
+                # The generated operations encode the body with the json module
+                # so encode it again with the codec
+                data = self._dumps_json(json.loads(data))
+        # Look up the operation ID of the request headers.
+        operation_id = get_operation_id(headers)
         if operation_id is not None:
             # Check each validation rule that applies to the operation.
             # Until the request URL is passed to old_prepare_request it does not include the
@@ -166,6 +454,55 @@ class CloudantBaseService(BaseService):
                             unquote(segment_to_validate)))
         return super().prepare_request(method, url, *args, headers=headers, params=params, data=data, files=files, **kwargs)
 
+    def iter_all_docs_rows(self, *args, **kwargs) -> JsonStreamItems:
+        """
+        Query a list of all documents in a database and decode the rows one at a time.
+
+        Takes the same arguments as post_all_docs and uses post_all_docs_as_stream.
+        The other fields of the result are available from the fields attribute.
+
+        :return: An iterable of the `DocsResultRow` dicts.
+        :rtype: JsonStreamItems
+        """
+        return JsonStreamItems(self.post_all_docs_as_stream(*args, **kwargs).get_result(), 'rows', loads=self._loads_json)
+
+    def iter_view_rows(self, *args, **kwargs) -> JsonStreamItems:
+        """
+        Query a MapReduce view and decode the rows one at a time.
+
+        Takes the same arguments as post_view and uses post_view_as_stream.
+        The other fields of the result are available from the fields attribute.
+
+        :return: An iterable of the `ViewResultRow` dicts.
+        :rtype: JsonStreamItems
+        """
+        return JsonStreamItems(self.post_view_as_stream(*args, **kwargs).get_result(), 'rows', loads=self._loads_json)
+
+    def iter_find_docs(self, *args, **kwargs) -> JsonStreamItems:
+        """
+        Query an index by using selector syntax and decode the documents one at a time.
+
+        Takes the same arguments as post_find and uses post_find_as_stream.
+        The other fields of the result are available from the fields attribute.
+
+        :return: An iterable of the `Document` dicts.
+        :rtype: JsonStreamItems
+        """
+        return JsonStreamItems(self.post_find_as_stream(*args, **kwargs).get_result(), 'docs', loads=self._loads_json)
+
+    def iter_changes_results(self, *args, **kwargs) -> JsonStreamItems:
+        """
+        Query the database document changes feed and decode the results one at a time.
+
+        Takes the same arguments as post_changes and uses post_changes_as_stream.
+        The other fields of the result, for example last_seq, are available
+        from the fields attribute after the iteration.
+
+        :return: An iterable of the `ChangesResultItem` dicts.
+        :rtype: JsonStreamItems
+        """
+        return JsonStreamItems(self.post_changes_as_stream(*args, **kwargs).get_result(), 'results', loads=self._loads_json)
+
 def _error_response_hook(response:Response, *args, **kwargs) -> Optional[Response]:
     # pylint: disable=W0613
     # unused args and kwargs required by requests event hook interface
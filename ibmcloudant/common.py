@@ -17,6 +17,7 @@
 Common module
 """
 import platform
+from typing import Mapping, Optional
 from .version import __version__
 
 SDK_ANALYTICS_HEADER = 'X-IBMCloud-SDK-Analytics'
@@ -44,8 +45,41 @@ def get_sdk_analytics(service_name, service_version, operation_id):  # pylint: d
 user_agent = f'{SDK_NAME}/{__version__} ({get_system_info()})'
 
 
+# The headers of each operation, built on the first request of the operation
+_sdk_headers_by_operation = {}
+# The operation ID of each analytics header value from get_sdk_headers
+_operation_id_by_analytics = {}
+
+
 def get_sdk_headers(service_name, service_version, operation_id):  # pylint: disable=missing-docstring
-    headers = {}
-    headers[SDK_ANALYTICS_HEADER] = get_sdk_analytics(service_name, service_version, operation_id)
-    headers[USER_AGENT_HEADER] = get_user_agent()
-    return headers
+    key = (service_name, service_version, operation_id)
+    headers = _sdk_headers_by_operation.get(key)
+    if headers is None:
+        analytics = get_sdk_analytics(service_name, service_version, operation_id)
+        headers = {
+            SDK_ANALYTICS_HEADER: analytics,
+            USER_AGENT_HEADER: get_user_agent(),
+        }
+        _operation_id_by_analytics[analytics] = operation_id
+        _sdk_headers_by_operation[key] = headers
+    # Callers update the headers so return a copy
+    return dict(headers)
+
+
+def get_operation_id(headers: Optional[Mapping[str, str]]) -> Optional[str]:
+    """
+    Return the operation ID from the SDK analytics header of a request,
+    or None if there is no SDK analytics header.
+    """
+    if headers is None:
+        return None
+    analytics = headers.get(SDK_ANALYTICS_HEADER)
+    if analytics is None:
+        return None
+    operation_id = _operation_id_by_analytics.get(analytics)
+    if operation_id is None:
+        # A header value that was not made by get_sdk_headers
+        for element in analytics.split(';'):
+            if element.startswith('operation_id'):
+                return element.split('=')[1]
+    return operation_id
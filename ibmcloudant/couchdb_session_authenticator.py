@@ -1,6 +1,6 @@
 # coding: utf-8
 
-# © Copyright IBM Corporation 2020, 2025.
+# © Copyright IBM Corporation 2020, 2026.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -31,6 +31,11 @@ class CouchDbSessionAuthenticator(Authenticator):
     Args:
         username: The CouchDB username
         password: The CouchDB password
+        disable_ssl_verification: A flag that indicates whether verification of the server's SSL
+            certificate should be disabled or not. Defaults to False.
+        background_refresh: A flag that indicates whether the session should be renewed by a
+            background thread before it expires, so that requests do not wait for the renewal.
+            Defaults to False.
 
     Attributes: token_manager (ibmcloudantsdk.couchdb_session_token_manager.CouchDbSessionTokenManager): Retrieves
     and manages CouchDB session tokens.
@@ -44,14 +49,18 @@ class CouchDbSessionAuthenticator(Authenticator):
     def __init__(self,
                  username: str,
                  password: str,
-                 disable_ssl_verification: bool = False) -> None:
+                 disable_ssl_verification: bool = False,
+                 background_refresh: bool = False) -> None:
         if not isinstance(disable_ssl_verification, bool):
             raise TypeError('disable_ssl_verification must be a bool')
+        if not isinstance(background_refresh, bool):
+            raise TypeError('background_refresh must be a bool')
 
         self.token_manager = CouchDbSessionTokenManager(
             username,
             password,
-            disable_ssl_verification=disable_ssl_verification
+            disable_ssl_verification=disable_ssl_verification,
+            background_refresh=background_refresh
         )
         self.validate()
 
@@ -88,6 +97,13 @@ class CouchDbSessionAuthenticator(Authenticator):
         """
         self.token_manager.get_token()
 
+    def stop_background_refresh(self) -> None:
+        """Stops the background thread renewing the session.
+
+        Later renewals are made by requests as without background_refresh.
+        """
+        self.token_manager.stop_background_refresh()
+
     def authentication_type(self) -> str:
         """Returns this authenticator's type ('COUCHDB_SESSION')."""
         return CouchDbSessionAuthenticator.AUTHTYPE_COUCHDB_SESSION
@@ -1,6 +1,6 @@
 # coding: utf-8
 
-# © Copyright IBM Corporation 2020, 2022.
+# © Copyright IBM Corporation 2020, 2026.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -34,6 +34,7 @@ def new_construct_authenticator(config):  # pylint: disable=missing-docstring
         return CouchDbSessionAuthenticator(
             username=config.get('USERNAME'),
             password=config.get('PASSWORD'),
-            disable_ssl_verification=config.get('DISABLE_SSL', 'false').lower() == 'true'
+            disable_ssl_verification=config.get('DISABLE_SSL', 'false').lower() == 'true',
+            background_refresh=config.get('BACKGROUND_REFRESH', 'false').lower() == 'true'
         )
     return old_construct_authenticator(config)
@@ -1,6 +1,6 @@
 # coding: utf-8
 
-# © Copyright IBM Corporation 2020, 2025.
+# © Copyright IBM Corporation 2020, 2026.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -16,10 +16,19 @@
 """
 Module for managing session authentication token
 """
+import logging
+import time
+from threading import Event, Lock, Thread
+
 from requests import Session
 
 from ibm_cloud_sdk_core.token_managers.token_manager import TokenManager
 
+logger = logging.getLogger(__name__)
+
+# seconds to wait before retrying a failed background refresh
+_RETRY_INTERVAL = 10
+
 
 class CouchDbSessionTokenManager(TokenManager):
     """The SessionTokenManager takes a username and password and performs the necessary interactions with
@@ -27,6 +36,11 @@ class CouchDbSessionTokenManager(TokenManager):
 
     If the current stored session token has expired a new session token will be retrieved.
 
+    With background_refresh the session token is renewed by a background thread
+    before its refresh time instead of by the first request after the refresh time.
+    Requests only wait for a session token when there is no valid session token.
+    At most one session token request is made at a time.
+
     This class is used by CouchDbSessionAuthenticator and is internal.
 
     Attributes:
@@ -39,11 +53,14 @@ class CouchDbSessionTokenManager(TokenManager):
     Args:
         username: The CouchDB username to obtain the session token for
         password: The CouchDB password to obtain the session token for
+        background_refresh: A flag that indicates whether the session token
+            should be renewed by a background thread. Defaults to False.
     """
 
     def __init__(self, username: str, password: str,
                  url: str = None,
                  disable_ssl_verification: bool = False,
+                 background_refresh: bool = False,
                  ):
         super().__init__(
             url,
@@ -59,6 +76,74 @@ class CouchDbSessionTokenManager(TokenManager):
         self.jar = None
         self.headers = None
 
+        self.background_refresh = background_refresh
+        # Serializes the session token requests made by get_token and the refresher
+        self._refresh_lock = Lock()
+        self._refresher = None
+        self._refresher_wakeup = Event()
+
+    def get_token(self):
+        """Get the session token, requesting a new one when needed.
+
+        With background_refresh this only waits for a session token request
+        when there is no valid session token, the background thread renews it
+        before it expires.
+
+        Returns:
+             A CookieJar of the session cookies.
+        """
+        if not self.background_refresh:
+            return super().get_token()
+        if self._is_token_expired():
+            self._refresh_token(only_if_expired=True)
+        self._start_background_refresh()
+        return self.access_token
+
+    def stop_background_refresh(self) -> None:
+        """Stop the background refresh thread.
+
+        Later session tokens are renewed by requests as without background_refresh.
+        """
+        self.background_refresh = False
+        refresher = self._refresher
+        if refresher is not None:
+            self._refresher_wakeup.set()
+            refresher.join()
+            self._refresher = None
+
+    def _start_background_refresh(self) -> None:
+        with self.lock:
+            if self._refresher is None and self.background_refresh:
+                self._refresher_wakeup.clear()
+                self._refresher = Thread(target=self._background_refresh_callback,
+                                         name=type(self).__name__, daemon=True)
+                self._refresher.start()
+
+    def _refresh_token(self, only_if_expired: bool = False) -> None:
+        with self._refresh_lock:
+            # Another thread may have renewed the token while this one waited
+            if only_if_expired and not self._is_token_expired():
+                return
+            token_response = self.request_token()
+            self._save_token_info(token_response)
+
+    def _background_refresh_callback(self) -> None:
+        last_attempt = None
+        while self.background_refresh:
+            delay = self.refresh_time - time.time()
+            if last_attempt is not None:
+                # Avoid retrying continuously after a failure or a short-lived session
+                delay = max(delay, last_attempt + _RETRY_INTERVAL - time.monotonic())
+            if self._refresher_wakeup.wait(max(delay, 0)):
+                self._refresher_wakeup.clear()
+                continue
+            last_attempt = time.monotonic()
+            try:
+                logger.debug('Performing background session token refresh')
+                self._refresh_token()
+            except Exception as e:  # pylint: disable=broad-except
+                logger.debug(f'Exception refreshing session token {e}')
+
     def request_token(self):
         """Request a CouchDB session token given an username and password.
 
@@ -0,0 +1,196 @@
+# coding: utf-8
+
+# © Copyright IBM Corporation 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Common batching of individual operations into bulk requests.
+"""
+import logging
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import BoundedSemaphore, Condition, Thread
+from typing import Any, List, Optional, Tuple
+
+_LINGER = 50
+_MAX_IN_FLIGHT = 2
+
+
+class _BackgroundBatcher(ABC):
+    """
+    Base class for the helpers that batch individual operations into
+    bulk requests sent from a background thread.
+
+    Subclasses add items with _submit and send each batch of
+    (item, future) tuples in _send_batch.
+
+    Args:
+        batch_size: The maximum number of items in a batch.
+        batch_bytes: The maximum size of the items in a batch.
+        linger: The duration to wait for a batch to fill set in milliseconds.
+        max_in_flight: The maximum number of concurrent batch requests.
+        max_pending: The number of pending items that blocks further
+        items until a batch is taken, or None for no limit.
+    """
+
+    def __init__(
+        self,
+        *,
+        batch_size: int,
+        batch_bytes: Optional[int] = None,
+        linger: int = _LINGER,
+        max_in_flight: int = _MAX_IN_FLIGHT,
+        max_pending: Optional[int] = None,
+    ) -> None:
+        for name, value, minimum in (
+            ('batch_size', batch_size, 1),
+            ('batch_bytes', batch_bytes, 1),
+            ('linger', linger, 0),
+            ('max_in_flight', max_in_flight, 1),
+        ):
+            if value is not None and value < minimum:
+                raise ValueError(f'The provided {name} {value} must be at least {minimum}.')
+        self.batch_size = batch_size
+        self.batch_bytes = batch_bytes
+        self.linger = linger
+        self.max_in_flight = max_in_flight
+        self.logger = logging.getLogger(type(self).__module__)
+        self._max_pending = max_pending
+        # The default Condition lock is re-entrant so subclasses can
+        # hold it around _submit
+        self._condition = Condition()
+        self._pending: List[Tuple[Any, int, Future]] = []
+        self._pending_bytes = 0
+        self._first_submit_time = 0.0
+        self._unresolved = 0
+        self._flushing = 0
+        self._closed = False
+        self._in_flight = BoundedSemaphore(max_in_flight)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_in_flight, thread_name_prefix=type(self).__name__
+        )
+        self._batch_thread = Thread(target=self._batch_callback, daemon=True)
+        self._batch_thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def flush(self) -> None:
+        """
+        Send the pending operations without waiting for the linger duration
+        and wait until the results of all operations are received.
+        """
+        with self._condition:
+            self._flushing += 1
+            self._condition.notify_all()
+            try:
+                self._condition.wait_for(lambda: self._unresolved == 0)
+            finally:
+                self._flushing -= 1
+
+    def close(self) -> None:
+        """
+        Send the pending operations, wait for their results and stop
+        the background thread. Further operations are invalid.
+        """
+        with self._condition:
+            if self._closed:
+                return
+        self.flush()
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._batch_thread.join()
+        self._executor.shutdown(wait=True)
+
+    def _submit(self, item: Any, size: int = 0) -> Future:
+        future = Future()
+        with self._condition:
+            if self._max_pending is not None:
+                # Bound the pending items when the requests are behind
+                self._condition.wait_for(
+                    lambda: self._closed or len(self._pending) < self._max_pending
+                )
+            if self._closed:
+                raise ValueError(f'The {type(self).__name__} is closed.')
+            if not self._pending:
+                self._first_submit_time = time.monotonic()
+            self._pending.append((item, size, future))
+            self._pending_bytes += size
+            self._unresolved += 1
+            self._condition.notify_all()
+        return future
+
+    def _batch_ready(self) -> bool:
+        return (
+            len(self._pending) >= self.batch_size
+            or (self.batch_bytes is not None and self._pending_bytes >= self.batch_bytes)
+            or self._flushing > 0
+            or self._closed
+            or time.monotonic() - self._first_submit_time >= self.linger / 1000
+        )
+
+    def _take_batch(self) -> List[Tuple[Any, Future]]:
+        batch_bytes = 0
+        count = 0
+        for _, size, _ in self._pending:
+            if count == self.batch_size or (
+                count > 0 and self.batch_bytes is not None and batch_bytes + size > self.batch_bytes
+            ):
+                break
+            batch_bytes += size
+            count += 1
+        batch = [(item, future) for item, _, future in self._pending[:count]]
+        del self._pending[:count]
+        self._pending_bytes -= batch_bytes
+        self._first_submit_time = time.monotonic()
+        self._condition.notify_all()
+        return batch
+
+    def _batch_callback(self) -> None:
+        while True:
+            with self._condition:
+                while not (self._pending and self._batch_ready()):
+                    if self._closed and not self._pending:
+                        return
+                    timeout = None
+                    if self._pending:
+                        timeout = self._first_submit_time + self.linger / 1000 - time.monotonic()
+                    self._condition.wait(timeout)
+                batch = self._take_batch()
+            # Wait for a free request slot before taking another batch
+            self._in_flight.acquire()
+            self._executor.submit(self._send_batch_callback, batch)
+
+    def _send_batch_callback(self, batch: List[Tuple[Any, Future]]) -> None:
+        try:
+            self.logger.debug(f'Sending batch of {len(batch)} items')
+            self._send_batch(batch)
+        except Exception as e:
+            self.logger.debug(f'Exception sending batch {e}')
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            self._in_flight.release()
+            with self._condition:
+                self._unresolved -= len(batch)
+                self._condition.notify_all()
+
+    @abstractmethod
+    def _send_batch(self, batch: List[Tuple[Any, Future]]) -> None:
+        raise NotImplementedError()
@@ -0,0 +1,127 @@
+# coding: utf-8
+
+# © Copyright IBM Corporation 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+A helper for coalescing document reads into bulk requests.
+"""
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Tuple
+
+from ibmcloudant.cloudant_v1 import BulkGetResultDocument, CloudantV1
+from .batching import _BackgroundBatcher, _MAX_IN_FLIGHT
+
+_BATCH_SIZE = 100
+# milliseconds to collect reads before sending a partial batch
+_LINGER = 10
+
+
+class BulkReader(_BackgroundBatcher):
+    """
+    BulkReader is a helper for coalescing document reads into
+    "post_bulk_get" requests.
+
+    Each call to get() adds a document ID, and optionally a revision, to the
+    pending batch and returns a Future of the BulkGetResultDocument for that
+    document. A background thread sends a batch when it reaches batch_size
+    documents or when linger milliseconds have passed since the first read
+    of the batch, so concurrent reads from many threads share requests.
+    Reads of the same document and revision in a pending batch share a
+    single Future.
+
+    Up to max_in_flight batch requests are made concurrently. When the
+    requests fall behind the reads, get() blocks while there are
+    max_in_flight pending batches to avoid using unbounded memory.
+
+    The BulkGetResultDocument has the document in "ok" or, for example if
+    the document does not exist, the "error". If a batch request fails the
+    Future of each document in the batch raises the exception.
+
+    Call close(), or use the BulkReader as a context manager, to send the
+    remaining reads and stop the background thread.
+
+    The named arguments for "post_bulk_get" other than "db", "docs" and
+    "latest", for example "revs", are used for every request. The "latest"
+    option is invalid because it can return several revisions of a document.
+
+    :param CloudantV1 service: A client for the Cloudant service.
+    :param str db: The name of the database to read from.
+    :param int batch_size: The maximum number of documents in a batch.
+    :param int linger: The duration to collect reads for a batch set in milliseconds.
+    :param int max_in_flight: The maximum number of concurrent batch requests.
+    :return: None
+    """
+
+    def __init__(
+        self,
+        service: CloudantV1,
+        db: str,
+        *,
+        batch_size: int = _BATCH_SIZE,
+        linger: int = _LINGER,
+        max_in_flight: int = _MAX_IN_FLIGHT,
+        **kwargs
+    ) -> None:
+        if not db:
+            raise ValueError('db must be provided')
+        for option in ('docs', 'latest'):
+            if option in kwargs:
+                raise ValueError(f"The option '{option}' is invalid when using BulkReader.")
+        super().__init__(
+            batch_size=batch_size,
+            linger=linger,
+            max_in_flight=max_in_flight,
+            max_pending=batch_size * max_in_flight,
+        )
+        self.service = service
+        self.db = db
+        self.options = kwargs
+        self._pending_futures: Dict[Tuple[str, Optional[str]], Future] = {}
+
+    def get(self, doc_id: str, rev: Optional[str] = None) -> 'Future[BulkGetResultDocument]':
+        """
+        Add a document read to the pending batch.
+
+        Returns a Future of the BulkGetResultDocument for the document.
+
+        Throws ValueError if the BulkReader is closed.
+        """
+        if not doc_id:
+            raise ValueError('doc_id must be provided')
+        key = (doc_id, rev)
+        with self._condition:
+            future = self._pending_futures.get(key)
+            if future is None:
+                future = self._submit(key)
+                self._pending_futures[key] = future
+            return future
+
+    def _take_batch(self) -> List[Tuple[Tuple[str, Optional[str]], Future]]:
+        batch = super()._take_batch()
+        # Later reads of these documents start a new batch. Reads that waited
+        # for space in the pending batches can repeat a key in the batch.
+        for key, _ in batch:
+            self._pending_futures.pop(key, None)
+        return batch
+
+    def _send_batch(self, batch: List[Tuple[Tuple[str, Optional[str]], Future]]) -> None:
+        docs = [{'id': doc_id} if rev is None else {'id': doc_id, 'rev': rev} for (doc_id, rev), _ in batch]
+        results = self.service.post_bulk_get(db=self.db, docs=docs, **self.options).get_result()['results']
+        if len(results) != len(batch):
+            raise ValueError(
+                f'Expected {len(batch)} results for the batch but received {len(results)}.'
+            )
+        # The results are in the same order as the requested documents
+        for (_, future), result in zip(batch, results):
+            future.set_result(BulkGetResultDocument.from_dict(result['docs'][0]))
@@ -0,0 +1,110 @@
+# coding: utf-8
+
+# © Copyright IBM Corporation 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+A helper for batching document writes into bulk requests.
+"""
+import io
+from concurrent.futures import Future
+from typing import Any, List, Tuple, Union
+
+from ibm_cloud_sdk_core.utils import convert_model
+
+from ibmcloudant.cloudant_v1 import CloudantV1, Document, DocumentResult
+from .batching import _BackgroundBatcher, _LINGER, _MAX_IN_FLIGHT
+
+_BATCH_SIZE = 500
+# 1 MiB, well below the maximum request body size
+_BATCH_BYTES = 1024 * 1024
+
+
+class BulkWriter(_BackgroundBatcher):
+    """
+    BulkWriter is a helper for batching document writes into
+    "post_bulk_docs" requests.
+
+    Each call to write() adds a document to the pending batch and returns
+    a Future of the DocumentResult for that document. A background thread
+    sends a batch when it reaches batch_size documents or batch_bytes
+    bytes of JSON, or when linger milliseconds have passed since the first
+    write of the batch.
+
+    Up to max_in_flight batch requests are made concurrently. When the
+    requests fall behind the writes, write() blocks while there are
+    max_in_flight pending batches to avoid using unbounded memory.
+
+    A DocumentResult with an error, for example a conflict, resolves the
+    Future as normal. If a batch request fails the Future of each document
+    in the batch raises the exception.
+
+    Call close(), or use the BulkWriter as a context manager, to send the
+    remaining writes and stop the background thread.
+
+    :param CloudantV1 service: A client for the Cloudant service.
+    :param str db: The name of the database to write to.
+    :param int batch_size: The maximum number of documents in a batch.
+    :param int batch_bytes: The maximum size in bytes of the documents in a batch.
+           A document larger than this is sent in a batch on its own.
+    :param int linger: The duration to wait for a batch to fill set in milliseconds.
+    :param int max_in_flight: The maximum number of concurrent batch requests.
+    :return: None
+    """
+
+    def __init__(
+        self,
+        service: CloudantV1,
+        db: str,
+        *,
+        batch_size: int = _BATCH_SIZE,
+        batch_bytes: int = _BATCH_BYTES,
+        linger: int = _LINGER,
+        max_in_flight: int = _MAX_IN_FLIGHT,
+    ) -> None:
+        if not db:
+            raise ValueError('db must be provided')
+        super().__init__(
+            batch_size=batch_size,
+            batch_bytes=batch_bytes,
+            linger=linger,
+            max_in_flight=max_in_flight,
+            max_pending=batch_size * max_in_flight,
+        )
+        self.service = service
+        self.db = db
+
+    def write(self, document: Union[Document, dict]) -> 'Future[DocumentResult]':
+        """
+        Add a document to the pending batch.
+
+        To delete a document write it with "_deleted" set to true.
+
+        Returns a Future of the DocumentResult for the document.
+
+        Throws ValueError if the BulkWriter is closed.
+        """
+        data = self.service._dumps_json(convert_model(document))
+        return self._submit(data, len(data))
+
+    def _send_batch(self, batch: List[Tuple[Any, Future]]) -> None:
+        body = b'{"docs":[' + b','.join(data for data, _ in batch) + b']}'
+        results = self.service.post_bulk_docs(
+            db=self.db, bulk_docs=io.BytesIO(body)
+        ).get_result()
+        if len(results) != len(batch):
+            raise ValueError(
+                f'Expected {len(batch)} results for the batch but received {len(results)}.'
+            )
+        for (_, future), result in zip(batch, results):
+            future.set_result(DocumentResult.from_dict(result))
@@ -22,19 +22,24 @@ import random
 import math
 from datetime import datetime, timezone, timedelta
 import functools
-from queue import Queue
-from threading import Thread, Event
+import json
+from collections import OrderedDict
+from queue import Full, Queue
+from threading import Event, Thread
 
 from enum import Enum, auto
-from typing import Dict, Iterator
+from typing import Any, Callable, Dict, Iterator, Optional
 
-from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
 
 from ibmcloudant.cloudant_v1 import (
     CloudantV1,
     PostChangesEnums,
+    ChangesResult,
     ChangesResultItem,
 )
+from .checkpoint import CheckpointStore, _CheckpointSaver
+from .queues import _put_unless_stopped
 
 # max timedelta in milliseconds
 _FOREVER = round(timedelta.max.total_seconds() * 1000) - 1
@@ -43,7 +48,23 @@ _MIN_CLIENT_TIMEOUT = 60000
 # To give the changes request a chance to be answered
 # before the client timeout it is set to 3 seconds less.
 _LONGPOLL_TIMEOUT = _MIN_CLIENT_TIMEOUT - 3000
+# Interval in milliseconds for heartbeats of the continuous feed,
+# well within the minimum client read timeout
+_HEARTBEAT = 10000
 _BATCH_SIZE = 10000
+# Target size in bytes of a batch of changes
+_BATCH_BYTES = 5 * 1024 * 1024
+# Target duration in milliseconds of a changes request
+_BATCH_DURATION = 10000
+# Number of changes of a batch encoded to estimate the size of a change
+_SIZE_SAMPLE = 50
+# Number of batches to request ahead of the consumer
+_PREFETCH_BATCHES = 1
+# Interval in seconds for the request thread to check for a stop
+# while waiting for space in the buffer
+_POLL_INTERVAL = 0.1
+# Minimum interval in milliseconds between saves of the checkpoint
+_CHECKPOINT_INTERVAL = 5000
 
 # Base delay in milliseconds between unsuccessful attempts to pull changes feed
 # in presence of transient errors
@@ -69,6 +90,120 @@ class _TransientErrorSuppression(Enum):
     TIMER = auto()
 
 
+class _BatchSizer:
+    """
+    The _BatchSizer adjusts the limit of successive changes requests from
+    the size and duration of the previous responses, so the batches stay
+    near _BATCH_BYTES bytes and _BATCH_DURATION milliseconds.
+
+    The size of a change is measured from the Content-Length of the
+    response. When the response has no Content-Length, for example because
+    it is compressed, it is estimated by encoding a sample of the changes
+    with dumps. The duration of a change is only measured from full
+    batches, because a longpoll request that is not full may have waited
+    for the changes. The estimates are moving averages of the batches and
+    the batch size at most doubles from one batch to the next.
+
+    Args:
+        batch_size: The initial batch size.
+        min_batch_size: The minimum batch size.
+        max_batch_size: The maximum batch size.
+        dumps: The function to encode the sample of the changes with.
+    """
+
+    def __init__(
+        self,
+        batch_size: int,
+        min_batch_size: int,
+        max_batch_size: int,
+        dumps: Callable[[Any], Any] = json.dumps,
+    ) -> None:
+        self.min_batch_size = min_batch_size
+        self.max_batch_size = max_batch_size
+        self.dumps = dumps
+        self.batch_size = self._bound(batch_size)
+        self._change_bytes = None
+        self._change_duration = None
+
+    def update(self, results, response_bytes: Optional[int], duration: float, limit: int) -> int:
+        """
+        Update the estimates from the results of a request for limit changes
+        with a response of response_bytes bytes, or None if unknown, that took
+        duration seconds and return the next batch size.
+        """
+        if not results:
+            return self.batch_size
+        if response_bytes is None:
+            step = max(len(results) // _SIZE_SAMPLE, 1)
+            sample = results[::step][:_SIZE_SAMPLE]
+            change_bytes = len(self.dumps(sample)) / len(sample)
+        else:
+            change_bytes = response_bytes / len(results)
+        self._change_bytes = self._average(self._change_bytes, change_bytes)
+        batch_size = _BATCH_BYTES / self._change_bytes
+        if len(results) >= limit:
+            self._change_duration = self._average(self._change_duration, duration * 1000 / len(results))
+        if self._change_duration:
+            batch_size = min(batch_size, _BATCH_DURATION / self._change_duration)
+        self.batch_size = self._bound(min(int(batch_size), 2 * self.batch_size))
+        return self.batch_size
+
+    def _bound(self, batch_size: int) -> int:
+        return min(max(batch_size, self.min_batch_size), self.max_batch_size)
+
+    @staticmethod
+    def _average(average: Optional[float], value: float) -> float:
+        return value if average is None else (average + value) / 2
+
+
+def _content_length(response: DetailedResponse) -> Optional[int]:
+    # The size of the decoded body, if the response states it
+    headers = response.get_headers() or {}
+    if headers.get('Content-Encoding', 'identity') != 'identity':
+        return None
+    try:
+        return int(headers['Content-Length'])
+    except (KeyError, ValueError):
+        return None
+
+
+class _DeduplicationWindow:
+    """
+    The _DeduplicationWindow drops the changes that repeat one of the
+    latest size changes passed to the consumer.
+
+    A change repeats another if it has the same document ID and revisions,
+    for example when changes are received again after a retry. The keys
+    are kept in least recently used order.
+
+    Args:
+        size: The number of changes to remember.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        # The number of dropped changes
+        self.suppressed = 0
+        self._keys: 'OrderedDict[tuple, None]' = OrderedDict()
+
+    def filter(self, results: list) -> list:
+        """
+        Return the results without the repeated changes.
+        """
+        changes = []
+        for change in results:
+            key = (change.get('id'), tuple(sorted(rev.get('rev', '') for rev in change.get('changes', ()))))
+            if key in self._keys:
+                self._keys.move_to_end(key)
+                self.suppressed += 1
+                continue
+            self._keys[key] = None
+            if len(self._keys) > self.size:
+                self._keys.popitem(last=False)
+            changes.append(change)
+        return changes
+
+
 class _ChangesFollowerIterator:
     """
     The ChangesFollowerIterator implements iterator interface.
@@ -83,12 +218,37 @@ class _ChangesFollowerIterator:
         or constant following the changes feed (LISTEN)
         error_tolerance: The duration to suppress errors,
         measured from the previous successful request.
+        raw: True to return the change items as the decoded dicts
+        instead of ChangesResultItem instances.
+        prefetch_batches: The number of batches to request ahead
+        of the consumer.
+        batches: True to return each batch of changes as a ChangesResult
+        instead of each change.
+        checkpoint_saver: A _CheckpointSaver to save the sequence of the
+        processed batches with, or None to not save it.
+        batch_sizer: A _BatchSizer to set the limit of each request,
+        or None to use the limit of changes_caller.
+        dedup_window: A _DeduplicationWindow to drop repeated changes,
+        or None to pass every change to the consumer.
     """
 
     def __init__(
-        self, changes_caller, mode: _Mode, error_tolerance: int
+        self,
+        changes_caller,
+        mode: _Mode,
+        error_tolerance: int,
+        raw: bool = False,
+        prefetch_batches: int = _PREFETCH_BATCHES,
+        batches: bool = False,
+        checkpoint_saver: Optional[_CheckpointSaver] = None,
+        batch_sizer: Optional[_BatchSizer] = None,
+        dedup_window: Optional[_DeduplicationWindow] = None,
     ) -> None:
         self.changes_caller = changes_caller
+        self._batch_sizer = batch_sizer
+        self._dedup_window = dedup_window
+        self.raw = raw
+        self.batches = batches
         self._changes_iter = iter([])
         self.mode = mode
         self._transient_suppression = _TransientErrorSuppression.TIMER
@@ -100,12 +260,17 @@ class _ChangesFollowerIterator:
         self.since = 'now' if mode is _Mode.LISTEN else '0'
         self._success_timestamp = datetime.now(timezone.utc)
         self._request_thread = Thread(target=self._request_callback)
-        self._buffer = Queue()
+        # The request thread waits, holding its latest batch, while there are
+        # prefetch_batches batches that the consumer has not started
+        self._buffer = Queue(maxsize=prefetch_batches)
         self._pending = None
         self._has_next = True
         self._retry = 0
         self._limit = None
         self._stop = Event()
+        # The last_seq of the batch the consumer is processing
+        self._batch_seq = None
+        self._checkpoint_saver = checkpoint_saver
         self.logger = logging.getLogger(__name__)
 
     @property
@@ -133,11 +298,13 @@ class _ChangesFollowerIterator:
         # shortcut limit and cancel in-flight
         self.limit = 0
         self._stop.set()
+        self._request_thread.join()
+        self._checkpoint(flush=True)
+        # Wake a consumer waiting for a batch, it checks for the stop
         try:
-            self._buffer.task_done()
-        except Exception:
+            self._buffer.put_nowait(StopIteration())
+        except Full:
             pass
-        self._request_thread.join()
 
     def __iter__(self):
         return self
@@ -146,30 +313,89 @@ class _ChangesFollowerIterator:
         while True:
             if self.limit is not None and self.limit == 0:
                 if not self._stop.is_set():
+                    # The consumer asked past the last change of the limit,
+                    # so the batch is processed if it had no further changes
+                    if self.batches or next(self._changes_iter, None) is None:
+                        self._checkpoint(self._batch_seq)
                     self.stop()
                 raise StopIteration
+            if self.batches:
+                return self._next_batch()
             try:
                 item = next(self._changes_iter)
                 if self.limit is not None and self.limit > 0:
                     self.limit -= 1
                 return item
-            except StopIteration as exc:
-                data = self._buffer.get()
-                if self._stop.is_set():
-                    raise StopIteration from exc
-                if isinstance(data, Exception):
-                    raise data from None
-                self._changes_iter = iter(
-                    (ChangesResultItem.from_dict(item) for item in data)
-                )
-                self._buffer.task_done()
+            except StopIteration:
+                # The consumer has processed every change of the batch
+                self._checkpoint(self._batch_seq)
+                results = self._get()['results']
+                if self.raw:
+                    self._changes_iter = iter(results)
+                else:
+                    self._changes_iter = iter(
+                        (ChangesResultItem.from_dict(item) for item in results)
+                    )
+
+    def _next_batch(self):
+        while True:
+            # The consumer has processed the previous batch
+            self._checkpoint(self._batch_seq)
+            result = self._get()
+            results = result['results']
+            # Skip the empty batches, for example of a longpoll timeout
+            if not results:
+                self._batch_seq = result.get('last_seq')
+                continue
+            if self.limit is not None:
+                if len(results) > self.limit:
+                    # Truncate the batch at the limit, with the sequence of its last change
+                    truncated = len(results) - self.limit
+                    results = results[:self.limit]
+                    result = {
+                        **result,
+                        'results': results,
+                        'last_seq': results[-1]['seq'],
+                        'pending': result.get('pending', 0) + truncated,
+                    }
+                self.limit -= len(results)
+            self._batch_seq = result.get('last_seq')
+            return result if self.raw else ChangesResult.from_dict(result)
+
+    def _get(self) -> Dict:
+        # Wait for the next result from the request thread
+        data = self._buffer.get()
+        if self._stop.is_set():
+            raise StopIteration
+        if isinstance(data, Exception):
+            # Save the processed changes before the iteration ends
+            self._checkpoint(flush=True)
+            raise data from None
+        self._batch_seq = data.get('last_seq')
+        return data
+
+    def _checkpoint(self, seq: Optional[str] = None, flush: bool = False) -> None:
+        # Record a processed sequence and save it when the interval has passed
+        if self._checkpoint_saver is not None:
+            self._checkpoint_saver.checkpoint(seq, flush)
 
     def _request_callback(self):
         while True:
             try:
                 if not self._has_next or self._stop.is_set():
                     raise StopIteration
-                result = self.changes_caller(since=self.since).get_result()
+                if self._batch_sizer is None:
+                    result = self.changes_caller(since=self.since).get_result()
+                else:
+                    limit = self._batch_sizer.batch_size
+                    start = time.monotonic()
+                    response = self.changes_caller(since=self.since, limit=limit)
+                    result = response.get_result()
+                    batch_size = self._batch_sizer.update(
+                        result['results'], _content_length(response), time.monotonic() - start, limit
+                    )
+                    if batch_size != limit:
+                        self.logger.debug(f'Adjusted changes limit to {batch_size}')
                 self.since = result.get('last_seq')
                 self._pending = result.get('pending')
                 self._retry = 0
@@ -177,39 +403,50 @@ class _ChangesFollowerIterator:
                     self._success_timestamp = datetime.now(timezone.utc)
                 if self.mode == _Mode.FINITE and self._pending == 0:
                     self._has_next = False
-                results = result['results']
-                self.logger.debug(f'_request_callback results {results}')
-                self._buffer.join()
-                if self._stop.is_set():
+                self.logger.debug(f'_request_callback results {len(result["results"])}')
+                if not self._put(self._deduplicate(result)):
                     raise StopIteration
-                self._buffer.put(results)
             except StopIteration as e:
                 self.logger.debug('Iterator stopped.')
-                self._buffer.join()
-                self._buffer.put(e)
+                self._put(e)
                 break
             except Exception as e:
-                self.logger.debug(f'Exception getting changes {e}')
-                if (
-                    self._transient_suppression == _TransientErrorSuppression.NEVER
-                    or (
-                        self._transient_suppression
-                        == _TransientErrorSuppression.TIMER
-                        and self._success_timestamp + self.error_tolerance
-                        < datetime.now(timezone.utc)
-                    )
-                ):
-                    self.logger.debug('Error tolerance deadline exceeded.')
-                    self._buffer.join()
-                    self._buffer.put(e)
-                    break
-                if type(e) is ApiException and e.status_code in [400, 401, 403, 404]:
-                    self.logger.debug('Terminal error.')
-                    self._buffer.join()
-                    self._buffer.put(e)
+                if self._error(e):
                     break
                 self.retry_delay()
 
+    def _error(self, e: Exception) -> bool:
+        # Return True and pass the error to the consumer if it is not suppressed
+        self.logger.debug(f'Exception getting changes {e}')
+        if (
+            self._transient_suppression == _TransientErrorSuppression.NEVER
+            or (
+                self._transient_suppression
+                == _TransientErrorSuppression.TIMER
+                and self._success_timestamp + self.error_tolerance
+                < datetime.now(timezone.utc)
+            )
+        ):
+            self.logger.debug('Error tolerance deadline exceeded.')
+            self._put(e)
+            return True
+        if type(e) is ApiException and e.status_code in [400, 401, 403, 404]:
+            self.logger.debug('Terminal error.')
+            self._put(e)
+            return True
+        return False
+
+    def _deduplicate(self, result: Dict) -> Dict:
+        # Drop the changes already passed to the consumer, but keep the
+        # batch so its sequence is still checkpointed
+        if self._dedup_window is not None:
+            result['results'] = self._dedup_window.filter(result['results'])
+        return result
+
+    def _put(self, item) -> bool:
+        # Waits for space in the buffer, but gives up if the iterator was stopped
+        return _put_unless_stopped(self._buffer, item, self._stop, _POLL_INTERVAL)
+
     def retry_delay(self):
         """
         Method retry_delay implements full jitter delay algorithm.
@@ -231,6 +468,75 @@ class _ChangesFollowerIterator:
         self._retry += 1
 
 
+class _ContinuousChangesFollowerIterator(_ChangesFollowerIterator):
+    """
+    The iterator of a ChangesFollower that listens with a single
+    "continuous" changes feed response.
+
+    The rows of the response are decoded as they arrive and passed to the
+    consumer one at a time. When the response ends or fails the feed is
+    requested again from the "seq" of the last row, with the same error
+    suppression and retry delays as the longpoll feed. A stop takes effect
+    at the next row or heartbeat of the response.
+
+    Args:
+        changes_caller: A partial function that requests the continuous
+        changes feed as a stream for a given "since" parameter.
+        loads: The function to decode each row.
+        The other arguments are the same as for _ChangesFollowerIterator.
+    """
+
+    def __init__(self, changes_caller, loads: Callable[[bytes], Any], *args, **kwargs) -> None:
+        super().__init__(changes_caller, *args, **kwargs)
+        self.loads = loads
+
+    def _request_callback(self):
+        while True:
+            try:
+                if self._stop.is_set():
+                    raise StopIteration
+                response = self.changes_caller(since=self.since).get_result()
+                try:
+                    rows = self._read_rows(response)
+                finally:
+                    response.close()
+                if not rows:
+                    # Delay requesting again a response that ended without changes
+                    self.retry_delay()
+            except StopIteration as e:
+                self.logger.debug('Iterator stopped.')
+                self._put(e)
+                break
+            except Exception as e:
+                if self._error(e):
+                    break
+                self.retry_delay()
+
+    def _read_rows(self, response) -> int:
+        # Pass the rows of the response to the consumer and return their number
+        rows = 0
+        for line in response.iter_lines():
+            if self._stop.is_set():
+                raise StopIteration
+            if self._transient_suppression == _TransientErrorSuppression.TIMER:
+                self._success_timestamp = datetime.now(timezone.utc)
+            if not line:
+                # A heartbeat
+                continue
+            row = self.loads(line)
+            if 'id' not in row:
+                # The last row of a response that ended, for example at the limit
+                self.since = row.get('last_seq', self.since)
+                break
+            rows += 1
+            self._retry = 0
+            if row.get('seq') is not None:
+                self.since = row['seq']
+            if not self._put(self._deduplicate({'results': [row], 'last_seq': row.get('seq')})):
+                raise StopIteration
+        return rows
+
+
 class ChangesFollower:
     """
     ChangesFollower is a helper for using the changes feed.
@@ -242,6 +548,8 @@ class ChangesFollower:
         and then continuing to listen indefinitely for further new changes.
 
     The starting sequence ID can be changed for either mode by using "since".
+    With a checkpoint_store the ChangesFollower resumes from the stored
+    sequence of the processed changes instead.
 
     By default when using:
         start_one_off() the feed will start from the beginning.
@@ -249,6 +557,10 @@ class ChangesFollower:
 
     In either mode the iterator can be terminated early by calling stop().
 
+    To process the changes in bulk use start_batches() or
+    start_one_off_batches() instead, which return each batch of changes
+    received from the service as a ChangesResult.
+
     By default ChangesFollower will suppress transient errors indefinitely
     and endeavour to run to completion or listen forever. For applications
     where that behaviour is not desirable an alternate options is
@@ -279,19 +591,97 @@ class ChangesFollower:
     It should also be noted that the "limit" parameter will truncate the
     iterator at the given number of changes in either operating mode.
 
+    By default the number of changes requested in each batch is set at
+    start, from the average document size of the database when using
+    "include_docs". With adaptive_batch_size the number of changes is
+    adjusted for each request from the size and duration of the previous
+    responses, to keep the batches near 5 MiB and 10 seconds when the
+    document sizes vary.
+
+    With dedup_window the ChangesFollower remembers the document ID and
+    revisions of the latest dedup_window changes it returned and drops
+    changes that repeat them, for example after a retry or when resuming
+    from an earlier sequence. The number of dropped changes is available
+    from "suppressed_duplicates". Changes are only dropped within one
+    ChangesFollower.
+
+    With continuous, start() reads a single "continuous" changes feed
+    response as a stream and returns each change as soon as it is
+    received, instead of requesting a longpoll batch at a time. The feed is
+    requested again from the sequence of the last change if the response
+    ends or fails. The other modes are not affected.
+
     The ChangesFollower requires the Cloudant client to have HTTP call and
     read timeouts of at least 1 minute. The default client configuration has
     sufficiently long timeouts.
 
     :param CloudantV1 service: A client for the Cloudant service.
     :param int error_tolerance: A duration to suppress transient errors for set in milliseconds.
+    :param bool raw: True to return the change items as the decoded dicts
+           instead of ChangesResultItem instances.
+    :param int prefetch_batches: The number of batches to request ahead of
+           the consumer, so requests overlap with processing the changes.
+           Up to prefetch_batches batches wait for the consumer and the request
+           thread holds one more batch while it waits for space, so at most
+           prefetch_batches + 2 batches are in memory including the batch the
+           consumer is processing. The default of 1 is the read-ahead of
+           earlier versions.
+    :param CheckpointStore checkpoint_store: (optional) A store for the sequence of the
+           processed changes. The ChangesFollower starts from the stored sequence,
+           in place of "since", and saves the "last_seq" of each batch after the
+           consumer has processed every change of the batch.
+    :param int checkpoint_interval: The minimum duration between saves of the
+           sequence set in milliseconds. The last processed sequence is also
+           saved when the iteration ends or stop() is called.
+    :param bool adaptive_batch_size: True to adjust the number of changes
+           requested in each batch from the previous responses.
+    :param int min_batch_size: The minimum number of changes requested in
+           each batch with adaptive_batch_size.
+    :param int max_batch_size: The maximum number of changes requested in
+           each batch with adaptive_batch_size.
+    :param bool continuous: True for start() to stream the changes with a
+           "continuous" changes feed.
+    :param int dedup_window: The number of the latest changes to remember to drop
+           repeated changes. The default of 0 returns every change.
     :return: None
     """
 
     def __init__(
-        self, service: CloudantV1, *, error_tolerance: int = _FOREVER, **kwargs
+        self,
+        service: CloudantV1,
+        *,
+        error_tolerance: int = _FOREVER,
+        raw: bool = False,
+        prefetch_batches: int = _PREFETCH_BATCHES,
+        checkpoint_store: Optional[CheckpointStore] = None,
+        checkpoint_interval: int = _CHECKPOINT_INTERVAL,
+        adaptive_batch_size: bool = False,
+        min_batch_size: int = 1,
+        max_batch_size: int = _BATCH_SIZE,
+        continuous: bool = False,
+        dedup_window: int = 0,
+        **kwargs
     ) -> None:
+        if prefetch_batches < 1:
+            raise ValueError(f'The provided prefetch_batches {prefetch_batches} must be at least 1.')
+        if checkpoint_interval < 0:
+            raise ValueError(f'The provided checkpoint_interval {checkpoint_interval} must be at least 0.')
+        if dedup_window < 0:
+            raise ValueError(f'The provided dedup_window {dedup_window} must be at least 0.')
+        if min_batch_size < 1:
+            raise ValueError(f'The provided min_batch_size {min_batch_size} must be at least 1.')
+        if max_batch_size < min_batch_size:
+            raise ValueError(f'The provided max_batch_size {max_batch_size} must be at least {min_batch_size}.')
         self.options = kwargs
+        self.raw = raw
+        self.prefetch_batches = prefetch_batches
+        self.checkpoint_store = checkpoint_store
+        self.checkpoint_interval = checkpoint_interval
+        self.adaptive_batch_size = adaptive_batch_size
+        self.min_batch_size = min_batch_size
+        self.max_batch_size = max_batch_size
+        self.continuous = continuous
+        self.dedup_window = dedup_window
         self.limit = self.options.get('limit')
         self._set_defaults(_Mode.FINITE)
         self.service = service
@@ -322,6 +712,13 @@ class ChangesFollower:
                 )
             )
 
+    @property
+    def suppressed_duplicates(self) -> int:
+        """The number of repeated changes dropped with dedup_window."""
+        if self._iter is None or self._iter._dedup_window is None:
+            return 0
+        return self._iter._dedup_window.suppressed
+
     @property
     def error_tolerance(self) -> int:
         return self._error_tolerance
@@ -358,11 +755,16 @@ class ChangesFollower:
             raise ValueError(error_fmt.format(invalid_opts_list, class_name))
         self._options = value
 
-    def _set_defaults(self, mode: _Mode, limit: int = None):
+    def _set_defaults(self, mode: _Mode, limit: int = None, continuous: bool = False):
         if mode == _Mode.FINITE:
             defaults = {
                 'feed': PostChangesEnums.Feed.NORMAL
             }
+        elif continuous:
+            defaults = {
+                'feed': PostChangesEnums.Feed.CONTINUOUS,
+                'heartbeat': _HEARTBEAT,
+            }
         elif mode == _Mode.LISTEN:
             defaults = {
                 'feed': PostChangesEnums.Feed.LONGPOLL,
@@ -423,6 +825,42 @@ class ChangesFollower:
         """
         return self._run(_Mode.FINITE)
 
+    def start_batches(self) -> Iterator[ChangesResult]:
+        """
+        Return all available changes in batches and keep listening for new
+        changes until reaching an end condition.
+
+        The end conditions are the same as for start().
+
+        Each batch is a ChangesResult of the changes received in a response
+        with the "last_seq" and "pending" of the response. Empty batches are
+        skipped. If the limit truncates a batch its "last_seq" is the "seq"
+        of its last change.
+
+        Returns an iterator of ChangesResult per batch of changes.
+
+        Throws the same exceptions as start().
+        """
+        return self._run(_Mode.LISTEN, batches=True)
+
+    def start_one_off_batches(self) -> Iterator[ChangesResult]:
+        """
+        Return all available changes in batches until there are no further
+        changes pending or reaching an end condition.
+
+        The end conditions are the same as for start_one_off().
+
+        Each batch is a ChangesResult of the changes received in a response
+        with the "last_seq" and "pending" of the response. Empty batches are
+        skipped. If the limit truncates a batch its "last_seq" is the "seq"
+        of its last change.
+
+        Returns an iterator of ChangesResult per batch of changes.
+
+        Throws the same exceptions as start_one_off().
+        """
+        return self._run(_Mode.FINITE, batches=True)
+
     def stop(self) -> None:
         """
         Stop this ChangesFollower.
@@ -432,7 +870,7 @@ class ChangesFollower:
         """
         self._iter.stop()
 
-    def _run(self, mode: _Mode):
+    def _run(self, mode: _Mode, batches: bool = False):
         if self._iter is not None:
             raise RuntimeError('Cannot start a feed that has already started.')
 
@@ -445,21 +883,56 @@ class ChangesFollower:
             sizes = resp.get('sizes', {})
             external_size = sizes.get('external', 0)
             if external_size > 0 and docs > 0:
-                batch_size = max(int(5 * 1024 * 1024 / (external_size / docs + 500)), 1)
+                batch_size = max(int(_BATCH_BYTES / (external_size / docs + 500)), 1)
 
         if self.limit is not None:
             batch_size = self.limit if self.limit < batch_size else batch_size
 
-        self._set_defaults(mode, batch_size)
-        changes_caller = functools.partial(
-            self.service.post_changes, **self.options
-        )
-        self._iter = _ChangesFollowerIterator(
-            changes_caller, mode, self.error_tolerance
+        since = self.options.get('since')
+        checkpoint_saver = None
+        if self.checkpoint_store is not None:
+            checkpoint_saver = _CheckpointSaver(self.checkpoint_store, self.checkpoint_interval, self.logger)
+            checkpoint = checkpoint_saver.load()
+            if checkpoint is not None:
+                self.logger.debug(f'Resuming from checkpoint {checkpoint}')
+                since = checkpoint
+        continuous = self.continuous and mode is _Mode.LISTEN and not batches
+        if continuous:
+            # The response of a continuous feed is not split into batches
+            batch_size = self.limit
+        batch_sizer = None
+        if self.adaptive_batch_size and not continuous:
+            max_batch_size = self.max_batch_size
+            if self.limit is not None:
+                max_batch_size = max(min(max_batch_size, self.limit), 1)
+            batch_sizer = _BatchSizer(
+                batch_size, min(self.min_batch_size, max_batch_size), max_batch_size, self.service._dumps_json
+            )
+            batch_size = batch_sizer.batch_size
+        self._set_defaults(mode, batch_size, continuous)
+        if continuous:
+            changes_caller = functools.partial(
+                self.service.post_changes_as_stream, **self.options
+            )
+            iterator = functools.partial(_ContinuousChangesFollowerIterator, changes_caller, self.service._loads_json)
+        else:
+            changes_caller = functools.partial(
+                self.service.post_changes, **self.options
+            )
+            iterator = functools.partial(_ChangesFollowerIterator, changes_caller)
+        self._iter = iterator(
+            mode,
+            self.error_tolerance,
+            self.raw,
+            self.prefetch_batches,
+            batches,
+            checkpoint_saver,
+            batch_sizer,
+            _DeduplicationWindow(self.dedup_window) if self.dedup_window > 0 else None,
         )
         if self.limit is not None:
             self._iter.limit = self.limit
-        if self.options.get('since') is not None:
-            self._iter.since = self.options.get('since')
+        if since is not None:
+            self._iter.since = since
         self._iter._start()
         return self._iter
@@ -0,0 +1,213 @@
+# coding: utf-8
+
+# © Copyright IBM Corporation 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Stores for the changes feed sequence processed by a ChangesFollower.
+"""
+import logging
+import os
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from threading import Lock
+from typing import Optional
+
+from ibm_cloud_sdk_core import ApiException
+
+from ibmcloudant.cloudant_v1 import CloudantV1
+
+
+class CheckpointStore(ABC):
+    """
+    Base class for the stores of the last processed sequence of a
+    changes feed.
+
+    Subclasses implement load and save.
+    """
+
+    @abstractmethod
+    def load(self) -> Optional[str]:
+        """
+        Return the stored sequence, or None if no sequence was stored.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def save(self, seq: str) -> None:
+        """
+        Store a sequence, replacing the previously stored sequence.
+        """
+        raise NotImplementedError()
+
+
+class MemoryCheckpointStore(CheckpointStore):
+    """
+    Stores the sequence in memory, for example to resume a new
+    ChangesFollower in the same process.
+
+    :param str seq: (optional) An initial sequence.
+    :return: None
+    """
+
+    def __init__(self, seq: Optional[str] = None) -> None:
+        self.seq = seq
+
+    def load(self) -> Optional[str]:
+        return self.seq
+
+    def save(self, seq: str) -> None:
+        self.seq = seq
+
+
+class FileCheckpointStore(CheckpointStore):
+    """
+    Stores the sequence in a local file.
+
+    The file is replaced atomically so that an interrupted save keeps
+    the previous sequence.
+
+    :param str path: The path of the file.
+    :return: None
+    """
+
+    def __init__(self, path: str) -> None:
+        if not path:
+            raise ValueError('path must be provided')
+        self.path = path
+
+    def load(self) -> Optional[str]:
+        try:
+            with open(self.path, encoding='utf-8') as file:
+                seq = file.read().strip()
+        except FileNotFoundError:
+            return None
+        return seq or None
+
+    def save(self, seq: str) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.checkpoint-')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as file:
+                file.write(seq)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+
+class LocalDocumentCheckpointStore(CheckpointStore):
+    """
+    Stores the sequence in the "seq" property of a local document,
+    which is not replicated, using "put_local_document".
+
+    :param CloudantV1 service: A client for the Cloudant service.
+    :param str db: The name of the database of the local document.
+    :param str doc_id: The ID of the local document, without the "_local/" prefix.
+    :return: None
+    """
+
+    def __init__(self, service: CloudantV1, db: str, doc_id: str) -> None:
+        if not db:
+            raise ValueError('db must be provided')
+        if not doc_id:
+            raise ValueError('doc_id must be provided')
+        self.service = service
+        self.db = db
+        self.doc_id = doc_id
+        self._rev: Optional[str] = None
+
+    def load(self) -> Optional[str]:
+        try:
+            document = self.service.get_local_document(db=self.db, doc_id=self.doc_id).get_result()
+        except ApiException as e:
+            if e.status_code == 404:
+                self._rev = None
+                return None
+            raise
+        self._rev = document.get('_rev')
+        return document.get('seq')
+
+    def save(self, seq: str) -> None:
+        try:
+            self._put(seq)
+        except ApiException as e:
+            if e.status_code != 409:
+                raise
+            # The document was changed elsewhere, save with its latest revision
+            self.load()
+            self._put(seq)
+
+    def _put(self, seq: str) -> None:
+        document = {'seq': seq}
+        if self._rev is not None:
+            document['_rev'] = self._rev
+        result = self.service.put_local_document(db=self.db, doc_id=self.doc_id, document=document).get_result()
+        self._rev = result.get('rev')
+
+
+class _CheckpointSaver:
+    """
+    Saves the latest processed sequence of a follower to a CheckpointStore
+    at most once per interval.
+
+    An error saving the sequence is logged as a warning and the sequence is
+    saved again with a later checkpoint.
+
+    Args:
+        store: The store to save the sequence in.
+        interval: The minimum duration between saves set in milliseconds.
+        logger: The logger of the follower.
+    """
+
+    def __init__(self, store: CheckpointStore, interval: int, logger: logging.Logger) -> None:
+        self.store = store
+        self.logger = logger
+        self._interval = interval / 1000
+        self._lock = Lock()
+        self._time = time.monotonic()
+        self._processed_seq: Optional[str] = None
+        self._saved_seq: Optional[str] = None
+
+    def load(self) -> Optional[str]:
+        """
+        Return the stored sequence, which is not saved again until a later
+        sequence is processed.
+        """
+        seq = self.store.load()
+        with self._lock:
+            self._processed_seq = self._saved_seq = seq
+        return seq
+
+    def checkpoint(self, seq: Optional[str] = None, flush: bool = False) -> None:
+        """
+        Record a processed sequence and save the latest processed sequence
+        when the interval has passed, or with flush regardless of the
+        interval.
+        """
+        with self._lock:
+            if seq is not None:
+                self._processed_seq = seq
+            if self._processed_seq is None or self._processed_seq == self._saved_seq:
+                return
+            if not flush and time.monotonic() - self._time < self._interval:
+                return
+            try:
+                self.store.save(self._processed_seq)
+                self._saved_seq = self._processed_seq
+            except Exception as e:
+                self.logger.warning(f'Exception saving checkpoint {e}')
+            self._time = time.monotonic()
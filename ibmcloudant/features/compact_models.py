@@ -0,0 +1,331 @@
+# coding: utf-8
+
+# © Copyright IBM Corporation 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Feature for compact variants of the result row and item models.
+
+The compact models have the same constructor, ``from_dict`` and ``to_dict``
+as the corresponding model in :mod:`ibmcloudant.cloudant_v1`, but store their
+attributes in ``__slots__`` instead of a per-instance ``__dict__``.
+This reduces the memory used when holding many results at once.
+
+Nested row and item models are also decoded to their compact variants.
+Documents and other models are decoded to the usual model classes.
+
+The compact models are not subclasses of the usual models and
+attributes other than the model properties can not be set on them.
+"""
+
+import json
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from ..cloudant_v1 import Document
+
+
+class _Property(NamedTuple):
+    """
+    A property of a compact model.
+    """
+
+    name: str
+    # The model to decode the value with, or None for a JSON value
+    model: Optional[type] = None
+    # True for a list of values of the model
+    is_list: bool = False
+    # True to raise an error when the property is not in the JSON
+    required: bool = False
+    # True to decode a required property that is not in the JSON as None
+    nullable: bool = False
+
+
+class _CompactModel:
+    """
+    Base class of the compact models, which encode and decode the
+    properties listed in _properties in the same way as the generated
+    models.
+    """
+
+    __slots__ = ()
+    _name = ''
+    # The properties in the order of the JSON of the model
+    _properties: Tuple[_Property, ...] = ()
+
+    @classmethod
+    def from_dict(cls, _dict: Dict):
+        """Initialize a compact model from a json dictionary."""
+        args = {}
+        for prop in cls._properties:
+            value = _dict.get(prop.name)
+            if value is None:
+                if prop.nullable:
+                    args[prop.name] = None
+                elif prop.required:
+                    raise ValueError(f'Required property \'{prop.name}\' not present in {cls._name} JSON')
+                continue
+            if prop.model is not None:
+                if prop.is_list:
+                    value = [prop.model.from_dict(v) for v in value]
+                else:
+                    value = prop.model.from_dict(value)
+            args[prop.name] = value
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a compact model from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        for prop in self._properties:
+            value = getattr(self, prop.name)
+            if value is None:
+                continue
+            if prop.model is not None:
+                if prop.is_list:
+                    value = [v if isinstance(v, dict) else v.to_dict() for v in value]
+                elif not isinstance(value, dict):
+                    value = value.to_dict()
+            _dict[prop.name] = value
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this model."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: Any) -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot) for slot in self.__slots__)
+
+    def __ne__(self, other: Any) -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+def _slots(properties: Tuple[_Property, ...]) -> Tuple[str, ...]:
+    return tuple(prop.name for prop in properties)
+
+
+class CompactChange(_CompactModel):
+    """
+    Compact variant of Change.
+    """
+
+    _name = 'Change'
+    _properties = (_Property('rev', required=True),)
+    __slots__ = _slots(_properties)
+
+    def __init__(self, rev: str) -> None:
+        self.rev = rev
+
+
+class CompactChangesResultItem(_CompactModel):
+    """
+    Compact variant of ChangesResultItem.
+    """
+
+    _name = 'ChangesResultItem'
+    _properties = (
+        _Property('changes', CompactChange, is_list=True, required=True),
+        _Property('deleted'),
+        _Property('doc', Document),
+        _Property('id', required=True),
+        _Property('seq', required=True),
+    )
+    __slots__ = _slots(_properties)
+
+    def __init__(
+        self,
+        changes: list,
+        id: str,
+        seq: str,
+        *,
+        deleted: Optional[bool] = None,
+        doc: Optional[Document] = None,
+    ) -> None:
+        self.changes = changes
+        self.deleted = deleted
+        self.doc = doc
+        self.id = id
+        self.seq = seq
+
+
+class CompactDocsResultRowValue(_CompactModel):
+    """
+    Compact variant of DocsResultRowValue.
+    """
+
+    _name = 'DocsResultRowValue'
+    _properties = (
+        _Property('deleted'),
+        _Property('rev', required=True),
+    )
+    __slots__ = _slots(_properties)
+
+    def __init__(self, rev: str, *, deleted: Optional[bool] = None) -> None:
+        self.deleted = deleted
+        self.rev = rev
+
+
+class CompactDocsResultRow(_CompactModel):
+    """
+    Compact variant of DocsResultRow.
+    """
+
+    _name = 'DocsResultRow'
+    _properties = (
+        _Property('caused_by'),
+        _Property('error'),
+        _Property('reason'),
+        _Property('ref'),
+        _Property('doc', Document),
+        _Property('id'),
+        _Property('key', required=True),
+        _Property('value', CompactDocsResultRowValue),
+    )
+    __slots__ = _slots(_properties)
+
+    def __init__(
+        self,
+        key: str,
+        *,
+        caused_by: Optional[str] = None,
+        error: Optional[str] = None,
+        reason: Optional[str] = None,
+        ref: Optional[int] = None,
+        doc: Optional[Document] = None,
+        id: Optional[str] = None,
+        value: Optional[CompactDocsResultRowValue] = None,
+    ) -> None:
+        self.caused_by = caused_by
+        self.error = error
+        self.reason = reason
+        self.ref = ref
+        self.doc = doc
+        self.id = id
+        self.key = key
+        self.value = value
+
+
+class CompactDocumentResult(_CompactModel):
+    """
+    Compact variant of DocumentResult.
+    """
+
+    _name = 'DocumentResult'
+    _properties = (
+        _Property('id', required=True),
+        _Property('rev'),
+        _Property('ok'),
+        _Property('caused_by'),
+        _Property('error'),
+        _Property('reason'),
+        _Property('ref'),
+    )
+    __slots__ = _slots(_properties)
+
+    def __init__(
+        self,
+        id: str,
+        *,
+        rev: Optional[str] = None,
+        ok: Optional[bool] = None,
+        caused_by: Optional[str] = None,
+        error: Optional[str] = None,
+        reason: Optional[str] = None,
+        ref: Optional[int] = None,
+    ) -> None:
+        self.id = id
+        self.rev = rev
+        self.ok = ok
+        self.caused_by = caused_by
+        self.error = error
+        self.reason = reason
+        self.ref = ref
+
+
+class CompactSearchResultRow(_CompactModel):
+    """
+    Compact variant of SearchResultRow.
+    """
+
+    _name = 'SearchResultRow'
+    _properties = (
+        _Property('doc', Document),
+        _Property('fields', required=True),
+        _Property('highlights'),
+        _Property('id', required=True),
+    )
+    __slots__ = _slots(_properties)
+
+    def __init__(
+        self,
+        fields: dict,
+        id: str,
+        *,
+        doc: Optional[Document] = None,
+        highlights: Optional[dict] = None,
+    ) -> None:
+        self.doc = doc
+        self.fields = fields
+        self.highlights = highlights
+        self.id = id
+
+
+class CompactViewResultRow(_CompactModel):
+    """
+    Compact variant of ViewResultRow.
+    """
+
+    _name = 'ViewResultRow'
+    _properties = (
+        _Property('caused_by'),
+        _Property('error'),
+        _Property('reason'),
+        _Property('ref'),
+        _Property('doc', Document),
+        _Property('id'),
+        _Property('key', nullable=True),
+        _Property('value', nullable=True),
+    )
+    __slots__ = _slots(_properties)
+
+    def __init__(
+        self,
+        key: object,
+        value: object,
+        *,
+        caused_by: Optional[str] = None,
+        error: Optional[str] = None,
+        reason: Optional[str] = None,
+        ref: Optional[int] = None,
+        doc: Optional[Document] = None,
+        id: Optional[str] = None,
+    ) -> None:
+        self.caused_by = caused_by
+        self.error = error
+        self.reason = reason
+        self.ref = ref
+        self.doc = doc
+        self.id = id
+        self.key = key
+        self.value = value
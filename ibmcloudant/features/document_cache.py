@@ -0,0 +1,223 @@
+# coding: utf-8
+
+# © Copyright IBM Corporation 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+A client-side cache of documents revalidated with conditional requests.
+"""
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Hashable, Mapping, Optional, Set, Tuple
+
+_MAX_ENTRIES = 1000
+# 16 MiB
+_MAX_BYTES = 16 * 1024 * 1024
+
+
+class _DocumentCacheEntry:
+    """
+    The response body of a cached document and its ETag.
+    """
+
+    __slots__ = ('etag', 'body', 'headers', 'stored')
+
+    def __init__(self, etag: str, body: bytes, headers: Mapping[str, str]) -> None:
+        self.etag = etag
+        self.body = body
+        self.headers = headers
+        self.stored = time.monotonic()
+
+
+class DocumentCache:
+    """
+    DocumentCache is a client-side cache of "get_document" results.
+
+    Set the cache on a client with set_document_cache. The client then
+    stores the body and ETag of each document it gets. Repeat gets of a
+    cached document are sent with an "If-None-Match" header and a
+    "304 Not Modified" response is served from the cache.
+
+    With a ttl, a document that was stored or revalidated less than ttl
+    seconds ago is served from the cache without a request. Use this for
+    documents that rarely change, for example configuration documents,
+    when reading a document up to ttl seconds old is acceptable.
+
+    Successful document writes from the client, for example
+    "put_document", "delete_document" and "post_bulk_docs", remove the
+    written documents from the cache. Writes from other clients are only
+    seen when the document is revalidated.
+
+    The least recently used documents are removed when there are more than
+    max_entries documents or max_bytes bytes of document bodies.
+
+    Gets with an "if_none_match" argument or as a stream are not cached.
+
+    While a DocumentCacheFollower follows the changes of a database the
+    documents of that database are served from the cache without
+    revalidation and removed when they change.
+
+    :param int max_entries: The maximum number of cached documents.
+    :param int max_bytes: The maximum size in bytes of the cached document bodies.
+    :param float ttl: (optional) The duration in seconds to serve a cached document
+           without revalidating it. The default of None revalidates every get.
+    :return: None
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = _MAX_ENTRIES,
+        max_bytes: int = _MAX_BYTES,
+        ttl: Optional[float] = None,
+    ) -> None:
+        for name, value, minimum in (
+            ('max_entries', max_entries, 1),
+            ('max_bytes', max_bytes, 1),
+            ('ttl', ttl, 0),
+        ):
+            if value is not None and value < minimum:
+                raise ValueError(f'The provided {name} {value} must be at least {minimum}.')
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = Lock()
+        self._entries: 'OrderedDict[Tuple[str, str, Hashable], _DocumentCacheEntry]' = OrderedDict()
+        # The keys of each document, one for each combination of get options
+        self._keys_by_document: Dict[Tuple[str, str], Set[Tuple[str, str, Hashable]]] = {}
+        self._bytes = 0
+        # The DocumentCacheFollower of each followed database
+        self._followers: Dict[str, Any] = {}
+        # Incremented by each invalidation so a get that was in flight
+        # during a write does not store the document it read before the write
+        self._generation = 0
+        self._hits = 0
+        self._revalidations = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def invalidate(self, db: str, doc_id: Optional[str] = None) -> None:
+        """
+        Remove a document, or all the documents of a database
+        when doc_id is None, from the cache.
+
+        :param str db: The name of the database.
+        :param str doc_id: (optional) The document ID.
+        """
+        with self._lock:
+            self._invalidate(db, doc_id)
+
+    def clear(self) -> None:
+        """
+        Remove all the documents from the cache.
+        """
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._keys_by_document.clear()
+            self._bytes = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Return the counts of the cache.
+
+        The counts are:
+            entries: the number of cached documents.
+            bytes: the size in bytes of the cached document bodies.
+            hits: the number of gets served from the cache without a request.
+            revalidations: the number of gets served from the cache after a
+              "304 Not Modified" response.
+            misses: the number of gets that received the document.
+            evictions: the number of least recently used documents removed.
+
+        :return: The counts of the cache.
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'hits': self._hits,
+                'revalidations': self._revalidations,
+                'misses': self._misses,
+                'evictions': self._evictions,
+            }
+
+    def _lookup(self, key: Tuple[str, str, Hashable]) -> Tuple[Optional[_DocumentCacheEntry], bool, int]:
+        # Return the entry, whether it can be served without revalidation,
+        # and the generation to store the response of the get with
+        with self._lock:
+            entry = self._entries.get(key)
+            fresh = False
+            if entry is not None:
+                self._entries.move_to_end(key)
+                fresh = key[0] in self._followers or (
+                    self.ttl is not None and time.monotonic() - entry.stored < self.ttl
+                )
+                if fresh:
+                    self._hits += 1
+            return entry, fresh, self._generation
+
+    def _revalidated(self, key: Tuple[str, str, Hashable], entry: _DocumentCacheEntry) -> None:
+        with self._lock:
+            self._revalidations += 1
+            entry.stored = time.monotonic()
+
+    def _store(self, key: Tuple[str, str, Hashable], entry: _DocumentCacheEntry, generation: int) -> None:
+        with self._lock:
+            self._misses += 1
+            if generation != self._generation or len(entry.body) > self.max_bytes:
+                if key in self._entries:
+                    self._remove(key)
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._keys_by_document.setdefault(key[:2], set()).add(key)
+            self._bytes += len(entry.body)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def _follow(self, db: str, follower: Any) -> None:
+        with self._lock:
+            if db in self._followers:
+                raise ValueError(f'The changes of database {db} are already followed.')
+            self._followers[db] = follower
+            # The cached documents may have changed before following
+            self._invalidate(db)
+
+    def _unfollow(self, db: str, follower: Any) -> None:
+        with self._lock:
+            if self._followers.get(db) is follower:
+                del self._followers[db]
+
+    def _invalidate(self, db: str, doc_id: Optional[str] = None) -> None:
+        self._generation += 1
+        if doc_id is None:
+            keys = [key for key in self._entries if key[0] == db]
+        else:
+            keys = list(self._keys_by_document.get((db, doc_id), ()))
+        for key in keys:
+            self._remove(key)
+
+    def _remove(self, key: Tuple[str, str, Hashable]) -> None:
+        self._bytes -= len(self._entries.pop(key).body)
+        document_keys = self._keys_by_document[key[:2]]
+        document_keys.discard(key)
+        if not document_keys:
+            del self._keys_by_document[key[:2]]
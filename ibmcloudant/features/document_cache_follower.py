@@ -0,0 +1,145 @@
+# coding: utf-8
+
+# © Copyright IBM Corporation 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Feature for keeping a document cache coherent with the changes feed.
+"""
+import logging
+from threading import Thread
+from typing import Optional
+
+from ibmcloudant.cloudant_v1 import CloudantV1
+from .changes_follower import ChangesFollower
+from .document_cache import DocumentCache
+
+# milliseconds to suppress transient errors before the documents are revalidated
+_ERROR_TOLERANCE = 60000
+
+
+class DocumentCacheFollower:
+    """
+    DocumentCacheFollower removes the documents of a database from a
+    DocumentCache as they appear in the changes feed of the database.
+
+    While the DocumentCacheFollower is running the cached documents of the
+    database are served without revalidation, so a document changed by
+    another client is served until its change is received from the feed.
+    The documents cached before start() are removed from the cache.
+
+    A ChangesFollower listens to the changes from the update sequence of the
+    database when start() is called. The sequence of the last processed
+    change is available from "since".
+
+    If the feed ends, for example because of a terminal error or transient
+    errors for longer than error_tolerance, the DocumentCacheFollower stops
+    and the cached documents are revalidated again. The exception is
+    available from "error".
+
+    Call stop(), or use the DocumentCacheFollower as a context manager, to
+    stop following the changes.
+
+    :param DocumentCache cache: The cache to remove changed documents from.
+    :param CloudantV1 service: A client for the Cloudant service.
+    :param str db: The name of the database to follow.
+    :param int error_tolerance: A duration to suppress transient errors for set in milliseconds.
+    :return: None
+    """
+
+    def __init__(
+        self,
+        cache: DocumentCache,
+        service: CloudantV1,
+        db: str,
+        *,
+        error_tolerance: int = _ERROR_TOLERANCE,
+    ) -> None:
+        if not db:
+            raise ValueError('db must be provided')
+        self.cache = cache
+        self.service = service
+        self.db = db
+        self.error_tolerance = error_tolerance
+        self.error: Optional[Exception] = None
+        self.logger = logging.getLogger(__name__)
+        self._since: Optional[str] = None
+        self._changes_follower: Optional[ChangesFollower] = None
+        self._thread: Optional[Thread] = None
+
+    @property
+    def since(self) -> Optional[str]:
+        """The sequence of the last processed change."""
+        return self._since
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """
+        Start following the changes of the database.
+
+        Throws RuntimeError if the DocumentCacheFollower was already started
+        or ValueError if the database is already followed for the cache.
+        """
+        if self._thread is not None:
+            raise RuntimeError('Cannot start a follower that has already started.')
+        # Start from the current sequence so no change after the
+        # cached documents are removed is missed
+        self._since = self.service.get_database_information(db=self.db).get_result()['update_seq']
+        self._changes_follower = ChangesFollower(
+            self.service,
+            db=self.db,
+            since=self._since,
+            error_tolerance=self.error_tolerance,
+            raw=True,
+        )
+        changes = self._changes_follower.start()
+        try:
+            self.cache._follow(self.db, self)
+        except ValueError:
+            self._changes_follower.stop()
+            raise
+        self._thread = Thread(target=self._follow_callback, args=(changes,), daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop following the changes of the database.
+
+        Later gets revalidate the cached documents of the database.
+        """
+        if self._thread is None:
+            return
+        self.cache._unfollow(self.db, self)
+        self._changes_follower.stop()
+        self._thread.join()
+
+    def is_running(self) -> bool:
+        """Return True while the changes are followed."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _follow_callback(self, changes) -> None:
+        try:
+            for change in changes:
+                self.cache.invalidate(self.db, change['id'])
+                self._since = change['seq']
+        except Exception as e:
+            self.logger.debug(f'Exception following changes {e}')
+            self.error = e
+        finally:
+            self.cache._unfollow(self.db, self)
@@ -0,0 +1,193 @@
+# coding: utf-8
+
+# © Copyright IBM Corporation 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Feature for incrementally decoding the items of a streamed JSON response.
+
+Use :class:`JsonStreamItems` with the result of an ``_as_stream`` operation
+to decode the elements of one array of the top level JSON object, for example
+the ``rows`` of a view, one at a time without reading the whole response.
+"""
+
+import json
+import re
+from collections.abc import Iterable, Iterator
+from typing import Any, BinaryIO, Callable, Union
+
+_CHUNK_SIZE = 64 * 1024
+_WHITESPACE = b' \t\r\n'
+# Structural characters that change the nesting depth or start a string
+_STRUCTURE = re.compile(rb'["\[\]{}]')
+# The remainder of a string after the opening quote, including the closing quote
+_STRING_REMAINDER = re.compile(rb'(?:[^"\\]|\\.)*"', re.DOTALL)
+# The end of a number or literal value
+_SCALAR_END = re.compile(rb'[,\]}\s]')
+
+
+class JsonStreamItems(Iterable[Any]):
+  """
+  Iterable of the elements of an array field of a streamed JSON object.
+
+  Only one element at a time is decoded so the memory used is bounded
+  by the size of the largest element rather than the whole response.
+  The other top level fields of the object (for example ``total_rows``,
+  ``bookmark`` or ``last_seq``) are decoded into :attr:`fields` as they
+  are read, so fields after the array are available after the iteration.
+
+  The iterable can be traversed only once and closes the stream
+  when the iteration completes or is closed.
+
+  stream: a requests ``Response`` (for example the result of an ``_as_stream``
+  operation), a binary file-like object or an iterable of bytes chunks
+  field: str - the name of the array field to iterate
+  loads: the function to decode the bytes of each element and field, by default json.loads
+  """
+
+  def __init__(self, stream: Union[BinaryIO, Iterable[bytes]], field: str, chunk_size: int = _CHUNK_SIZE,
+               loads: Callable[[bytes], Any] = json.loads):
+    self._stream = stream
+    self._field: str = field
+    self._loads: Callable[[bytes], Any] = loads
+    if hasattr(stream, 'iter_content'):
+      # A requests Response decodes any content-encoding of the body
+      self._chunks: Iterator[bytes] = iter(stream.iter_content(chunk_size))
+    elif hasattr(stream, 'read'):
+      self._chunks: Iterator[bytes] = iter(lambda: stream.read(chunk_size), b'')
+    else:
+      self._chunks: Iterator[bytes] = iter(stream)
+    self._buffer: bytearray = bytearray()
+    self._pos: int = 0
+    self._chunk_size: int = chunk_size
+    self.fields: dict = {}
+
+  def __iter__(self) -> Iterator[Any]:
+    try:
+      yield from self._items()
+    finally:
+      self.close()
+
+  def close(self) -> None:
+    """
+    Close the underlying stream.
+    """
+
+    close = getattr(self._stream, 'close', None)
+    if close is not None:
+      close()
+
+  def _items(self) -> Iterator[Any]:
+    self._expect(b'{')
+    if self._next_token() == b'}':
+      self._pos += 1
+      return
+    while True:
+      name = json.loads(self._read_string())
+      self._expect(b':')
+      if name == self._field and self._next_token() == b'[':
+        self._pos += 1
+        yield from self._array_items()
+      else:
+        self.fields[name] = self._loads(self._read_value())
+      token = self._next_token()
+      self._pos += 1
+      if token == b'}':
+        return
+      if token != b',':
+        raise self._error(token)
+
+  def _array_items(self) -> Iterator[Any]:
+    if self._next_token() == b']':
+      self._pos += 1
+      return
+    while True:
+      yield self._loads(self._read_value())
+      # Drop the decoded bytes to keep the buffer bounded
+      if self._pos >= self._chunk_size:
+        del self._buffer[:self._pos]
+        self._pos = 0
+      token = self._next_token()
+      self._pos += 1
+      if token == b']':
+        return
+      if token != b',':
+        raise self._error(token)
+
+  def _fill(self) -> None:
+    try:
+      self._buffer += next(self._chunks)
+    except StopIteration:
+      raise ValueError('Unexpected end of the JSON stream.') from None
+
+  def _next_token(self) -> bytes:
+    # Skip whitespace and return the next character without consuming it
+    while True:
+      while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+        self._pos += 1
+      if self._pos < len(self._buffer):
+        return self._buffer[self._pos:self._pos + 1]
+      self._fill()
+
+  def _expect(self, expected: bytes) -> None:
+    token = self._next_token()
+    if token != expected:
+      raise self._error(token)
+    self._pos += 1
+
+  def _error(self, token: bytes) -> ValueError:
+    return ValueError(f'Unexpected {token.decode("utf-8", "replace")!r} in the JSON stream.')
+
+  def _read_string(self) -> bytes:
+    self._expect(b'"')
+    start = self._pos - 1
+    while (match := _STRING_REMAINDER.match(self._buffer, self._pos)) is None:
+      self._fill()
+    self._pos = match.end()
+    return bytes(self._buffer[start:self._pos])
+
+  def _read_value(self) -> bytes:
+    token = self._next_token()
+    start = self._pos
+    if token == b'"':
+      return self._read_string()
+    if token not in (b'{', b'['):
+      while (match := _SCALAR_END.search(self._buffer, self._pos)) is None:
+        self._fill()
+      self._pos = match.start()
+      return bytes(self._buffer[start:self._pos])
+    depth = 0
+    while True:
+      match = _STRUCTURE.search(self._buffer, self._pos)
+      if match is None:
+        # Nothing structural in the remaining bytes so continue after them
+        self._pos = len(self._buffer)
+        self._fill()
+        continue
+      char = match.group()
+      if char == b'"':
+        string_match = _STRING_REMAINDER.match(self._buffer, match.end())
+        if string_match is None:
+          # Incomplete string, read more and scan it again from the quote
+          self._pos = match.start()
+          self._fill()
+          continue
+        self._pos = string_match.end()
+        continue
+      self._pos = match.end()
+      if char in (b'{', b'['):
+        depth += 1
+      else:
+        depth -= 1
+        if depth == 0:
+          return bytes(self._buffer[start:self._pos])
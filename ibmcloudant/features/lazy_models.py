@@ -0,0 +1,222 @@
+# coding: utf-8
+
+# © Copyright IBM Corporation 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Feature for lazily materializing documents and result rows.
+
+The lazy models are subclasses of the corresponding model in
+:mod:`ibmcloudant.cloudant_v1`. Their ``from_dict`` keeps a reference to the
+source dict and each property is only read, and converted to its nested
+models, on the first access. For example reading ``_id`` of a
+:class:`LazyDocument` does not convert its ``_attachments``.
+
+Unlike the usual ``from_dict`` the required properties are not validated
+and changes to the source dict are visible in the properties that have not
+been accessed yet.
+"""
+
+import inspect
+from typing import Callable, Dict
+
+from ..cloudant_v1 import (Attachment, BulkGetResult, BulkGetResultDocument, BulkGetResultItem, Change,
+                           ChangesResultItem, DocsResultRow, DocsResultRowValue, Document, DocumentResult,
+                           DocumentRevisionStatus, Revisions, SearchResultRow, ViewResultRow)
+
+
+class _LazyModel:
+    """
+    Base class for a lazy model, a subclass of _LazyModel and the model.
+    """
+
+    # The source dict is in a slot so it is not one of the instance properties
+    __slots__ = ('_lazy_source',)
+
+    # Converters from the JSON value to the model value for the nested models
+    _lazy_converters: Dict[str, Callable] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._lazy_model = cls.__bases__[-1]
+        cls._lazy_properties = frozenset(
+            name for name, parameter in inspect.signature(cls._lazy_model.__init__).parameters.items()
+            if name != 'self' and parameter.kind != inspect.Parameter.VAR_KEYWORD)
+        # Models with a _properties set also have additional properties
+        cls._lazy_additional_properties = hasattr(cls._lazy_model, '_properties')
+
+    def __init__(self, *args, **kwargs):
+        self._lazy_source = {}
+        super().__init__(*args, **kwargs)
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> '_LazyModel':
+        """Initialize a lazy model that reads its properties from a json dictionary."""
+        model = cls.__new__(cls)
+        model._lazy_source = _dict
+        return model
+
+    def __getattr__(self, name: str):
+        # Only called for properties that have not been read or set yet
+        if name == '_lazy_source':
+            raise AttributeError(name)
+        source = self._lazy_source
+        if name in self._lazy_properties:
+            value = source.get(name)
+            if value is not None and (converter := self._lazy_converters.get(name)) is not None:
+                value = converter(value)
+        elif self._lazy_additional_properties and name in source:
+            value = source[name]
+        else:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        self.__dict__[name] = value
+        return value
+
+    def _materialize(self) -> None:
+        # Read every property so the instance matches the usual model
+        for name in self._lazy_properties:
+            getattr(self, name)
+        if self._lazy_additional_properties:
+            for name in self._lazy_source:
+                if name not in self._lazy_properties:
+                    getattr(self, name)
+        self._lazy_source = {}
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        self._materialize()
+        return super().to_dict()
+
+    def __eq__(self, other) -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self._lazy_model):
+            return False
+        self._materialize()
+        if isinstance(other, _LazyModel):
+            other._materialize()
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other) -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class LazyDocument(_LazyModel, Document):
+    """
+    Document that converts its properties on first access.
+    """
+
+    __slots__ = ()
+
+    _lazy_converters = {
+        '_attachments': lambda attachments: {k: Attachment.from_dict(v) for k, v in attachments.items()},
+        '_revisions': Revisions.from_dict,
+        '_revs_info': lambda revs_info: [DocumentRevisionStatus.from_dict(v) for v in revs_info],
+    }
+
+    def get_properties(self) -> Dict:
+        """Return the additional properties from this instance of Document in the form of a dict."""
+        self._materialize()
+        return super().get_properties()
+
+    def set_properties(self, _dict: dict):
+        """Set a dictionary of additional properties in this instance of Document"""
+        self._materialize()
+        super().set_properties(_dict)
+
+
+class LazyViewResultRow(_LazyModel, ViewResultRow):
+    """
+    View result row that converts its properties on first access.
+    """
+
+    __slots__ = ()
+
+    _lazy_converters = {
+        'doc': LazyDocument.from_dict,
+    }
+
+
+class LazyDocsResultRow(_LazyModel, DocsResultRow):
+    """
+    All documents result row that converts its properties on first access.
+    """
+
+    __slots__ = ()
+
+    _lazy_converters = {
+        'doc': LazyDocument.from_dict,
+        'value': DocsResultRowValue.from_dict,
+    }
+
+
+class LazyChangesResultItem(_LazyModel, ChangesResultItem):
+    """
+    Changes result item that converts its properties on first access.
+    """
+
+    __slots__ = ()
+
+    _lazy_converters = {
+        'changes': lambda changes: [Change.from_dict(v) for v in changes],
+        'doc': LazyDocument.from_dict,
+    }
+
+
+class LazySearchResultRow(_LazyModel, SearchResultRow):
+    """
+    Search result row that converts its properties on first access.
+    """
+
+    __slots__ = ()
+
+    _lazy_converters = {
+        'doc': LazyDocument.from_dict,
+    }
+
+
+class LazyBulkGetResultDocument(_LazyModel, BulkGetResultDocument):
+    """
+    Bulk get result document that converts its properties on first access.
+    """
+
+    __slots__ = ()
+
+    _lazy_converters = {
+        'error': DocumentResult.from_dict,
+        'ok': LazyDocument.from_dict,
+    }
+
+
+class LazyBulkGetResultItem(_LazyModel, BulkGetResultItem):
+    """
+    Bulk get result item that converts its properties on first access.
+    """
+
+    __slots__ = ()
+
+    _lazy_converters = {
+        'docs': lambda docs: [LazyBulkGetResultDocument.from_dict(v) for v in docs],
+    }
+
+
+class LazyBulkGetResult(_LazyModel, BulkGetResult):
+    """
+    Bulk get result that converts its properties on first access.
+    """
+
+    __slots__ = ()
+
+    _lazy_converters = {
+        'results': lambda results: [LazyBulkGetResultItem.from_dict(v) for v in results],
+    }
@@ -0,0 +1,350 @@
+# coding: utf-8
+
+# © Copyright IBM Corporation 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Feature for following the changes feeds of many databases.
+"""
+import heapq
+import itertools
+import logging
+import time
+from queue import Empty, Queue
+from threading import Condition, Event, Lock, Thread
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from ibm_cloud_sdk_core import ApiException
+from requests.exceptions import ConnectionError as RequestsConnectionError, Timeout
+
+from ibmcloudant.cloudant_v1 import ChangesResultItem, CloudantV1, PostChangesEnums
+from .changes_follower import _FOREVER, _POLL_INTERVAL, _Mode
+from .queues import _put_unless_stopped
+
+_WORKERS = 4
+_BATCH_SIZE = 1000
+# Interval in milliseconds to poll a database with changes
+_MIN_INTERVAL = 1000
+# Maximum interval in milliseconds to poll an idle database
+_MAX_INTERVAL = 30000
+
+
+class _Database:
+    """
+    The state of a followed database.
+    """
+
+    __slots__ = ('since', 'interval', 'undelivered', 'success_time')
+
+    def __init__(self, since: str, success_time: float) -> None:
+        # The last_seq of the latest response
+        self.since = since
+        # The current polling interval in milliseconds
+        self.interval = 0
+        # The number of batches the consumer has not processed
+        self.undelivered = 0
+        # The time of the latest successful response, or of the start
+        self.success_time = success_time
+
+
+class MultiDatabaseChangesFollower:
+    """
+    MultiDatabaseChangesFollower follows the changes feeds of many
+    databases with a small pool of worker threads.
+
+    Instead of a longpoll request per database, the workers poll the
+    databases with "normal" changes requests of up to batch_size changes as
+    the databases become due. A database with pending changes is polled
+    again immediately and a database with changes is polled again after
+    min_interval milliseconds. Each poll of an idle database doubles its
+    interval up to max_interval milliseconds, so the requests are made in
+    proportion to the activity of the databases rather than their number.
+    A change may take up to max_interval milliseconds to be received from
+    an idle database.
+
+    The changes of all the databases are returned by a single iterator of
+    (db, change) tuples. The changes of a database are returned in order.
+
+    There are two modes of operation:
+        start_one_off() to fetch the changes of each database until there
+        are no further pending changes.
+        start() to fetch the changes from "now" and keep polling.
+
+    The sequence of the processed changes of each database is available
+    from "since", which can be used to resume in a new
+    MultiDatabaseChangesFollower. A batch of changes is processed when the
+    consumer requests the change after it.
+
+    The databases are the given dbs, or all the databases from
+    "get_all_dbs" when the follower is started. A database is no longer
+    followed and its exception is available from "errors" after:
+        a terminal error, for example because it was deleted.
+        transient errors, that are the other HTTP errors and the connection
+        errors, for longer than error_tolerance since its last successful
+        response. Until then the transient errors are retried with the
+        interval of an idle database.
+        any other error, for example an invalid response.
+
+    The other named arguments for "post_changes", for example
+    "include_docs" and "selector", are used for the requests of every
+    database.
+
+    :param CloudantV1 service: A client for the Cloudant service.
+    :param Iterable[str] dbs: (optional) The names of the databases to follow.
+    :param int workers: The number of worker threads.
+    :param int batch_size: The maximum number of changes requested from a database at once.
+    :param int min_interval: The interval to poll a database with changes set in milliseconds.
+    :param int max_interval: The maximum interval to poll an idle database set in milliseconds.
+    :param Mapping[str, str] since: (optional) The sequence to start from for each database.
+    :param int error_tolerance: A duration to suppress the transient errors of each database
+           for set in milliseconds.
+    :param bool raw: True to return the change items as the decoded dicts
+           instead of ChangesResultItem instances.
+    :return: None
+    """
+
+    def __init__(
+        self,
+        service: CloudantV1,
+        dbs: Optional[Iterable[str]] = None,
+        *,
+        workers: int = _WORKERS,
+        batch_size: int = _BATCH_SIZE,
+        min_interval: int = _MIN_INTERVAL,
+        max_interval: int = _MAX_INTERVAL,
+        since: Optional[Mapping[str, str]] = None,
+        raw: bool = False,
+        error_tolerance: int = _FOREVER,
+        **kwargs
+    ) -> None:
+        if error_tolerance > _FOREVER:
+            raise ValueError(f'Error tolerance duration must not be larger than {_FOREVER}.')
+        for name, value, minimum in (
+            ('error_tolerance', error_tolerance, 0),
+            ('workers', workers, 1),
+            ('batch_size', batch_size, 1),
+            ('min_interval', min_interval, 0),
+            ('max_interval', max_interval, min_interval),
+        ):
+            if value < minimum:
+                raise ValueError(f'The provided {name} {value} must be at least {minimum}.')
+        opts = ['db', 'descending', 'feed', 'heartbeat', 'last_event_id', 'limit', 'since', 'timeout']
+        invalid_options = [o for o in opts if kwargs.get(o) is not None]
+        if kwargs.get('filter') and kwargs.get('filter') != '_selector':
+            invalid_options.append(f"filter={kwargs.get('filter')}")
+        if invalid_options:
+            raise ValueError(
+                f"The options {', '.join(invalid_options)} are invalid when using {type(self).__name__}."
+            )
+        self.service = service
+        self.dbs = None if dbs is None else list(dbs)
+        self.workers = workers
+        self.batch_size = batch_size
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.raw = raw
+        self.error_tolerance = error_tolerance
+        self.options = kwargs
+        self.errors: Dict[str, Exception] = {}
+        self.logger = logging.getLogger(__name__)
+        self._since: Dict[str, str] = dict(since or {})
+        self._databases: Dict[str, _Database] = {}
+        self._mode = None
+        # The databases to poll as (due time, order, db)
+        self._schedule: List[Tuple[float, int, str]] = []
+        self._order = itertools.count()
+        self._polling = 0
+        self._running = 0
+        self._condition = Condition()
+        self._lock = Lock()
+        self._stop = Event()
+        self._buffer = Queue(maxsize=workers)
+        self._threads: List[Thread] = []
+
+    @property
+    def since(self) -> Dict[str, str]:
+        """The sequence of the processed changes of each database."""
+        with self._lock:
+            return dict(self._since)
+
+    def start(self) -> Iterator[Tuple[str, Any]]:
+        """
+        Return the new changes of the databases and keep polling for
+        further changes until stop() is called.
+
+        Returns an iterator of (db, ChangesResultItem) per change.
+
+        Throws RuntimeError if the follower was already started or
+        ApiException if the databases cannot be listed.
+        """
+        return self._run(_Mode.LISTEN)
+
+    def start_one_off(self) -> Iterator[Tuple[str, Any]]:
+        """
+        Return all available changes of the databases until there are no
+        further changes pending for any database or stop() is called.
+
+        Returns an iterator of (db, ChangesResultItem) per change.
+
+        Throws RuntimeError if the follower was already started or
+        ApiException if the databases cannot be listed.
+        """
+        return self._run(_Mode.FINITE)
+
+    def stop(self) -> None:
+        """
+        Stop this MultiDatabaseChangesFollower.
+
+        The iterator ends after the change it is returning.
+        """
+        self._stop.set()
+        with self._condition:
+            self._condition.notify_all()
+        for thread in self._threads:
+            thread.join()
+
+    def _run(self, mode: _Mode) -> Iterator[Tuple[str, Any]]:
+        if self._mode is not None:
+            raise RuntimeError('Cannot start a feed that has already started.')
+        self._mode = mode
+        dbs = self.dbs
+        if dbs is None:
+            dbs = self.service.get_all_dbs().get_result()
+        default_since = 'now' if mode is _Mode.LISTEN else '0'
+        now = time.monotonic()
+        for db in dbs:
+            self._databases[db] = _Database(self._since.get(db, default_since), now)
+            self._schedule.append((now, next(self._order), db))
+        heapq.heapify(self._schedule)
+        self._threads = [Thread(target=self._worker_callback, daemon=True) for _ in range(self.workers)]
+        self._running = self.workers
+        for thread in self._threads:
+            thread.start()
+        return self._changes()
+
+    def _changes(self) -> Iterator[Tuple[str, Any]]:
+        while not self._stop.is_set():
+            try:
+                item = self._buffer.get(timeout=_POLL_INTERVAL)
+            except Empty:
+                continue
+            if item is None:
+                return
+            db, result = item
+            for change in result['results']:
+                if self._stop.is_set():
+                    return
+                yield db, change if self.raw else ChangesResultItem.from_dict(change)
+            # The consumer has processed every change of the batch
+            with self._lock:
+                self._since[db] = result['last_seq']
+                self._databases[db].undelivered -= 1
+
+    def _worker_callback(self) -> None:
+        while True:
+            db = self._next_database()
+            if db is None:
+                break
+            interval = self._poll(db)
+            with self._condition:
+                self._polling -= 1
+                if interval is not None:
+                    due = time.monotonic() + interval / 1000
+                    heapq.heappush(self._schedule, (due, next(self._order), db))
+                self._condition.notify_all()
+        with self._condition:
+            self._running -= 1
+            last = self._running == 0
+        if last and not self._stop.is_set():
+            # End the iteration
+            self._put(None)
+
+    def _next_database(self) -> Optional[str]:
+        # Wait for a database to be due for polling
+        with self._condition:
+            while not self._stop.is_set():
+                if not self._schedule:
+                    if self._polling == 0:
+                        # Every database has finished
+                        return None
+                    self._condition.wait()
+                    continue
+                due, _, db = self._schedule[0]
+                wait = due - time.monotonic()
+                if wait <= 0:
+                    heapq.heappop(self._schedule)
+                    self._polling += 1
+                    return db
+                self._condition.wait(wait)
+            return None
+
+    def _poll(self, db: str) -> Optional[int]:
+        # Poll a database and return the interval to poll it again
+        # or None to stop following it
+        database = self._databases[db]
+        try:
+            result = self.service.post_changes(
+                db=db,
+                since=database.since,
+                limit=self.batch_size,
+                feed=PostChangesEnums.Feed.NORMAL,
+                **self.options,
+            ).get_result()
+            last_seq = result['last_seq']
+            results = result['results']
+        except Exception as e:
+            if self._failed(db, e):
+                self.errors[db] = e
+                return None
+            database.interval = self._idle_interval(database.interval)
+            return database.interval
+        database.success_time = time.monotonic()
+        database.since = last_seq
+        pending = result.get('pending', 0)
+        if results:
+            with self._lock:
+                database.undelivered += 1
+            if not self._put((db, result)):
+                return None
+            database.interval = 0 if pending > 0 else self.min_interval
+        else:
+            with self._lock:
+                # Without undelivered changes the database has been processed to its last_seq
+                if database.undelivered == 0:
+                    self._since[db] = database.since
+            database.interval = self._idle_interval(database.interval)
+        if self._mode is _Mode.FINITE and pending == 0:
+            return None
+        return database.interval
+
+    def _failed(self, db: str, e: Exception) -> bool:
+        # Return True to stop following the database after the error
+        if not isinstance(e, (ApiException, RequestsConnectionError, Timeout)):
+            self.logger.warning(f'Stopped following database {db} after error {e!r}')
+            return True
+        if isinstance(e, ApiException) and e.status_code in [400, 401, 403, 404]:
+            self.logger.warning(f'Stopped following database {db} after terminal error {e}')
+            return True
+        failing = time.monotonic() - self._databases[db].success_time
+        if self.error_tolerance != _FOREVER and failing * 1000 >= self.error_tolerance:
+            self.logger.warning(f'Stopped following database {db} after error tolerance exceeded {e}')
+            return True
+        self.logger.debug(f'Exception getting changes of database {db} {e}')
+        return False
+
+    def _idle_interval(self, interval: int) -> int:
+        return min(max(2 * interval, self.min_interval), self.max_interval)
+
+    def _put(self, item) -> bool:
+        # Waits for space in the buffer, but gives up if the follower was stopped
+        return _put_unless_stopped(self._buffer, item, self._stop, _POLL_INTERVAL)
@@ -22,15 +22,20 @@
 """
 
 from abc import abstractmethod
+from collections import deque
 from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import auto, Enum
 from functools import partial
+from queue import Queue
+from threading import Event, Lock, Thread
 from types import MappingProxyType
 from typing import Generic, Optional, Protocol, TypeVar
 
 from ibm_cloud_sdk_core import DetailedResponse
 from ibmcloudant.cloudant_v1 import CloudantV1,\
   AllDocsResult, DocsResultRow, Document, FindResult, SearchResult, SearchResultRow, ViewResult, ViewResultRow
+from ibmcloudant.features.queues import _put_unless_stopped
 
 # Type variable for the result
 R = TypeVar('R', AllDocsResult, FindResult, SearchResult, ViewResult)
@@ -43,6 +48,14 @@ _MAX_LIMIT = 200
 _MIN_LIMIT = 1
 _DOCS_KEY_ERROR = "No need to paginate as 'key' returns a single result for an ID."
 _VIEW_KEY_ERROR = "Use 'start_key' and 'end_key' instead."
+# Number of pages buffered per key range in a parallel scan
+_PARALLEL_BUFFER_PAGES = 2
+# Interval in seconds for parallel scan threads to check for a stop
+_PARALLEL_POLL_INTERVAL = 0.1
+
+def _value(item, name: str):
+  # Raw mode items are the decoded dicts, otherwise they are model instances
+  return item[name] if isinstance(item, dict) else getattr(item, name)
 
 class PagerType(Enum):
   """
@@ -102,12 +115,19 @@ class Pagination:
    * :meth:`pager` - for an IBM Cloud SDK style Pager
    * :meth:`pages` - for a page Iterable
    * :meth:`rows` - for a row Iterable
+
+  The :meth:`pages` and :meth:`rows` iterables accept a ``prefetch`` number of
+  pages to request in the background while the current page is processed.
+
+  For the key based operations (all docs, design docs and views)
+  :meth:`parallel_rows` splits the key range and paginates the sub-ranges concurrently.
   """
 
-  def __init__(self, client: CloudantV1, type: PagerType, opts: dict):
+  def __init__(self, client: CloudantV1, type: PagerType, opts: dict, raw: bool = False):
     self._client = client
     self._operation_type = type
     self._initial_opts = dict(opts)
+    self._raw = raw
 
   def pager(self) -> Pager[I]:
     """
@@ -117,28 +137,126 @@ class Pagination:
 
     return _IteratorPager(self.pages)
 
-  def pages(self) -> Iterable[Sequence[I]]:
+  def pages(self, prefetch: int = 0) -> Iterable[Sequence[I]]:
     """
     Create a new Iterable for all the pages.
     This type is useful for handling pages in a for loop.
 
     for page in Pagination.new_pagination(client, **opts).pages():
       ...
+
+    prefetch: int - the number of pages to request in the background
+    ahead of the page being processed, 0 (the default) to request each page
+    only when it is needed
     """
 
-    return self._operation_type(self._client, self._initial_opts)
+    self._validate_prefetch(prefetch)
+    if self._raw:
+      page_iterator = self._operation_type(self._client, self._initial_opts, raw=True)
+    else:
+      page_iterator = self._operation_type(self._client, self._initial_opts)
+    if prefetch > 0:
+      return _PrefetchPageIterator(page_iterator, prefetch)
+    return page_iterator
 
-  def rows(self) -> Iterable[I]:
+  def rows(self, prefetch: int = 0) -> Iterable[I]:
     """
     Create a new Iterable for all the rows from all the pages.
     This type is useful for handling rows in a for loop.
 
     for row in Pagination.new_pagination(client, **opts).rows():
       ...
+
+    prefetch: int - the number of pages to request in the background
+    ahead of the page being processed, 0 (the default) to request each page
+    only when it is needed
     """
 
-    for page in self.pages():
-      yield from page
+    pages = self.pages(prefetch)
+    try:
+      for page in pages:
+        yield from page
+    finally:
+      if isinstance(pages, _PrefetchPageIterator):
+        pages.close()
+
+  def parallel_rows(self,
+                    ranges: int = 4,
+                    boundaries: Optional[Sequence[K]] = None,
+                    ordered: bool = False,
+                    workers: int = 4) -> Iterable[I]:
+    """
+    Create a new Iterable for all the rows by paginating disjoint key ranges concurrently.
+    This is only available for the key based operations: all docs, design docs and views.
+
+    for row in Pagination.new_pagination(client, **opts).parallel_rows(ranges=8):
+      ...
+
+    ranges: int - the number of key ranges to split the keys into, the split keys are
+    sampled with skip and limit requests before the pagination starts
+    boundaries: Sequence - optional split keys in the order of the results to use
+    instead of sampling, making len(boundaries) + 1 key ranges
+    ordered: bool - True to return the rows in the same order as rows(), by default
+    the rows are returned in the order the pages of each range are received
+    workers: int - the maximum number of ranges to paginate concurrently
+    """
+
+    if not issubclass(self._operation_type, _KeyPageIterator):
+      raise ValueError('Parallel rows are only available for the key based pager types.')
+    self._validate_option_absent('skip', self._initial_opts)
+    if boundaries is None and ranges < 1:
+      raise ValueError(f'The provided ranges {ranges} must be at least 1.')
+    if workers < 1:
+      raise ValueError(f'The provided workers {workers} must be at least 1.')
+    return _ParallelKeyRangeScan(self, ranges, boundaries, ordered, workers).rows()
+
+  @classmethod
+  def _validate_prefetch(cls, prefetch: int):
+    if prefetch < 0:
+      raise ValueError(f'The provided prefetch {prefetch} must not be negative.')
+
+  @classmethod
+  def partition_rows(cls,
+                     client: CloudantV1,
+                     type: PagerType,
+                     partition_keys: Iterable[str],
+                     workers: int = 4,
+                     **kwargs) -> Iterable[tuple[str, I]]:
+    """
+    Create a new Iterable for all the rows from all the pages of several partitions.
+    The partitions are paginated concurrently and the rows are returned
+    as tuples of partition key and row in the order the pages are received.
+
+    for partition_key, row in Pagination.partition_rows(client, PagerType.POST_PARTITION_FIND, keys, **opts):
+      ...
+
+    client: CloudantV1 - the Cloudant service client
+    type: PagerType - the partitioned operation type to paginate
+    partition_keys: Iterable[str] - the partition keys, an iterator is consumed
+    only as the workers become free
+    workers: int - the maximum number of partitions to paginate concurrently
+    kwargs: dict - the options for the operation, without the partition key
+    """
+
+    if type not in (PagerType.POST_PARTITION_ALL_DOCS,
+                    PagerType.POST_PARTITION_FIND,
+                    PagerType.POST_PARTITION_SEARCH,
+                    PagerType.POST_PARTITION_VIEW):
+      raise ValueError(f'The pager type {type.name} is not a partitioned pager type.')
+    cls._validate_option_absent('partition_key', kwargs, "Use 'partition_keys' instead.")
+    if workers < 1:
+      raise ValueError(f'The provided workers {workers} must be at least 1.')
+    # Validate the options once for all the partitions
+    cls.new_pagination(client, type, **kwargs)
+    partition_paginations = ((partition_key, cls.new_pagination(client, type, partition_key=partition_key, **kwargs))
+                             for partition_key in partition_keys)
+    return cls._partition_rows(_ConcurrentPageScan(partition_paginations, workers))
+
+  @classmethod
+  def _partition_rows(cls, scan: '_ConcurrentPageScan') -> Iterable[tuple[str, I]]:
+    for partition_key, page in scan.pages():
+      for row in page:
+        yield partition_key, row
 
   @classmethod
   def _validate_limit(cls, opts: dict):
@@ -163,11 +281,12 @@ class Pagination:
       cls._validate_option_absent(invalid_opt, opts)
 
   @classmethod
-  def new_pagination(cls, client:CloudantV1, type: PagerType, **kwargs):
+  def new_pagination(cls, client:CloudantV1, type: PagerType, raw: bool = False, **kwargs):
     """
     Create a new Pagination.
     client: CloudantV1 - the Cloudant service client
     type: PagerType - the operation type to paginate
+    raw: bool - True to return the rows as the decoded dicts instead of model instances
     kwargs: dict - the options for the operation
     """
 
@@ -176,32 +295,167 @@ class Pagination:
     if type == PagerType.POST_ALL_DOCS:
       cls._validate_option_absent('key', kwargs, _DOCS_KEY_ERROR)
       cls._validate_options_absent(('keys',), kwargs)
-      return Pagination(client, _AllDocsPageIterator, kwargs)
+      return Pagination(client, _AllDocsPageIterator, kwargs, raw)
     if type == PagerType.POST_DESIGN_DOCS:
       cls._validate_option_absent('key', kwargs, _DOCS_KEY_ERROR)
       cls._validate_options_absent(('keys',), kwargs)
-      return Pagination(client, _DesignDocsPageIterator, kwargs)
+      return Pagination(client, _DesignDocsPageIterator, kwargs, raw)
     if type == PagerType.POST_FIND:
-      return Pagination(client, _FindPageIterator, kwargs)
+      return Pagination(client, _FindPageIterator, kwargs, raw)
     if type == PagerType.POST_PARTITION_ALL_DOCS:
       cls._validate_option_absent('key', kwargs, _DOCS_KEY_ERROR)
       cls._validate_options_absent(('keys',), kwargs)
-      return Pagination(client, _AllDocsPartitionPageIterator, kwargs)
+      return Pagination(client, _AllDocsPartitionPageIterator, kwargs, raw)
     if type == PagerType.POST_PARTITION_FIND:
-      return Pagination(client, _FindPartitionPageIterator, kwargs)
+      return Pagination(client, _FindPartitionPageIterator, kwargs, raw)
     if type == PagerType.POST_PARTITION_SEARCH:
-      return Pagination(client, _SearchPartitionPageIterator, kwargs)
+      return Pagination(client, _SearchPartitionPageIterator, kwargs, raw)
     if type == PagerType.POST_PARTITION_VIEW:
       cls._validate_option_absent('key', kwargs, _VIEW_KEY_ERROR)
       cls._validate_options_absent(('keys',), kwargs)
-      return Pagination(client, _ViewPartitionPageIterator, kwargs)
+      return Pagination(client, _ViewPartitionPageIterator, kwargs, raw)
     if type == PagerType.POST_SEARCH:
       cls._validate_options_absent(('counts', 'group_field', 'group_limit', 'group_sort', 'ranges',), kwargs)
-      return Pagination(client, _SearchPageIterator, kwargs)
+      return Pagination(client, _SearchPageIterator, kwargs, raw)
     if type == PagerType.POST_VIEW:
       cls._validate_option_absent('key', kwargs, _VIEW_KEY_ERROR)
       cls._validate_options_absent(('keys',), kwargs)
-      return Pagination(client, _ViewPageIterator, kwargs)
+      return Pagination(client, _ViewPageIterator, kwargs, raw)
+
+class _ConcurrentPageScan:
+  """
+  Requests the pages of several paginations on a bounded number of threads.
+
+  Each page is returned tagged with the tag supplied with its pagination.
+  Unordered pages are returned as they are received. Ordered pages are
+  returned for each pagination in turn, with the pages of later paginations
+  waiting in a bounded buffer.
+  """
+
+  _END = object()
+
+  def __init__(self, paginations: Iterable[tuple[any, Pagination]], workers: int, ordered: bool = False):
+    self._workers: int = workers
+    self._ordered: bool = ordered
+    self._stop: Event = Event()
+    self._lock: Lock = Lock()
+    if ordered:
+      # Materialize to make a buffer for each pagination
+      self._buffers: list[Queue] = []
+      claims: list[tuple[Queue, any, Pagination]] = []
+      for tag, pagination in paginations:
+        buffer = Queue(maxsize=_PARALLEL_BUFFER_PAGES)
+        self._buffers.append(buffer)
+        claims.append((buffer, tag, pagination))
+      self._claims: Iterator[tuple[Queue, any, Pagination]] = iter(claims)
+    else:
+      buffer = Queue(maxsize=_PARALLEL_BUFFER_PAGES * workers)
+      self._buffers: list[Queue] = [buffer]
+      self._claims: Iterator[tuple[Queue, any, Pagination]] = ((buffer, tag, pagination) for tag, pagination in paginations)
+
+  def pages(self) -> Iterator[tuple[any, Sequence[I]]]:
+    for _ in range(self._workers):
+      Thread(target=self._work, daemon=True).start()
+    try:
+      if self._ordered:
+        for buffer in self._buffers:
+          yield from self._drain(buffer, 1)
+      else:
+        yield from self._drain(self._buffers[0], self._workers)
+    finally:
+      self._stop.set()
+
+  def _drain(self, buffer: Queue, ends: int) -> Iterator[tuple[any, Sequence[I]]]:
+    while ends > 0:
+      item = buffer.get()
+      if item is _ConcurrentPageScan._END:
+        ends -= 1
+      elif isinstance(item, Exception):
+        raise item
+      else:
+        yield item
+
+  def _work(self):
+    while not self._stop.is_set():
+      try:
+        # The paginations may come from a caller supplied iterator so claim under lock
+        with self._lock:
+          buffer, tag, pagination = next(self._claims)
+      except StopIteration:
+        break
+      except Exception as e:
+        self._put(self._buffers[0], e)
+        break
+      try:
+        for page in pagination.pages():
+          if not self._put(buffer, (tag, page)):
+            return
+      except Exception as e:
+        self._put(buffer, e)
+        return
+      if self._ordered:
+        self._put(buffer, _ConcurrentPageScan._END)
+    if not self._ordered:
+      self._put(self._buffers[0], _ConcurrentPageScan._END)
+
+  def _put(self, buffer: Queue, item) -> bool:
+    # Waits for space in the buffer, but gives up if the consuming iterator was closed
+    return _put_unless_stopped(buffer, item, self._stop, _PARALLEL_POLL_INTERVAL)
+
+class _ParallelKeyRangeScan:
+  """
+  Paginates disjoint key ranges of a key based pagination on a bounded number of threads.
+
+  Each range is [start_key, end_key) where the boundaries are the keys at
+  evenly spaced skip positions, so a row with a boundary key is in the later range.
+  """
+
+  def __init__(self, pagination: Pagination, ranges: int, boundaries: Optional[Sequence[K]], ordered: bool, workers: int):
+    self._pagination: Pagination = pagination
+    self._ranges: int = ranges
+    self._boundaries: Optional[Sequence[K]] = boundaries
+    self._ordered: bool = ordered
+    self._workers: int = workers
+
+  def rows(self) -> Iterator[I]:
+    boundaries = self._boundaries
+    if boundaries is None:
+      boundaries = self._sample_boundaries()
+    range_paginations = self._range_paginations(boundaries)
+    workers = min(self._workers, len(range_paginations))
+    scan = _ConcurrentPageScan(((None, p) for p in range_paginations), workers, self._ordered)
+    for _, page in scan.pages():
+      yield from page
+
+  def _sample_boundaries(self) -> list[K]:
+    probe: _KeyPageIterator = self._pagination._operation_type(self._pagination._client, self._pagination._initial_opts)
+    total_rows: int = probe._total_rows()
+    boundaries: list[K] = []
+    for i in range(1, self._ranges):
+      key_row = probe._row_at(total_rows * i // self._ranges)
+      if key_row is None:
+        # Fewer rows in the key range than estimated from the index total
+        break
+      key = _value(key_row, 'key')
+      if len(boundaries) == 0 or boundaries[-1] != key:
+        boundaries.append(key)
+    return boundaries
+
+  def _range_paginations(self, boundaries: Sequence[K]) -> list[Pagination]:
+    opts: dict = self._pagination._initial_opts
+    range_paginations: list[Pagination] = []
+    start_opts: dict = {k: opts[k] for k in ('start_key', 'start_key_doc_id') if k in opts}
+    for boundary in boundaries:
+      range_opts: dict = {k: v for k, v in opts.items() if k not in ('start_key', 'start_key_doc_id', 'end_key', 'end_key_doc_id')}
+      range_opts.update(start_opts)
+      range_opts['end_key'] = boundary
+      range_opts['inclusive_end'] = False
+      range_paginations.append(Pagination(self._pagination._client, self._pagination._operation_type, range_opts, self._pagination._raw))
+      start_opts = {'start_key': boundary}
+    last_opts: dict = {k: v for k, v in opts.items() if k not in ('start_key', 'start_key_doc_id')}
+    last_opts.update(start_opts)
+    range_paginations.append(Pagination(self._pagination._client, self._pagination._operation_type, last_opts, self._pagination._raw))
+    return range_paginations
 
 class _IteratorPagerState(Enum):
   NEW = auto()
@@ -258,14 +512,98 @@ class _IteratorPager(Pager[I]):
       raise Exception(_IteratorPager._state_consumed_msg)
     raise Exception(_IteratorPager._state_mixed_msg)
 
+class _PrefetchPageIterator(Iterator[Sequence[I]]):
+  """
+  Wraps a page iterator to request the following pages on a background
+  thread while the current page is processed.
+
+  Each page request depends on the previous page so the requests are still
+  made one at a time, but up to prefetch pages are requested ahead.
+
+  Close the iterator, or use it as a context manager, to stop the requests
+  when the pages are not iterated to the end. An unreferenced iterator is
+  also closed.
+  """
+
+  _END = object()
+
+  def __init__(self, page_iterator: Iterator[Sequence[I]], prefetch: int):
+    self._page_iterator: Iterator[Sequence[I]] = page_iterator
+    self._prefetch: int = prefetch
+    self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='cloudant-pagination')
+    self._futures: deque[Future] = deque()
+    self._failed: Event = Event()
+    self._closed: bool = False
+
+  def __iter__(self) -> Iterator[Sequence[I]]:
+    return self
+
+  def __enter__(self) -> '_PrefetchPageIterator':
+    return self
+
+  def __exit__(self, exc_type, exc_value, traceback) -> None:
+    self.close()
+
+  def __del__(self):
+    self.close()
+
+  def __next__(self) -> Sequence[I]:
+    if self._closed:
+      raise StopIteration()
+    self._submit()
+    try:
+      page = self._futures.popleft().result()
+    except Exception:
+      self.close()
+      raise
+    if page is _PrefetchPageIterator._END:
+      self.close()
+      raise StopIteration()
+    # Request ahead again while the caller processes this page
+    self._submit()
+    return page
+
+  def close(self):
+    """
+    Cancel the page requests that have not started and release the thread.
+    """
+
+    self._closed = True
+    for future in self._futures:
+      future.cancel()
+    self._futures.clear()
+    self._executor.shutdown(wait=False)
+
+  def _submit(self):
+    # The queued requests do not reference the iterator so that an
+    # unreferenced iterator is closed and cancels them
+    while len(self._futures) < self._prefetch:
+      self._futures.append(self._executor.submit(_PrefetchPageIterator._next_page, self._page_iterator, self._failed))
+
+  @staticmethod
+  def _next_page(page_iterator: Iterator[Sequence[I]], failed: Event):
+    # Runs on the single executor thread so requests are made in order.
+    # After an error or the last page the queued requests are not made.
+    if failed.is_set():
+      return _PrefetchPageIterator._END
+    try:
+      return next(page_iterator)
+    except StopIteration:
+      return _PrefetchPageIterator._END
+    except Exception:
+      failed.set()
+      raise
+
 class _BasePageIterator(Iterator[Sequence[I]]):
 
   def __init__(self,
                client: CloudantV1,
                operation: Callable[..., DetailedResponse],
                page_opts: Sequence[str],
-               opts: dict):
+               opts: dict,
+               raw: bool = False):
     self._client: CloudantV1 = client
+    self._raw: bool = raw
     self._has_next: bool = True
     # split the opts into fixed and page parts based on page_opts
     self._next_page_opts: dict = {}
@@ -292,7 +630,8 @@ class _BasePageIterator(Iterator[Sequence[I]]):
   def _next_request(self) -> list[I]:
     response: DetailedResponse = self._next_request_function(**self._next_page_opts)
     result: dict = response.get_result()
-    typed_result: R = self._result_converter()(result)
+    # Raw mode skips the model conversion and pages the result dict
+    typed_result: R = result if self._raw else self._result_converter()(result)
     items: list[I] = self._items(typed_result)
     if len(items) < self._page_size:
       self._has_next = False
@@ -317,8 +656,8 @@ class _BasePageIterator(Iterator[Sequence[I]]):
 
 class _KeyPageIterator(_BasePageIterator, Generic[K]):
 
-  def __init__(self, client: CloudantV1, operation: Callable[..., DetailedResponse], opts: dict):
-    super().__init__(client, operation, ('skip', 'start_key', 'start_key_doc_id',), opts)
+  def __init__(self, client: CloudantV1, operation: Callable[..., DetailedResponse], opts: dict, raw: bool = False):
+    super().__init__(client, operation, ('skip', 'start_key', 'start_key_doc_id',), opts, raw)
     self._boundary_failure: Optional[str] = None
 
   def _next_request(self) -> list[I]:
@@ -333,16 +672,28 @@ class _KeyPageIterator(_BasePageIterator, Generic[K]):
         self._boundary_failure: Optional[str] = self.check_boundary(penultimate_item, last_item)
     return items
 
+  def _total_rows(self) -> int:
+    # total_rows is for the whole index, not only the requested key range
+    response: DetailedResponse = self._next_request_function(**self._next_page_opts, limit=0)
+    return response.get_result().get('total_rows', 0)
+
+  def _row_at(self, skip: int) -> Optional[I]:
+    opts: dict = {**self._next_page_opts, 'skip': skip, 'limit': 1, 'include_docs': False}
+    response: DetailedResponse = self._next_request_function(**opts)
+    result: dict = response.get_result()
+    items: list[I] = self._items(result if self._raw else self._result_converter()(result))
+    return items[0] if len(items) > 0 else None
+
   def _get_next_page_options(self, result: R) -> dict:
     # last item is used for next page options
     last_item = self._items(result)[-1]
     return {
-      'start_key': last_item.key,
-      'start_key_doc_id': last_item.id,
+      'start_key': _value(last_item, 'key'),
+      'start_key_doc_id': _value(last_item, 'id'),
     }
 
   def _items(self, result: R) -> list[I]:
-    return result.rows
+    return _value(result, 'rows')
 
   def _page_size_from_opts_limit(self, opts:dict) -> int:
     return super()._page_size_from_opts_limit(opts) + 1
@@ -353,11 +704,11 @@ class _KeyPageIterator(_BasePageIterator, Generic[K]):
 
 class _BookmarkPageIterator(_BasePageIterator):
 
-  def __init__(self, client: CloudantV1, operation: Callable[..., DetailedResponse], opts: dict, extra_page_opts:Sequence[str]=()):
-    super().__init__(client, operation, ('bookmark',) + extra_page_opts, opts)
+  def __init__(self, client: CloudantV1, operation: Callable[..., DetailedResponse], opts: dict, extra_page_opts:Sequence[str]=(), raw: bool = False):
+    super().__init__(client, operation, ('bookmark',) + extra_page_opts, opts, raw)
 
   def _get_next_page_options(self, result: R) -> dict:
-    return {'bookmark': result.bookmark}
+    return {'bookmark': _value(result, 'bookmark')}
 
 class _AllDocsBasePageIterator(_KeyPageIterator[str]):
 
@@ -376,60 +727,60 @@ class _AllDocsBasePageIterator(_KeyPageIterator[str]):
 
 class _AllDocsPageIterator(_AllDocsBasePageIterator):
 
-  def __init__(self, client: CloudantV1, opts: dict):
-    super().__init__(client, client.post_all_docs, opts)
+  def __init__(self, client: CloudantV1, opts: dict, raw: bool = False):
+    super().__init__(client, client.post_all_docs, opts, raw=raw)
 
 class _AllDocsPartitionPageIterator(_AllDocsBasePageIterator):
 
-  def __init__(self, client: CloudantV1, opts: dict):
-    super().__init__(client, client.post_partition_all_docs, opts)
+  def __init__(self, client: CloudantV1, opts: dict, raw: bool = False):
+    super().__init__(client, client.post_partition_all_docs, opts, raw=raw)
 
 class _DesignDocsPageIterator(_AllDocsBasePageIterator):
 
-  def __init__(self, client: CloudantV1, opts: dict):
-    super().__init__(client, client.post_design_docs, opts)
+  def __init__(self, client: CloudantV1, opts: dict, raw: bool = False):
+    super().__init__(client, client.post_design_docs, opts, raw=raw)
 
 class _FindBasePageIterator(_BookmarkPageIterator):
 
-  def __init__(self, client: CloudantV1, operation: Callable[..., DetailedResponse], opts: dict):
+  def __init__(self, client: CloudantV1, operation: Callable[..., DetailedResponse], opts: dict, raw: bool = False):
     # Find requests allow skip, but it should only be used on the first request.
     # Since we don't want it on subsequent page requests we need to exclude it from
     # fixed opts used for the partial function.
-    super().__init__(client, operation, opts, extra_page_opts=('skip',))
+    super().__init__(client, operation, opts, extra_page_opts=('skip',), raw=raw)
 
   def _items(self, result: FindResult):
-    return result.docs
+    return _value(result, 'docs')
 
   def _result_converter(self):
     return FindResult.from_dict
 
 class _FindPageIterator(_FindBasePageIterator):
 
-  def __init__(self, client: CloudantV1, opts: dict):
-    super().__init__(client, client.post_find, opts)
+  def __init__(self, client: CloudantV1, opts: dict, raw: bool = False):
+    super().__init__(client, client.post_find, opts, raw=raw)
 
 class _FindPartitionPageIterator(_FindBasePageIterator):
 
-  def __init__(self, client: CloudantV1, opts: dict):
-    super().__init__(client, client.post_partition_find, opts)
+  def __init__(self, client: CloudantV1, opts: dict, raw: bool = False):
+    super().__init__(client, client.post_partition_find, opts, raw=raw)
 
 class _SearchBasePageIterator(_BookmarkPageIterator):
 
   def _items(self, result: SearchResult):
-    return result.rows
+    return _value(result, 'rows')
 
   def _result_converter(self):
     return SearchResult.from_dict
 
 class _SearchPageIterator(_SearchBasePageIterator):
 
-  def __init__(self, client: CloudantV1, opts: dict):
-    super().__init__(client, client.post_search, opts)
+  def __init__(self, client: CloudantV1, opts: dict, raw: bool = False):
+    super().__init__(client, client.post_search, opts, raw=raw)
 
 class _SearchPartitionPageIterator(_SearchBasePageIterator):
 
-  def __init__(self, client: CloudantV1, opts: dict):
-    super().__init__(client, client.post_partition_search, opts)
+  def __init__(self, client: CloudantV1, opts: dict, raw: bool = False):
+    super().__init__(client, client.post_partition_search, opts, raw=raw)
 
 class _ViewBasePageIterator(_KeyPageIterator[any]):
 
@@ -437,17 +788,17 @@ class _ViewBasePageIterator(_KeyPageIterator[any]):
     return ViewResult.from_dict
 
   def check_boundary(self, penultimate_item: I, last_item: I) -> Optional[str]:
-    if penultimate_item.id == (boundary_id := last_item.id) \
-      and penultimate_item.key == (boundary_key := last_item.key):
+    if _value(penultimate_item, 'id') == (boundary_id := _value(last_item, 'id')) \
+      and _value(penultimate_item, 'key') == (boundary_key := _value(last_item, 'key')):
       return f'Cannot paginate on a boundary containing identical keys {boundary_key} and document IDs {boundary_id}'
     return None
 
 class _ViewPageIterator(_ViewBasePageIterator):
 
-  def __init__(self, client: CloudantV1, opts: dict):
-    super().__init__(client, client.post_view, opts)
+  def __init__(self, client: CloudantV1, opts: dict, raw: bool = False):
+    super().__init__(client, client.post_view, opts, raw=raw)
 
 class _ViewPartitionPageIterator(_ViewBasePageIterator):
 
-  def __init__(self, client: CloudantV1, opts: dict):
-    super().__init__(client, client.post_partition_view, opts)
+  def __init__(self, client: CloudantV1, opts: dict, raw: bool = False):
+    super().__init__(client, client.post_partition_view, opts, raw=raw)
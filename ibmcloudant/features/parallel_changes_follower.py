@@ -0,0 +1,278 @@
+# coding: utf-8
+
+# © Copyright IBM Corporation 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Feature for processing the changes feed with parallel workers.
+"""
+import logging
+import time
+import zlib
+from collections import deque
+from concurrent.futures import Executor
+from queue import Empty, Queue
+from threading import Event, Lock, Thread
+from typing import Any, Callable, Deque, List, Optional
+
+from ibmcloudant.cloudant_v1 import ChangesResultItem, CloudantV1
+from .changes_follower import _CHECKPOINT_INTERVAL, _POLL_INTERVAL, ChangesFollower
+from .checkpoint import CheckpointStore, _CheckpointSaver
+from .queues import _put_unless_stopped
+
+_WORKERS = 4
+# Number of changes waiting for each worker
+_QUEUE_SIZE = 1000
+
+
+class _Batch:
+    """
+    The last_seq of a dispatched batch and the number of its changes
+    that the workers have not yet processed.
+    """
+
+    __slots__ = ('seq', 'outstanding')
+
+    def __init__(self, seq: str, outstanding: int) -> None:
+        self.seq = seq
+        self.outstanding = outstanding
+
+
+class ParallelChangesFollower:
+    """
+    ParallelChangesFollower reads the changes feed of a database once and
+    calls a handler for each change from several worker threads.
+
+    The changes are partitioned between the workers by a hash of the
+    document ID, so the changes of a document are handled in feed order
+    by the same worker. With an executor, for example a
+    ProcessPoolExecutor for CPU bound handlers, each worker submits its
+    changes to the executor one at a time, which keeps the order. When a
+    worker has queue_size changes waiting, for example because of a slow
+    change, the changes are not dispatched to any worker until it catches
+    up, bounding the memory used.
+
+    The sequence of the processed changes is the "last_seq" of the latest
+    batch for which every change of that batch and the batches before it
+    has been handled by the workers, so a restart from it does not miss
+    changes. It is available from "since" and, with a checkpoint_store,
+    saved at most once per checkpoint_interval and when the
+    ParallelChangesFollower stops. Changes after it may be handled again
+    after a restart.
+
+    If the handler raises an exception or the changes feed ends with an
+    error the ParallelChangesFollower stops. The exception is available
+    from "error".
+
+    Call stop(), or use the ParallelChangesFollower as a context manager,
+    to stop following the changes. Use join() to wait for start_one_off()
+    to process all the changes.
+
+    The other named arguments are used to create the ChangesFollower, for
+    example "db", "include_docs" and "error_tolerance".
+
+    :param CloudantV1 service: A client for the Cloudant service.
+    :param Callable handler: The function to call with each change.
+    :param int workers: The number of worker threads.
+    :param Executor executor: (optional) An executor to call the handler in.
+    :param int queue_size: The maximum number of changes waiting for each worker.
+    :param bool raw: True to call the handler with the decoded dict of
+           each change instead of a ChangesResultItem.
+    :param CheckpointStore checkpoint_store: (optional) A store for the sequence of the
+           processed changes. The changes are followed from the stored sequence,
+           in place of "since".
+    :param int checkpoint_interval: The minimum duration between saves of the
+           sequence set in milliseconds.
+    :return: None
+    """
+
+    def __init__(
+        self,
+        service: CloudantV1,
+        handler: Callable[[Any], Any],
+        *,
+        workers: int = _WORKERS,
+        executor: Optional[Executor] = None,
+        queue_size: int = _QUEUE_SIZE,
+        raw: bool = False,
+        checkpoint_store: Optional[CheckpointStore] = None,
+        checkpoint_interval: int = _CHECKPOINT_INTERVAL,
+        **kwargs
+    ) -> None:
+        for name, value, minimum in (
+            ('workers', workers, 1),
+            ('queue_size', queue_size, 1),
+            ('checkpoint_interval', checkpoint_interval, 0),
+        ):
+            if value < minimum:
+                raise ValueError(f'The provided {name} {value} must be at least {minimum}.')
+        self._changes_follower = ChangesFollower(service, raw=True, **kwargs)
+        self.handler = handler
+        self.workers = workers
+        self.executor = executor
+        self.raw = raw
+        self.checkpoint_store = checkpoint_store
+        self.checkpoint_interval = checkpoint_interval
+        self.error: Optional[BaseException] = None
+        self.logger = logging.getLogger(__name__)
+        self._queues: List[Queue] = [Queue(maxsize=queue_size) for _ in range(workers)]
+        self._stop = Event()
+        self._lock = Lock()
+        self._batches: Deque[_Batch] = deque()
+        self._since: Optional[str] = None
+        self._checkpoint_saver: Optional[_CheckpointSaver] = None
+        if checkpoint_store is not None:
+            self._checkpoint_saver = _CheckpointSaver(checkpoint_store, checkpoint_interval, self.logger)
+        self._threads: List[Thread] = []
+
+    @property
+    def since(self) -> Optional[str]:
+        """The sequence of the processed changes."""
+        return self._since
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """
+        Start processing all available changes and keep listening for new
+        changes, like ChangesFollower's start().
+
+        Throws RuntimeError if the ParallelChangesFollower was already started.
+        """
+        self._start(self._changes_follower.start_batches)
+
+    def start_one_off(self) -> None:
+        """
+        Start processing all available changes until there are no further
+        changes pending, like ChangesFollower's start_one_off().
+
+        Throws RuntimeError if the ParallelChangesFollower was already started.
+        """
+        self._start(self._changes_follower.start_one_off_batches)
+
+    def stop(self) -> None:
+        """
+        Stop processing the changes and wait for the workers to finish
+        the changes they are handling.
+
+        The changes waiting for the workers are not handled.
+        """
+        if not self._threads:
+            return
+        self._stop.set()
+        self._changes_follower.stop()
+        self.join()
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the ParallelChangesFollower to finish, for example when
+        start_one_off() has processed all the changes.
+
+        :param float timeout: (optional) The maximum duration to wait in seconds.
+        :return: True if the ParallelChangesFollower has finished.
+        :rtype: bool
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for thread in self._threads:
+            thread.join(None if deadline is None else max(deadline - time.monotonic(), 0))
+        return not self.is_running()
+
+    def is_running(self) -> bool:
+        """Return True while the changes are processed."""
+        return any(thread.is_alive() for thread in self._threads)
+
+    def _start(self, start_batches: Callable) -> None:
+        if self._threads:
+            raise RuntimeError('Cannot start a follower that has already started.')
+        if self._checkpoint_saver is not None:
+            checkpoint = self._checkpoint_saver.load()
+            if checkpoint is not None:
+                self.logger.debug(f'Resuming from checkpoint {checkpoint}')
+                self._changes_follower.options['since'] = checkpoint
+                self._since = checkpoint
+        batches = start_batches()
+        self._threads = [Thread(target=self._worker_callback, args=(queue,), daemon=True) for queue in self._queues]
+        self._threads.append(Thread(target=self._dispatch_callback, args=(batches,), daemon=True))
+        for thread in self._threads:
+            thread.start()
+
+    def _dispatch_callback(self, batches) -> None:
+        try:
+            for result in batches:
+                changes = result['results']
+                batch = _Batch(result['last_seq'], len(changes))
+                with self._lock:
+                    self._batches.append(batch)
+                for change in changes:
+                    worker = zlib.crc32(change['id'].encode('utf-8')) % self.workers
+                    if not self._put(self._queues[worker], (batch, change)):
+                        return
+        except Exception as e:
+            self.logger.debug(f'Exception following changes {e}')
+            self._fail(e)
+        finally:
+            # Wake the workers to finish
+            for queue in self._queues:
+                self._put(queue, None)
+
+    def _worker_callback(self, queue: Queue) -> None:
+        while not self._stop.is_set():
+            try:
+                item = queue.get(timeout=_POLL_INTERVAL)
+            except Empty:
+                continue
+            if item is None:
+                break
+            batch, change = item
+            try:
+                if not self.raw:
+                    change = ChangesResultItem.from_dict(change)
+                if self.executor is None:
+                    self.handler(change)
+                else:
+                    self.executor.submit(self.handler, change).result()
+            except Exception as e:
+                self.logger.debug(f'Exception handling change {e}')
+                self._fail(e)
+                break
+            self._processed(batch)
+        self._checkpoint(flush=True)
+
+    def _put(self, queue: Queue, item) -> bool:
+        # Waits for space in the queue, but gives up if the follower was stopped
+        return _put_unless_stopped(queue, item, self._stop, _POLL_INTERVAL)
+
+    def _processed(self, batch: _Batch) -> None:
+        with self._lock:
+            batch.outstanding -= 1
+            # Advance to the latest batch processed along with every batch before it
+            while self._batches and self._batches[0].outstanding == 0:
+                self._since = self._batches.popleft().seq
+        self._checkpoint()
+
+    def _fail(self, error: BaseException) -> None:
+        with self._lock:
+            if self.error is None:
+                self.error = error
+        self._stop.set()
+        # Stop the feed from a separate thread, it waits for the changes request
+        Thread(target=self._changes_follower.stop, daemon=True).start()
+
+    def _checkpoint(self, flush: bool = False) -> None:
+        if self._checkpoint_saver is not None:
+            self._checkpoint_saver.checkpoint(self._since, flush)
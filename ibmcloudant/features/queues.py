@@ -0,0 +1,42 @@
+# coding: utf-8
+
+# © Copyright IBM Corporation 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Common handling of the bounded queues between the threads of the features.
+"""
+from queue import Full, Queue
+from threading import Event
+
+
+def _put_unless_stopped(queue: Queue, item, stop: Event, poll_interval: float) -> bool:
+    """
+    Put an item in a bounded queue, waiting for space in the queue, but
+    give up if stop is set.
+
+    Args:
+        queue: The queue to put the item in.
+        item: The item.
+        stop: The event that is set when the consumer of the queue stopped.
+        poll_interval: The interval to check for the stop set in seconds.
+
+    Returns True if the item was put in the queue.
+    """
+    while not stop.is_set():
+        try:
+            queue.put(item, timeout=poll_interval)
+            return True
+        except Full:
+            continue
+    return False
@@ -0,0 +1,354 @@
+# coding: utf-8
+
+# © Copyright IBM Corporation 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Feature for evaluating Mango selectors on the client.
+"""
+import re
+from operator import ge, gt, le, lt
+from typing import Any, Callable, Iterable, Iterator, List, Mapping, Tuple
+
+# The value of a field that is not in the document
+_MISSING = object()
+
+_COMBINATION_OPERATORS = ('$and', '$or', '$nor', '$not')
+
+# The names of the JSON types for $type
+_TYPES = ('null', 'boolean', 'number', 'string', 'array', 'object')
+
+# The classes of the numbers, bool is not a number
+_NUMBERS = (int, float)
+
+_Predicate = Callable[[Any], bool]
+
+
+def _rank(value: Any) -> int:
+    # The position of the type of a JSON value in the collation order
+    if value is None:
+        return 0
+    if value is True or value is False:
+        return 1
+    if isinstance(value, (int, float)):
+        return 2
+    if isinstance(value, str):
+        return 3
+    if isinstance(value, list):
+        return 4
+    return 5
+
+
+def _key(value: Any) -> Tuple:
+    # A key that orders JSON values by the collation of CouchDB:
+    # null, false, true, numbers, strings, arrays then objects
+    rank = _rank(value)
+    if rank == 4:
+        return rank, [_key(item) for item in value]
+    if rank == 5:
+        return rank, [(name, _key(item)) for name, item in value.items()]
+    if rank == 0:
+        return rank, 0
+    return rank, value
+
+
+def _equals(value: Any) -> _Predicate:
+    rank = _rank(value)
+    if rank < 2:
+        return lambda v: v is value
+    if rank == 2:
+        # 1 and 1.0 are equal, but true is not 1
+        return lambda v: v == value and v is not True and v is not False
+    if rank == 3:
+        return lambda v: v == value
+    key = _key(value)
+    return lambda v: _rank(v) == rank and _key(v) == key
+
+
+def _compare(value: Any, compare: Callable[[Any, Any], bool]) -> _Predicate:
+    rank = _rank(value)
+    if rank in (2, 3):
+        types = _NUMBERS if rank == 2 else (str,)
+
+        def predicate(v):
+            if v.__class__ in types:
+                return compare(v, value)
+            return compare(_rank(v), rank)
+        return predicate
+    key = _key(value)
+    return lambda v: compare(_key(v), key)
+
+
+def _contains(values: List) -> _Predicate:
+    # Whether a value equals one of the values, by a hash lookup of the scalars
+    scalars = {(_rank(v), v) for v in values if _rank(v) < 4}
+    others = [_equals(v) for v in values if _rank(v) >= 4]
+
+    def predicate(v):
+        rank = _rank(v)
+        if rank < 4:
+            return (rank, v) in scalars
+        return any(equals(v) for equals in others)
+    return predicate
+
+
+def _remainder(dividend: int, divisor: int) -> int:
+    # The remainder with the sign of the dividend, like Erlang's rem
+    remainder = abs(dividend) % abs(divisor)
+    return -remainder if dividend < 0 else remainder
+
+
+def _is_integer(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _split_path(field: str) -> Tuple[str, ...]:
+    # Split a field path on the dots that are not escaped with a backslash
+    return tuple(part.replace('\\.', '.') for part in re.split(r'(?<!\\)\.', field))
+
+
+def _accessor(field: str) -> Callable[[Any], Any]:
+    path = _split_path(field)
+    if len(path) == 1:
+        name = path[0]
+
+        def get(doc):
+            if isinstance(doc, dict):
+                return doc.get(name, _MISSING)
+            return _MISSING
+        return get
+
+    def get_path(doc):
+        value = doc
+        for name in path:
+            if isinstance(value, dict):
+                value = value.get(name, _MISSING)
+                if value is _MISSING:
+                    return value
+            elif isinstance(value, list) and name.isdigit() and int(name) < len(value):
+                value = value[int(name)]
+            else:
+                return _MISSING
+        return value
+    return get_path
+
+
+def _list_argument(operator: str, argument: Any) -> List:
+    if not isinstance(argument, list):
+        raise ValueError(f'The argument of {operator} must be an array.')
+    return argument
+
+
+def _compile_selector(selector: Any) -> _Predicate:
+    # Compile a selector to a predicate of a value
+    if not isinstance(selector, dict):
+        raise ValueError('A selector must be an object.')
+    predicates = []
+    for name, argument in selector.items():
+        if name in _COMBINATION_OPERATORS:
+            predicates.append(_compile_combination(name, argument, _compile_selector))
+        elif name.startswith('$'):
+            # An operator of the value itself, for example in $elemMatch
+            predicates.append(_compile_field_condition(lambda v: v, {name: argument}))
+        else:
+            predicates.append(_compile_field_condition(_accessor(name), argument))
+    return _all(predicates)
+
+
+def _compile_combination(operator: str, argument: Any, compile_item: Callable[[Any], _Predicate]) -> _Predicate:
+    if operator == '$not':
+        predicate = compile_item(argument)
+        return lambda v: not predicate(v)
+    predicates = [compile_item(item) for item in _list_argument(operator, argument)]
+    if operator == '$and':
+        return _all(predicates)
+    if operator == '$or':
+        return lambda v: any(predicate(v) for predicate in predicates)
+    return lambda v: not any(predicate(v) for predicate in predicates)
+
+
+def _all(predicates: List[_Predicate]) -> _Predicate:
+    if not predicates:
+        return lambda v: True
+    if len(predicates) == 1:
+        return predicates[0]
+    if len(predicates) == 2:
+        first, second = predicates
+        return lambda v: first(v) and second(v)
+    return lambda v: all(predicate(v) for predicate in predicates)
+
+
+def _compile_field_condition(get: Callable[[Any], Any], condition: Any) -> _Predicate:
+    # Compile the condition of a field to a predicate of the value it is in
+    predicate, if_missing = _compile_condition(condition)
+
+    def field_predicate(doc):
+        value = get(doc)
+        if value is _MISSING:
+            return if_missing
+        return predicate(value)
+    return field_predicate
+
+
+def _compile_condition(condition: Any) -> Tuple[_Predicate, bool]:
+    # Compile a field condition to a predicate of a present field and
+    # the result for a missing field
+    if not isinstance(condition, dict) or not condition:
+        return _equals(condition), False
+    if not any(name.startswith('$') for name in condition):
+        # A nested field, {"a": {"b": 1}} is {"a.b": 1}
+        return _compile_selector(condition), False
+    compiled = []
+    for operator, argument in condition.items():
+        if operator in _COMBINATION_OPERATORS:
+            compiled.append(_compile_condition_combination(operator, argument))
+        else:
+            compiled.append((_compile_operator(operator, argument), operator == '$exists' and not argument))
+    if len(compiled) == 1:
+        return compiled[0]
+    predicates = [predicate for predicate, _ in compiled]
+    return _all(predicates), all(if_missing for _, if_missing in compiled)
+
+
+def _compile_condition_combination(operator: str, argument: Any) -> Tuple[_Predicate, bool]:
+    if operator == '$not':
+        predicate, if_missing = _compile_condition(argument)
+        return (lambda v: not predicate(v)), not if_missing
+    compiled = [_compile_condition(item) for item in _list_argument(operator, argument)]
+    predicates = [predicate for predicate, _ in compiled]
+    missing = [if_missing for _, if_missing in compiled]
+    if operator == '$and':
+        return _all(predicates), all(missing)
+    if operator == '$or':
+        return (lambda v: any(predicate(v) for predicate in predicates)), any(missing)
+    return (lambda v: not any(predicate(v) for predicate in predicates)), not any(missing)
+
+
+def _compile_operator(operator: str, argument: Any) -> _Predicate:
+    # Compile a condition operator to a predicate of a present field
+    if operator == '$eq':
+        return _equals(argument)
+    if operator == '$ne':
+        equals = _equals(argument)
+        return lambda v: not equals(v)
+    if operator == '$gt':
+        return _compare(argument, gt)
+    if operator == '$gte':
+        return _compare(argument, ge)
+    if operator == '$lt':
+        return _compare(argument, lt)
+    if operator == '$lte':
+        return _compare(argument, le)
+    if operator == '$exists':
+        if not isinstance(argument, bool):
+            raise ValueError('The argument of $exists must be a boolean.')
+        return lambda v: argument
+    if operator == '$type':
+        if argument not in _TYPES:
+            raise ValueError(f"The argument of $type must be one of {', '.join(_TYPES)}.")
+        rank = _TYPES.index(argument)
+        if rank == 1:
+            return lambda v: v is True or v is False
+        return lambda v: _rank(v) == rank
+    if operator in ('$in', '$nin'):
+        contains = _contains(_list_argument(operator, argument))
+
+        def predicate(v):
+            if isinstance(v, list):
+                return any(contains(item) for item in v)
+            return contains(v)
+        if operator == '$in':
+            return predicate
+        return lambda v: not predicate(v)
+    if operator == '$all':
+        equals = [_equals(item) for item in _list_argument(operator, argument)]
+        return lambda v: isinstance(v, list) and all(any(e(item) for item in v) for e in equals)
+    if operator == '$size':
+        if not _is_integer(argument):
+            raise ValueError('The argument of $size must be an integer.')
+        return lambda v: isinstance(v, list) and len(v) == argument
+    if operator == '$mod':
+        if (not isinstance(argument, list) or len(argument) != 2 or not all(_is_integer(a) for a in argument)
+                or argument[0] == 0):
+            raise ValueError('The argument of $mod must be an array of a non-zero divisor and a remainder.')
+        divisor, remainder = argument
+        return lambda v: _is_integer(v) and _remainder(v, divisor) == remainder
+    if operator == '$regex':
+        if not isinstance(argument, str):
+            raise ValueError('The argument of $regex must be a string.')
+        search = re.compile(argument).search
+        return lambda v: isinstance(v, str) and search(v) is not None
+    if operator == '$beginsWith':
+        if not isinstance(argument, str):
+            raise ValueError('The argument of $beginsWith must be a string.')
+        return lambda v: isinstance(v, str) and v.startswith(argument)
+    if operator == '$elemMatch':
+        matches = _compile_selector(argument)
+        return lambda v: isinstance(v, list) and any(matches(item) for item in v)
+    if operator == '$allMatch':
+        matches = _compile_selector(argument)
+        return lambda v: isinstance(v, list) and len(v) > 0 and all(matches(item) for item in v)
+    if operator == '$keyMapMatch':
+        matches = _compile_selector(argument)
+        return lambda v: isinstance(v, dict) and any(matches(key) for key in v)
+    raise ValueError(f'The operator {operator} is not supported.')
+
+
+class Selector:
+    """
+    Selector evaluates a Mango selector, as used by "post_find" and the
+    "_selector" filter of the changes feed, on documents in the client.
+
+    The selector is compiled once to a predicate of nested functions, with
+    the field paths split and the regular expressions compiled, so it can
+    filter documents from a DocumentCache, a local copy of a database or
+    the docs of an include_docs changes feed without a request.
+
+    As with Cloudant a field condition does not match a document without
+    the field, except {"$exists": false} and conditions negated by $not,
+    and the comparison operators order the values of different types by
+    the collation of the views: null, false, true, numbers, strings, arrays
+    then objects. Strings are compared by their code points, which differs
+    from the ICU collation of Cloudant for strings with mixed case or
+    accents. The $text operator of the text indexes is not supported.
+
+    Throws ValueError if the selector is invalid or has an operator that
+    is not supported.
+
+    :param dict selector: The Mango selector.
+    :return: None
+    """
+
+    def __init__(self, selector: Mapping[str, Any]) -> None:
+        self.selector = selector
+        self._predicate = _compile_selector(selector)
+
+    def matches(self, doc: Mapping[str, Any]) -> bool:
+        """
+        Return True if the document matches the selector.
+
+        :param dict doc: The document.
+        :rtype: bool
+        """
+        return self._predicate(doc)
+
+    __call__ = matches
+
+    def filter(self, docs: Iterable[Mapping[str, Any]]) -> Iterator[Mapping[str, Any]]:
+        """
+        Return the documents that match the selector.
+
+        :param Iterable[dict] docs: The documents.
+        :rtype: Iterator[dict]
+        """
+        return filter(self._predicate, docs)
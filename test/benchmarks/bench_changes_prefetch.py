@@ -0,0 +1,109 @@
+# coding: utf-8
+
+# © Copyright IBM Corporation 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of catching up a changes feed backlog with different
+read-ahead depths of the changes follower.
+
+The requests and the processing of each batch are simulated with sleeps.
+The request latency varies, as it does for a real service, so a deeper
+read-ahead lets the consumer continue through slow requests.
+The speedups are relative to requesting each batch only after processing
+the previous batch, without overlap. A prefetch_batches of 1 is the
+read-ahead of earlier versions of the follower.
+
+Run with:
+    PYTHONPATH=. python test/benchmarks/bench_changes_prefetch.py
+"""
+
+import random
+import time
+import timeit
+
+from ibm_cloud_sdk_core import DetailedResponse
+
+from ibmcloudant.features.changes_follower import _ChangesFollowerIterator, _Mode
+
+BATCHES = 100
+BATCH_SIZE = 100
+# seconds, the request latency is uniformly distributed up to the maximum
+MAX_REQUEST_LATENCY = 0.04
+# seconds to process each batch
+BATCH_PROCESSING = 0.02
+
+
+def make_batches() -> list[dict]:
+    batches = []
+    for batch in range(BATCHES):
+        results = [{'id': f'doc{i:08}', 'seq': f'{i}-abc', 'changes': [{'rev': '1-abc'}]}
+                   for i in range(batch * BATCH_SIZE, (batch + 1) * BATCH_SIZE)]
+        batches.append({'results': results, 'last_seq': f'{(batch + 1) * BATCH_SIZE}-abc',
+                        'pending': (BATCHES - batch - 1) * BATCH_SIZE})
+    return batches
+
+
+def make_post_changes(batches: list[dict]):
+    latencies = random.Random(42)
+    batch_iter = iter(batches)
+
+    def post_changes(since):
+        time.sleep(latencies.uniform(0, MAX_REQUEST_LATENCY))
+        return DetailedResponse(response=next(batch_iter))
+
+    return post_changes
+
+
+def bench_serial(batches: list[dict]) -> float:
+    post_changes = make_post_changes(batches)
+
+    def run():
+        since = '0'
+        while True:
+            result = post_changes(since).get_result()
+            since = result['last_seq']
+            time.sleep(BATCH_PROCESSING)
+            if result['pending'] == 0:
+                break
+
+    return timeit.timeit(run, number=1)
+
+
+def bench_catch_up(batches: list[dict], prefetch_batches: int) -> float:
+    post_changes = make_post_changes(batches)
+
+    def run():
+        follower_iter = _ChangesFollowerIterator(post_changes, _Mode.FINITE, 0, True, prefetch_batches)
+        follower_iter._start()
+        for count, _ in enumerate(follower_iter, start=1):
+            if count % BATCH_SIZE == 0:
+                time.sleep(BATCH_PROCESSING)
+        return count
+
+    return timeit.timeit(run, number=1)
+
+
+def main():
+    batches = make_batches()
+    baseline = bench_serial(batches)
+    print(f'{"prefetch_batches":<20}{"seconds":>10}{"speedup":>10}')
+    print(f'{"none (serial)":<20}{baseline:>10.2f}{1:>9.2f}x')
+    for prefetch_batches in (1, 2, 3, 8):
+        seconds = bench_catch_up(batches, prefetch_batches)
+        print(f'{prefetch_batches:<20}{seconds:>10.2f}{baseline / seconds:>9.2f}x')
+
+
+if __name__ == '__main__':
+    main()
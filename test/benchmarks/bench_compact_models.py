@@ -0,0 +1,86 @@
+# coding: utf-8
+
+# © Copyright IBM Corporation 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of the memory held by many result rows and items
+for the usual and compact models.
+
+The memory is measured with tracemalloc after decoding the rows from
+dicts, so it includes the nested models but not the decoded JSON.
+
+Run with:
+    PYTHONPATH=. python test/benchmarks/bench_compact_models.py
+"""
+
+import gc
+import tracemalloc
+
+from ibmcloudant.cloudant_v1 import ChangesResultItem, DocsResultRow, DocumentResult, SearchResultRow, ViewResultRow
+from ibmcloudant.features.compact_models import (CompactChangesResultItem, CompactDocsResultRow,
+                                                 CompactDocumentResult, CompactSearchResultRow,
+                                                 CompactViewResultRow)
+
+ROWS = 200_000
+
+
+def view_row(i: int) -> dict:
+    return {'id': f'doc{i:08}', 'key': i, 'value': 1}
+
+
+def docs_row(i: int) -> dict:
+    return {'id': f'doc{i:08}', 'key': f'doc{i:08}', 'value': {'rev': f'1-{i:032x}'}}
+
+
+def changes_item(i: int) -> dict:
+    return {'id': f'doc{i:08}', 'seq': f'{i}-abc', 'changes': [{'rev': f'1-{i:032x}'}]}
+
+
+def search_row(i: int) -> dict:
+    return {'id': f'doc{i:08}', 'fields': {'name': 'x'}}
+
+
+def document_result(i: int) -> dict:
+    return {'id': f'doc{i:08}', 'rev': f'1-{i:032x}', 'ok': True}
+
+
+def held_bytes(model: type, dicts: list[dict]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    instances = [model.from_dict(d) for d in dicts]
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del instances
+    return held
+
+
+def main():
+    print(f'{"model":<20}{"model MB":>12}{"compact MB":>12}{"reduction":>11}')
+    for model, compact_model, make in (
+        (ViewResultRow, CompactViewResultRow, view_row),
+        (DocsResultRow, CompactDocsResultRow, docs_row),
+        (ChangesResultItem, CompactChangesResultItem, changes_item),
+        (SearchResultRow, CompactSearchResultRow, search_row),
+        (DocumentResult, CompactDocumentResult, document_result),
+    ):
+        dicts = [make(i) for i in range(ROWS)]
+        model_bytes = held_bytes(model, dicts)
+        compact_bytes = held_bytes(compact_model, dicts)
+        print(f'{model.__name__:<20}{model_bytes / 2**20:>12.1f}{compact_bytes / 2**20:>12.1f}'
+              f'{1 - compact_bytes / model_bytes:>10.0%}')
+
+
+if __name__ == '__main__':
+    main()
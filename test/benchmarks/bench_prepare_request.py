@@ -0,0 +1,83 @@
+# coding: utf-8
+
+# © Copyright IBM Corporation 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Microbenchmark of the request preparation overhead per call.
+
+Compares the cached SDK headers and operation ID lookup with the
+previous approach of formatting the headers and parsing the operation
+ID from the analytics header on every request, and measures the whole
+preparation of a request by an operation without sending it.
+
+Run with:
+    PYTHONPATH=. python test/benchmarks/bench_prepare_request.py
+"""
+
+import timeit
+from unittest.mock import patch
+
+from ibm_cloud_sdk_core.authenticators import NoAuthAuthenticator
+
+from ibmcloudant import common
+from ibmcloudant.cloudant_v1 import CloudantV1
+
+NUMBER = 100_000
+REPEAT = 5
+
+
+def uncached_sdk_headers(service_name, service_version, operation_id):
+    headers = {}
+    headers[common.SDK_ANALYTICS_HEADER] = common.get_sdk_analytics(service_name, service_version, operation_id)
+    headers[common.USER_AGENT_HEADER] = common.get_user_agent()
+    return headers
+
+
+def parsed_operation_id(headers):
+    operation_id = None
+    header = headers.get('X-IBMCloud-SDK-Analytics')
+    if header is not None:
+        for element in header.split(';'):
+            if element.startswith('operation_id'):
+                operation_id = element.split('=')[1]
+                break
+    return operation_id
+
+
+def per_call_us(statement) -> float:
+    return min(timeit.repeat(statement, number=NUMBER, repeat=REPEAT)) / NUMBER * 1e6
+
+
+def main():
+    headers = common.get_sdk_headers('cloudant', 'V1', 'get_document')
+    print(f'{"benchmark":<28}{"per call us":>14}')
+    for name, statement in (
+        ('uncached sdk headers', lambda: uncached_sdk_headers('cloudant', 'V1', 'get_document')),
+        ('cached sdk headers', lambda: common.get_sdk_headers('cloudant', 'V1', 'get_document')),
+        ('parsed operation id', lambda: parsed_operation_id(headers)),
+        ('looked up operation id', lambda: common.get_operation_id(headers)),
+    ):
+        print(f'{name:<28}{per_call_us(statement):>14.3f}')
+
+    client = CloudantV1(authenticator=NoAuthAuthenticator())
+    client.set_service_url('http://localhost:5984')
+    # Return the prepared request instead of sending it
+    with patch.object(CloudantV1, 'send', lambda self, request, **kwargs: request):
+        print(f'{"get_document prepare":<28}'
+              f'{per_call_us(lambda: client.get_document(db="db", doc_id="doc")):>14.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+# coding: utf-8
+
+# © Copyright IBM Corporation 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of rows per second for model and raw modes of
+pagination and the changes follower.
+
+The responses are generated in memory so the benchmark measures only the
+client side processing of the results, not the network or JSON decoding.
+
+Run with:
+    PYTHONPATH=. python test/benchmarks/bench_raw_rows.py
+"""
+
+import timeit
+from unittest.mock import patch
+
+from ibm_cloud_sdk_core import DetailedResponse
+from ibm_cloud_sdk_core.authenticators import NoAuthAuthenticator
+
+from ibmcloudant.cloudant_v1 import CloudantV1
+from ibmcloudant.features.changes_follower import _ChangesFollowerIterator, _Mode
+from ibmcloudant.features.pagination import PagerType, Pagination
+
+PAGES = 250
+PAGE_SIZE = 200
+BATCHES = 10
+BATCH_SIZE = 5000
+REPEAT = 3
+
+
+def make_doc(i: int) -> dict:
+    return {
+        '_id': f'doc{i:08}',
+        '_rev': f'1-{i:032x}',
+        'type': 'order',
+        'total': i * 1.5,
+        'items': [{'sku': f'sku{j}', 'quantity': j} for j in range(3)],
+    }
+
+
+def make_view_pages() -> list[dict]:
+    pages = []
+    for page in range(PAGES):
+        start = page * PAGE_SIZE
+        # n+1 paging returns an extra row for all but the last page
+        end = start + PAGE_SIZE + (1 if page < PAGES - 1 else 0)
+        rows = [{'id': f'doc{i:08}', 'key': i, 'value': 1, 'doc': make_doc(i)} for i in range(start, end)]
+        pages.append({'total_rows': PAGES * PAGE_SIZE, 'offset': start, 'rows': rows})
+    return pages
+
+
+def make_changes_batches() -> list[dict]:
+    batches = []
+    for batch in range(BATCHES):
+        results = [{'id': f'doc{i:08}', 'seq': f'{i}-abc', 'changes': [{'rev': f'1-{i:032x}'}], 'doc': make_doc(i)}
+                   for i in range(batch * BATCH_SIZE, (batch + 1) * BATCH_SIZE)]
+        batches.append({'results': results, 'last_seq': f'{(batch + 1) * BATCH_SIZE}-abc',
+                        'pending': (BATCHES - batch - 1) * BATCH_SIZE})
+    return batches
+
+
+def bench_pagination(client: CloudantV1, pages: list[dict], raw: bool) -> float:
+    def run():
+        page_iter = iter(pages)
+        # Copy the rows for each request because the n+1 row is removed from the page
+        def post_view(*args, **kwargs):
+            page = next(page_iter)
+            return DetailedResponse(response={**page, 'rows': list(page['rows'])})
+        with patch('ibmcloudant.cloudant_v1.CloudantV1.post_view', post_view):
+            pagination = Pagination.new_pagination(
+                client, PagerType.POST_VIEW, raw=raw, db='db', ddoc='ddoc', view='view', include_docs=True)
+            return sum(1 for _ in pagination.rows())
+    rows = run()
+    best = min(timeit.repeat(run, number=1, repeat=REPEAT))
+    return rows / best
+
+
+def bench_changes(batches: list[dict], raw: bool) -> float:
+    def run():
+        batch_iter = iter(batches)
+        follower_iter = _ChangesFollowerIterator(
+            lambda since: DetailedResponse(response=next(batch_iter)), _Mode.FINITE, 0, raw)
+        follower_iter._start()
+        return sum(1 for _ in follower_iter)
+    changes = run()
+    best = min(timeit.repeat(run, number=1, repeat=REPEAT))
+    return changes / best
+
+
+def main():
+    client = CloudantV1(authenticator=NoAuthAuthenticator())
+    client.set_service_url('http://localhost:5984')
+    pages = make_view_pages()
+    batches = make_changes_batches()
+    print(f'{"benchmark":<24}{"model rows/s":>16}{"raw rows/s":>16}{"speedup":>10}')
+    for name, bench in (
+        ('pagination view rows', lambda raw: bench_pagination(client, pages, raw)),
+        ('changes follower items', lambda raw: bench_changes(batches, raw)),
+    ):
+        model_rate = bench(False)
+        raw_rate = bench(True)
+        print(f'{name:<24}{model_rate:>16,.0f}{raw_rate:>16,.0f}{raw_rate / model_rate:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
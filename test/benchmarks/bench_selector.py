@@ -0,0 +1,153 @@
+# coding: utf-8
+
+# © Copyright IBM Corporation 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of filtering documents with a compiled Selector compared to a
+naive interpreter that walks the selector for every document.
+
+The interpreter splits the field paths, compiles the regular expressions
+(through the cache of the re module) and dispatches on the operator names
+for each document, which the Selector does once when it is created.
+
+Run with:
+    PYTHONPATH=. python test/benchmarks/bench_selector.py
+"""
+
+import random
+import re
+import timeit
+
+from ibmcloudant import Selector
+
+DOCS = 20000
+REPEAT = 5
+
+SELECTORS = {
+    'equality': {'type': 'order', 'status': 'shipped'},
+    'range': {'total': {'$gte': 100, '$lt': 500}, 'customer.country': 'GB'},
+    'in and regex': {'status': {'$in': ['new', 'paid']}, 'customer.email': {'$regex': '@example\\.com$'}},
+    'or': {'$or': [{'total': {'$gt': 900}}, {'customer.vip': True}, {'tags': {'$all': ['gift', 'express']}}]},
+    'elemMatch': {'items': {'$elemMatch': {'sku': {'$regex': '^B'}, 'quantity': {'$gte': 3}}}},
+}
+
+
+def make_docs() -> list:
+    rnd = random.Random(42)
+    docs = []
+    for i in range(DOCS):
+        docs.append({
+            '_id': f'order{i:08}',
+            'type': 'order',
+            'status': rnd.choice(['new', 'paid', 'shipped', 'cancelled']),
+            'total': rnd.randint(1, 1000),
+            'tags': rnd.sample(['gift', 'express', 'fragile', 'bulk'], rnd.randint(0, 3)),
+            'customer': {
+                'email': f'user{i}@{rnd.choice(["example.com", "example.org"])}',
+                'country': rnd.choice(['GB', 'US', 'FR', 'DE']),
+                'vip': rnd.random() < 0.05,
+            },
+            'items': [{'sku': f'{rnd.choice("ABC")}{rnd.randint(0, 999):03}', 'quantity': rnd.randint(1, 5)}
+                      for _ in range(rnd.randint(1, 5))],
+        })
+    return docs
+
+
+_MISSING = object()
+
+
+def naive_get(doc, field):
+    value = doc
+    for name in field.split('.'):
+        if not isinstance(value, dict) or name not in value:
+            return _MISSING
+        value = value[name]
+    return value
+
+
+def naive_match(selector, value) -> bool:
+    # Interpret the selector for a value, without the collation of
+    # values of different types
+    for name, argument in selector.items():
+        if name == '$and':
+            if not all(naive_match(s, value) for s in argument):
+                return False
+        elif name == '$or':
+            if not any(naive_match(s, value) for s in argument):
+                return False
+        elif name == '$not':
+            if naive_match(argument, value):
+                return False
+        elif name.startswith('$'):
+            if not naive_operator(name, argument, value):
+                return False
+        else:
+            field = naive_get(value, name)
+            if field is _MISSING:
+                if argument != {'$exists': False}:
+                    return False
+            elif isinstance(argument, dict) and any(key.startswith('$') for key in argument):
+                if not naive_match(argument, field):
+                    return False
+            elif field != argument:
+                return False
+    return True
+
+
+def naive_operator(operator, argument, value) -> bool:
+    if operator == '$eq':
+        return value == argument
+    if operator == '$gt':
+        return value > argument
+    if operator == '$gte':
+        return value >= argument
+    if operator == '$lt':
+        return value < argument
+    if operator == '$lte':
+        return value <= argument
+    if operator == '$in':
+        if isinstance(value, list):
+            return any(item in argument for item in value)
+        return value in argument
+    if operator == '$all':
+        return isinstance(value, list) and all(item in value for item in argument)
+    if operator == '$regex':
+        return isinstance(value, str) and re.search(argument, value) is not None
+    if operator == '$exists':
+        return argument
+    if operator == '$elemMatch':
+        return isinstance(value, list) and any(naive_match(argument, item) for item in value)
+    raise ValueError(f'Unsupported operator {operator}')
+
+
+def bench(predicate, docs) -> float:
+    return min(timeit.repeat(lambda: sum(1 for doc in docs if predicate(doc)), number=1, repeat=REPEAT))
+
+
+def main() -> None:
+    docs = make_docs()
+    print(f'Filtering {DOCS} documents')
+    print(f'{"selector":>14} {"matches":>8} {"naive ms":>9} {"compiled ms":>12} {"speedup":>8}')
+    for name, selector in SELECTORS.items():
+        compiled = Selector(selector)
+        matches = [doc['_id'] for doc in docs if compiled(doc)]
+        assert matches == [doc['_id'] for doc in docs if naive_match(selector, doc)], name
+        naive = bench(lambda doc, s=selector: naive_match(s, doc), docs)
+        fast = bench(compiled, docs)
+        print(f'{name:>14} {len(matches):>8} {naive * 1000:>9.1f} {fast * 1000:>12.1f} {naive / fast:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,162 @@
+# coding: utf-8
+
+# © Copyright IBM Corporation 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Test the coalescing of document reads
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Lock, Thread
+from unittest.mock import patch
+
+from conftest import MockClientBaseCase
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+
+from ibmcloudant.cloudant_v1 import BulkGetResultDocument
+from ibmcloudant.features.bulk_reader import BulkReader
+
+
+class BulkGetMockOperation:
+    """
+    Test class for mocking post_bulk_get and recording the requests.
+    """
+    def __init__(self, missing_ids: tuple = (), delay: float = 0):
+        self.requests: list[dict] = []
+        self.lock = Lock()
+        self.missing_ids = missing_ids
+        self.delay = delay
+
+    def __call__(self, *args, **kwargs) -> DetailedResponse:
+        with self.lock:
+            self.requests.append(kwargs)
+        time.sleep(self.delay)
+        results = []
+        for doc in kwargs['docs']:
+            if doc['id'] in self.missing_ids:
+                result = {'error': {'id': doc['id'], 'rev': 'undefined', 'error': 'not_found', 'reason': 'missing'}}
+            else:
+                result = {'ok': {'_id': doc['id'], '_rev': doc.get('rev', '1-abc'), 'value': doc['id']}}
+            results.append({'id': doc['id'], 'docs': [result]})
+        return DetailedResponse(response={'results': results})
+
+
+class TestBulkReader(MockClientBaseCase):
+
+    def test_coalesces_concurrent_reads(self):
+        mock = BulkGetMockOperation()
+        with patch('ibmcloudant.cloudant_v1.CloudantV1.post_bulk_get', mock):
+            with BulkReader(self.client, 'db', batch_size=50, linger=50) as reader:
+                with ThreadPoolExecutor(max_workers=20) as callers:
+                    docs = list(callers.map(lambda i: reader.get(f'doc{i}').result(timeout=5), range(100)))
+        self.assertEqual([doc.ok._id for doc in docs], [f'doc{i}' for i in range(100)])
+        self.assertTrue(all(isinstance(doc, BulkGetResultDocument) for doc in docs))
+        self.assertLessEqual(len(mock.requests), 10, 'The reads should be coalesced into few requests.')
+        self.assertTrue(all(len(request['docs']) <= 50 for request in mock.requests))
+
+    def test_duplicate_reads(self):
+        mock = BulkGetMockOperation()
+        with patch('ibmcloudant.cloudant_v1.CloudantV1.post_bulk_get', mock):
+            with BulkReader(self.client, 'db', linger=10000) as reader:
+                first = reader.get('doc0')
+                second = reader.get('doc0')
+                with_rev = reader.get('doc0', rev='2-def')
+        self.assertIs(first, second)
+        self.assertEqual(mock.requests[0]['docs'], [{'id': 'doc0'}, {'id': 'doc0', 'rev': '2-def'}])
+        self.assertEqual(with_rev.result().ok._rev, '2-def')
+
+    def test_missing_document(self):
+        mock = BulkGetMockOperation(missing_ids=('doc1',))
+        with patch('ibmcloudant.cloudant_v1.CloudantV1.post_bulk_get', mock):
+            with BulkReader(self.client, 'db') as reader:
+                futures = [reader.get(f'doc{i}') for i in range(3)]
+        results = [future.result() for future in futures]
+        self.assertIsNone(results[1].ok)
+        self.assertEqual(results[1].error.error, 'not_found')
+        self.assertEqual(results[2].ok._id, 'doc2')
+
+    def test_options(self):
+        mock = BulkGetMockOperation()
+        with patch('ibmcloudant.cloudant_v1.CloudantV1.post_bulk_get', mock):
+            with BulkReader(self.client, 'db', revs=True, attachments=True) as reader:
+                reader.get('doc0')
+        self.assertEqual(mock.requests[0]['revs'], True)
+        self.assertEqual(mock.requests[0]['attachments'], True)
+
+    def test_parallel_batches(self):
+        mock = BulkGetMockOperation(delay=0.05)
+        with patch('ibmcloudant.cloudant_v1.CloudantV1.post_bulk_get', mock):
+            with BulkReader(self.client, 'db', batch_size=10, max_in_flight=4) as reader:
+                start = time.monotonic()
+                futures = [reader.get(f'doc{i}') for i in range(40)]
+                for future in futures:
+                    future.result(timeout=5)
+                elapsed = time.monotonic() - start
+        self.assertEqual(len(mock.requests), 4)
+        self.assertLess(elapsed, 0.15, 'The batches should be sent in parallel.')
+
+    def test_request_error(self):
+        def failing_operation(*args, **kwargs):
+            raise ApiException(500, message='internal server error')
+        with patch('ibmcloudant.cloudant_v1.CloudantV1.post_bulk_get', failing_operation):
+            with BulkReader(self.client, 'db') as reader:
+                future = reader.get('doc0')
+        with self.assertRaises(ApiException):
+            future.result()
+
+    def test_short_response(self):
+        def short_operation(*args, **kwargs):
+            doc = kwargs['docs'][0]
+            return DetailedResponse(response={'results': [{'id': doc['id'], 'docs': [{'ok': {'_id': doc['id']}}]}]})
+        with patch('ibmcloudant.cloudant_v1.CloudantV1.post_bulk_get', short_operation):
+            with BulkReader(self.client, 'db', linger=10000) as reader:
+                futures = [reader.get(f'doc{i}') for i in range(3)]
+        for future in futures:
+            with self.assertRaisesRegex(ValueError, 'Expected 3 results for the batch but received 1.'):
+                future.result()
+
+    def test_get_blocks_when_behind(self):
+        release = Event()
+        mock = BulkGetMockOperation()
+        def blocking_operation(*args, **kwargs):
+            release.wait()
+            return mock(*args, **kwargs)
+        with patch('ibmcloudant.cloudant_v1.CloudantV1.post_bulk_get', blocking_operation):
+            reader = BulkReader(self.client, 'db', batch_size=2, max_in_flight=1, linger=0)
+            futures = [reader.get(f'doc{i}') for i in range(6)]
+            get_done = Event()
+            def get():
+                futures.append(reader.get('blocked'))
+                get_done.set()
+            thread = Thread(target=get)
+            thread.start()
+            self.assertFalse(get_done.wait(0.2), 'The get should block while the reader is behind.')
+            release.set()
+            self.assertTrue(get_done.wait(5))
+            reader.close()
+        self.assertEqual([future.result().ok._id for future in futures], [f'doc{i}' for i in range(6)] + ['blocked'])
+
+    def test_invalid_options(self):
+        with self.assertRaisesRegex(ValueError, "The option 'docs' is invalid when using BulkReader."):
+            BulkReader(self.client, 'db', docs=[])
+        with self.assertRaisesRegex(ValueError, "The option 'latest' is invalid when using BulkReader."):
+            BulkReader(self.client, 'db', latest=True)
+        with self.assertRaisesRegex(ValueError, 'The provided linger -1 must be at least 0.'):
+            BulkReader(self.client, 'db', linger=-1)
+        reader = BulkReader(self.client, 'db')
+        reader.close()
+        with self.assertRaisesRegex(ValueError, 'The BulkReader is closed.'):
+            reader.get('doc0')
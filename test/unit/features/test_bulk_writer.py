@@ -0,0 +1,164 @@
+# coding: utf-8
+
+# © Copyright IBM Corporation 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Test the batching of document writes
+"""
+
+import json
+import time
+from threading import Event, Lock, Thread
+from unittest.mock import patch
+
+from conftest import MockClientBaseCase
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+
+from ibmcloudant.cloudant_v1 import Document, DocumentResult
+from ibmcloudant.features.bulk_writer import BulkWriter
+
+
+class BulkDocsMockOperation:
+    """
+    Test class for mocking post_bulk_docs and recording the batches.
+    """
+    def __init__(self, delay: float = 0, conflict_ids: tuple = ()):
+        self.batches: list[list[dict]] = []
+        self.lock = Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.delay = delay
+        self.conflict_ids = conflict_ids
+
+    def __call__(self, *args, **kwargs) -> DetailedResponse:
+        docs = json.loads(kwargs['bulk_docs'].read())['docs']
+        with self.lock:
+            self.batches.append(docs)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            return DetailedResponse(response=[
+                {'id': doc['_id'], 'error': 'conflict', 'reason': 'Document update conflict.'}
+                if doc['_id'] in self.conflict_ids else {'id': doc['_id'], 'rev': '1-abc', 'ok': True}
+                for doc in docs
+            ])
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+class TestBulkWriter(MockClientBaseCase):
+
+    def test_batch_size(self):
+        mock = BulkDocsMockOperation()
+        with patch('ibmcloudant.cloudant_v1.CloudantV1.post_bulk_docs', mock):
+            with BulkWriter(self.client, 'db', batch_size=10, linger=10000) as writer:
+                futures = [writer.write({'_id': f'doc{i}', 'value': i}) for i in range(25)]
+            results = [future.result(timeout=1) for future in futures]
+        self.assertEqual([len(batch) for batch in mock.batches], [10, 10, 5])
+        self.assertEqual([result.id for result in results], [f'doc{i}' for i in range(25)])
+        self.assertTrue(all(isinstance(result, DocumentResult) and result.ok for result in results))
+
+    def test_batch_bytes(self):
+        mock = BulkDocsMockOperation()
+        with patch('ibmcloudant.cloudant_v1.CloudantV1.post_bulk_docs', mock):
+            with BulkWriter(self.client, 'db', batch_bytes=250, linger=10000) as writer:
+                for i in range(10):
+                    writer.write({'_id': f'doc{i}', 'data': 'x' * 90})
+                writer.write({'_id': 'large', 'data': 'x' * 1000})
+        self.assertEqual([len(batch) for batch in mock.batches], [2, 2, 2, 2, 2, 1])
+
+    def test_linger(self):
+        mock = BulkDocsMockOperation()
+        with patch('ibmcloudant.cloudant_v1.CloudantV1.post_bulk_docs', mock):
+            with BulkWriter(self.client, 'db', linger=20) as writer:
+                future = writer.write(Document(_id='doc0', value=1))
+                self.assertEqual(future.result(timeout=5).id, 'doc0')
+                self.assertEqual(mock.batches, [[{'_id': 'doc0', 'value': 1}]])
+
+    def test_flush(self):
+        mock = BulkDocsMockOperation()
+        with patch('ibmcloudant.cloudant_v1.CloudantV1.post_bulk_docs', mock):
+            writer = BulkWriter(self.client, 'db', linger=60000)
+            futures = [writer.write({'_id': f'doc{i}'}) for i in range(3)]
+            writer.flush()
+            self.assertTrue(all(future.done() for future in futures))
+            writer.close()
+
+    def test_max_in_flight(self):
+        mock = BulkDocsMockOperation(delay=0.02)
+        with patch('ibmcloudant.cloudant_v1.CloudantV1.post_bulk_docs', mock):
+            with BulkWriter(self.client, 'db', batch_size=5, max_in_flight=3) as writer:
+                for i in range(100):
+                    writer.write({'_id': f'doc{i}'})
+        self.assertEqual(sum(len(batch) for batch in mock.batches), 100)
+        self.assertLessEqual(mock.max_in_flight, 3)
+        self.assertGreater(mock.max_in_flight, 1)
+
+    def test_document_error(self):
+        mock = BulkDocsMockOperation(conflict_ids=('doc1',))
+        with patch('ibmcloudant.cloudant_v1.CloudantV1.post_bulk_docs', mock):
+            with BulkWriter(self.client, 'db') as writer:
+                futures = [writer.write({'_id': f'doc{i}'}) for i in range(3)]
+        self.assertEqual([future.result().error for future in futures], [None, 'conflict', None])
+
+    def test_request_error(self):
+        calls = []
+        def failing_operation(*args, **kwargs):
+            calls.append(kwargs)
+            raise ApiException(500, message='internal server error')
+        with patch('ibmcloudant.cloudant_v1.CloudantV1.post_bulk_docs', failing_operation):
+            with BulkWriter(self.client, 'db') as writer:
+                futures = [writer.write({'_id': f'doc{i}'}) for i in range(3)]
+        for future in futures:
+            with self.assertRaises(ApiException):
+                future.result()
+
+    def test_write_blocks_when_behind(self):
+        release = Event()
+        def blocking_operation(*args, **kwargs):
+            release.wait()
+            docs = json.loads(kwargs['bulk_docs'].read())['docs']
+            return DetailedResponse(response=[{'id': doc['_id'], 'ok': True} for doc in docs])
+        with patch('ibmcloudant.cloudant_v1.CloudantV1.post_bulk_docs', blocking_operation):
+            writer = BulkWriter(self.client, 'db', batch_size=2, max_in_flight=1, linger=0)
+            for i in range(6):
+                # 1 batch in flight, 1 batch taken waiting for a slot and 2 pending batches
+                writer.write({'_id': f'doc{i}'})
+            write_done = Event()
+            def write():
+                writer.write({'_id': 'blocked'})
+                write_done.set()
+            thread = Thread(target=write)
+            thread.start()
+            self.assertFalse(write_done.wait(0.2), 'The write should block while the writer is behind.')
+            release.set()
+            self.assertTrue(write_done.wait(5))
+            writer.close()
+
+    def test_write_after_close(self):
+        writer = BulkWriter(self.client, 'db')
+        writer.close()
+        with self.assertRaisesRegex(ValueError, 'The BulkWriter is closed.'):
+            writer.write({'_id': 'doc0'})
+
+    def test_invalid_options(self):
+        with self.assertRaisesRegex(ValueError, 'db must be provided'):
+            BulkWriter(self.client, '')
+        with self.assertRaisesRegex(ValueError, 'The provided batch_size 0 must be at least 1.'):
+            BulkWriter(self.client, 'db', batch_size=0)
+        with self.assertRaisesRegex(ValueError, 'The provided max_in_flight 0 must be at least 1.'):
+            BulkWriter(self.client, 'db', max_in_flight=0)
@@ -18,7 +18,12 @@
 Test methods in the changes follower module
 """
 
+import io
+import itertools
+import json
 import sys
+import threading
+import time
 import timeit
 
 import pytest
@@ -27,19 +32,35 @@ from conftest import ChangesFollowerBaseCase
 from ibm_cloud_sdk_core import ApiException
 from requests.exceptions import ConnectionError
 
-from ibmcloudant.cloudant_v1 import PostChangesEnums
+from ibmcloudant.cloudant_v1 import ChangesResult, ChangesResultItem, PostChangesEnums
 from ibmcloudant.features.changes_follower import (
+    _BATCH_BYTES,
+    _SIZE_SAMPLE,
     _BATCH_SIZE,
     _FOREVER,
+    _HEARTBEAT,
     _LONGPOLL_TIMEOUT,
     ChangesFollower,
+    _BatchSizer,
+    _DeduplicationWindow,
     _Mode,
 )
+from ibmcloudant.features.checkpoint import MemoryCheckpointStore
 
 # the largest positive integer supported by the platform
 MAX_BATCHES = sys.maxsize / _BATCH_SIZE
 
 
+class RecordingCheckpointStore(MemoryCheckpointStore):
+    def __init__(self, seq=None):
+        super().__init__(seq)
+        self.saves = []
+
+    def save(self, seq):
+        super().save(seq)
+        self.saves.append(seq)
+
+
 @pytest.mark.usefixtures("timeouts")
 class TestChangesFollowerInitialization(ChangesFollowerBaseCase):
     def test_minimal_initialization(self):
@@ -63,6 +84,22 @@ class TestChangesFollowerInitialization(ChangesFollowerBaseCase):
         with self.assertRaisesRegex(ValueError, regx):
             ChangesFollower(self.client, db="db", error_tolerance=-1)
 
+    def test_validate_prefetch_batches(self):
+        regx = "The provided prefetch_batches 0 must be at least 1."
+        with self.assertRaisesRegex(ValueError, regx):
+            ChangesFollower(self.client, db="db", prefetch_batches=0)
+
+    def test_validate_checkpoint_interval(self):
+        regx = "The provided checkpoint_interval -1 must be at least 0."
+        with self.assertRaisesRegex(ValueError, regx):
+            ChangesFollower(self.client, db="db", checkpoint_interval=-1)
+
+    def test_validate_batch_size_bounds(self):
+        with self.assertRaisesRegex(ValueError, "The provided min_batch_size 0 must be at least 1."):
+            ChangesFollower(self.client, db="db", min_batch_size=0)
+        with self.assertRaisesRegex(ValueError, "The provided max_batch_size 9 must be at least 10."):
+            ChangesFollower(self.client, db="db", min_batch_size=10, max_batch_size=9)
+
     def test_initialization_with_valid_client_timeout(self):
         for timeout in self.timeouts_valid:
             try:
@@ -177,6 +214,247 @@ class TestChangesFollowerFinite(ChangesFollowerBaseCase):
             "There should be the expected number of changes.",
         )
 
+    @responses.activate
+    def test_start_one_off_raw(self):
+        """
+        Checks that a FINITE mode in raw mode returns the change dicts.
+        """
+        batches = 2
+        self.prepare_mock_changes(batches=batches)
+        follower = ChangesFollower(self.client, db="db", raw=True)
+        changes = list(follower.start_one_off())
+        self.assertEqual(
+            len(changes),
+            batches * _BATCH_SIZE,
+            "There should be the expected number of changes.",
+        )
+        self.assertEqual(
+            changes[0],
+            {"id": "000001", "changes": [], "seq": "1-abcdef"},
+            "The changes should be the decoded dicts.",
+        )
+
+    @responses.activate
+    def test_start_one_off_batches(self):
+        """
+        Checks that FINITE mode returns the batches with their
+        last_seq and pending.
+        """
+        batches = 3
+        self.prepare_mock_changes(batches=batches)
+        follower = ChangesFollower(self.client, db="db")
+        results = list(follower.start_one_off_batches())
+        self.assertEqual(len(results), batches, "There should be a result per batch.")
+        for batch_num, result in enumerate(results, start=1):
+            self.assertIsInstance(result, ChangesResult)
+            self.assertEqual(len(result.results), _BATCH_SIZE)
+            self.assertIsInstance(result.results[0], ChangesResultItem)
+            self.assertEqual(result.last_seq, f"{batch_num * _BATCH_SIZE}-abcdef")
+            self.assertEqual(result.pending, (batches - batch_num) * _BATCH_SIZE)
+
+    @responses.activate
+    def test_start_one_off_batches_raw(self):
+        """
+        Checks that FINITE mode in raw mode returns the batch dicts.
+        """
+        self.prepare_mock_changes(batches=1)
+        follower = ChangesFollower(self.client, db="db", raw=True)
+        results = list(follower.start_one_off_batches())
+        self.assertEqual(len(results), 1, "There should be a result per batch.")
+        self.assertEqual(results[0]["last_seq"], f"{_BATCH_SIZE}-abcdef")
+        self.assertEqual(results[0]["pending"], 0)
+        self.assertEqual(
+            results[0]["results"][0],
+            {"id": "000001", "changes": [], "seq": "1-abcdef"},
+            "The changes should be the decoded dicts.",
+        )
+
+    @responses.activate
+    def test_start_one_off_batches_limit(self):
+        """
+        Checks that the limit truncates the last batch
+        and sets its last_seq to the last change.
+        """
+        limit = _BATCH_SIZE + 123
+        self.prepare_mock_changes(batches=3)
+        follower = ChangesFollower(self.client, db="db", limit=limit)
+        results = list(follower.start_one_off_batches())
+        self.assertEqual(
+            [len(result.results) for result in results],
+            [_BATCH_SIZE, 123],
+            "The last batch should be truncated at the limit.",
+        )
+        self.assertEqual(results[-1].last_seq, f"{limit}-abcdef")
+        self.assertEqual(results[-1].pending, 2 * _BATCH_SIZE - 123)
+
+    @responses.activate
+    def test_start_one_off_prefetch_batches(self):
+        """
+        Checks that FINITE mode requests up to prefetch_batches
+        batches ahead of the consumer.
+        """
+        batches = 10
+        prefetch_batches = 3
+        mock = self.prepare_mock_changes(batches=batches)
+        follower = ChangesFollower(self.client, db="db", prefetch_batches=prefetch_batches)
+        changes = follower.start_one_off()
+        next(changes)
+        # The consumed batch, the buffered batches and a batch waiting for space
+        expected_calls = 1 + prefetch_batches + 1
+        deadline = time.monotonic() + 5
+        while mock.call_count < expected_calls and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.2)
+        self.assertEqual(
+            mock.call_count,
+            expected_calls,
+            "The requests should stop when the buffer is full.",
+        )
+        self.assertEqual(
+            1 + sum(1 for _ in changes),
+            batches * _BATCH_SIZE,
+            "There should be the expected number of changes.",
+        )
+
+    @responses.activate
+    def test_stop_with_full_buffer(self):
+        """
+        Checks that stop does not wait for the consumer
+        when the buffer is full.
+        """
+        mock = self.prepare_mock_changes(batches=MAX_BATCHES)
+        follower = ChangesFollower(self.client, db="db", prefetch_batches=2)
+        changes = follower.start_one_off()
+        next(changes)
+        deadline = time.monotonic() + 5
+        while mock.call_count < 4 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        start = timeit.default_timer()
+        follower.stop()
+        self.assertLess(timeit.default_timer() - start, 1, "The stop should not wait for the consumer.")
+        self.assertEqual(sum(1 for _ in changes), 0, "There should be no changes after stop.")
+
+    @responses.activate
+    def test_checkpoint_resume(self):
+        """
+        Checks that the stored sequence is used in place of since.
+        """
+        mock = self.prepare_mock_changes(batches=1)
+        store = MemoryCheckpointStore(f"{_BATCH_SIZE}-abcdef")
+        follower = ChangesFollower(self.client, db="db", since="1-abcdef", checkpoint_store=store)
+        list(follower.start_one_off())
+        self.assertEqual(mock.calls[0].request.params["since"], f"{_BATCH_SIZE}-abcdef")
+
+    @responses.activate
+    def test_checkpoint_processed_batches(self):
+        """
+        Checks that the last_seq of a batch is saved
+        after the consumer processed its changes.
+        """
+        self.prepare_mock_changes(batches=3)
+        store = RecordingCheckpointStore()
+        follower = ChangesFollower(self.client, db="db", checkpoint_store=store, checkpoint_interval=0)
+        changes = follower.start_one_off()
+        for _ in range(_BATCH_SIZE):
+            next(changes)
+        self.assertEqual(store.saves, [], "The last change of the batch is being processed.")
+        next(changes)
+        self.assertEqual(store.saves, [f"{_BATCH_SIZE}-abcdef"])
+        for _ in changes:
+            pass
+        self.assertEqual(
+            store.saves,
+            [f"{batch_num * _BATCH_SIZE}-abcdef" for batch_num in range(1, 4)],
+            "There should be a save per batch.",
+        )
+
+    @responses.activate
+    def test_checkpoint_processed_batches_batches(self):
+        """
+        Checks that the last_seq of a batch is saved
+        when the consumer requests the next batch.
+        """
+        self.prepare_mock_changes(batches=3)
+        store = RecordingCheckpointStore()
+        follower = ChangesFollower(self.client, db="db", checkpoint_store=store, checkpoint_interval=0)
+        results = follower.start_one_off_batches()
+        next(results)
+        self.assertEqual(store.saves, [])
+        next(results)
+        self.assertEqual(store.saves, [f"{_BATCH_SIZE}-abcdef"])
+        for _ in results:
+            pass
+        self.assertEqual(store.saves[-1], f"{3 * _BATCH_SIZE}-abcdef")
+
+    @responses.activate
+    def test_checkpoint_interval(self):
+        """
+        Checks that saves within the interval are skipped
+        and the last processed sequence is saved at the end.
+        """
+        self.prepare_mock_changes(batches=3)
+        store = RecordingCheckpointStore()
+        follower = ChangesFollower(self.client, db="db", checkpoint_store=store, checkpoint_interval=60000)
+        self.assertEqual(sum(1 for _ in follower.start_one_off()), 3 * _BATCH_SIZE)
+        self.assertEqual(store.saves, [f"{3 * _BATCH_SIZE}-abcdef"])
+
+    @responses.activate
+    def test_checkpoint_stop(self):
+        """
+        Checks that stop saves the last processed batch.
+        """
+        self.prepare_mock_changes(batches=MAX_BATCHES)
+        store = RecordingCheckpointStore()
+        follower = ChangesFollower(self.client, db="db", checkpoint_store=store, checkpoint_interval=60000)
+        changes = follower.start_one_off()
+        for _ in range(_BATCH_SIZE + 1):
+            next(changes)
+        follower.stop()
+        self.assertEqual(store.saves, [f"{_BATCH_SIZE}-abcdef"])
+
+    @responses.activate
+    def test_checkpoint_limit(self):
+        """
+        Checks that a limit at the end of a batch saves that batch.
+        """
+        self.prepare_mock_changes(batches=3)
+        store = RecordingCheckpointStore()
+        follower = ChangesFollower(
+            self.client, db="db", limit=2 * _BATCH_SIZE, checkpoint_store=store, checkpoint_interval=60000
+        )
+        self.assertEqual(sum(1 for _ in follower.start_one_off()), 2 * _BATCH_SIZE)
+        self.assertEqual(store.seq, f"{2 * _BATCH_SIZE}-abcdef")
+
+    @responses.activate
+    def test_checkpoint_limit_batches(self):
+        """
+        Checks that a batch truncated at the limit is saved.
+        """
+        self.prepare_mock_changes(batches=3)
+        store = RecordingCheckpointStore()
+        follower = ChangesFollower(
+            self.client, db="db", limit=_BATCH_SIZE + 7, checkpoint_store=store, checkpoint_interval=60000
+        )
+        self.assertEqual(sum(len(batch.results) for batch in follower.start_one_off_batches()), _BATCH_SIZE + 7)
+        self.assertEqual(store.seq, f"{_BATCH_SIZE + 7}-abcdef")
+
+    @responses.activate
+    def test_checkpoint_save_error(self):
+        """
+        Checks that an error saving the checkpoint
+        does not stop the changes.
+        """
+        class FailingCheckpointStore(MemoryCheckpointStore):
+            def save(self, seq):
+                raise OSError("disk full")
+
+        self.prepare_mock_changes(batches=2)
+        follower = ChangesFollower(
+            self.client, db="db", checkpoint_store=FailingCheckpointStore(), checkpoint_interval=0
+        )
+        with self.assertLogs("ibmcloudant.features.changes_follower", level="WARNING"):
+            self.assertEqual(sum(1 for _ in follower.start_one_off()), 2 * _BATCH_SIZE)
+
     @responses.activate
     def test_start_one_off_terminal_errors(self):
         """
@@ -456,6 +734,340 @@ class TestChangesFollowerFinite(ChangesFollowerBaseCase):
         )
 
 
+class TestChangesFollowerAdaptiveBatchSize(ChangesFollowerBaseCase):
+    def changes(self, count, size):
+        return [{"id": f"{idx:06}", "seq": f"{idx}-abcdef", "changes": [], "doc": {"data": "x" * size}}
+                for idx in range(count)]
+
+    def prepare_mock_skewed_changes(self, total, large_from, large_size, content_length=False):
+        """
+        Mocks changes with small documents up to large_from
+        and large documents after it, honouring the limit.
+        """
+        def changes_callback(request):
+            since = int(request.params["since"].split("-")[0])
+            stop = min(since + int(request.params["limit"]), total)
+            items = [
+                {"id": f"{idx:06}", "seq": f"{idx}-abcdef", "changes": [],
+                 "doc": {"data": "x" * (large_size if idx > large_from else 10)}}
+                for idx in range(since + 1, stop + 1)
+            ]
+            body = json.dumps({"results": items, "last_seq": f"{stop}-abcdef", "pending": total - stop})
+            return (200, {"Content-Length": str(len(body))} if content_length else {}, body)
+
+        return responses.add_callback(
+            responses.POST,
+            "http://localhost:5984/db/_changes",
+            content_type="application/json",
+            callback=changes_callback,
+        )
+
+    def test_size_target(self):
+        sizer = _BatchSizer(100, 1, _BATCH_SIZE)
+        # 100 kB per change of the response
+        batch_size = sizer.update(self.changes(100, 10), 100 * 100_000, 0.1, 100)
+        self.assertEqual(batch_size, int(_BATCH_BYTES / 100_000))
+
+    def test_size_estimate(self):
+        encoded = []
+
+        def dumps(obj):
+            encoded.append(obj)
+            return json.dumps(obj).encode("utf-8")
+
+        sizer = _BatchSizer(100, 1, _BATCH_SIZE, dumps)
+        change_bytes = len(json.dumps(self.changes(1, 100_000)[0]))
+        # Without the size of the response a sample of the changes is encoded
+        batch_size = sizer.update(self.changes(100, 100_000), None, 0.1, 100)
+        self.assertEqual(batch_size, int(_BATCH_BYTES / change_bytes))
+        self.assertEqual(len(encoded), 1)
+        self.assertLessEqual(len(encoded[0]), _SIZE_SAMPLE)
+
+    def test_duration_target(self):
+        sizer = _BatchSizer(100, 1, _BATCH_SIZE)
+        # 200 ms per change of a full batch for a target of 10 seconds
+        self.assertEqual(sizer.update(self.changes(100, 10), None, 20, 100), 50)
+        # The duration of a batch that is not full is not used
+        self.assertEqual(sizer.update(self.changes(10, 10), None, 60, 50), 50)
+
+    def test_growth(self):
+        sizer = _BatchSizer(100, 1, 1000)
+        self.assertEqual(sizer.update(self.changes(100, 10), None, 0.01, 100), 200)
+        self.assertEqual(sizer.update(self.changes(200, 10), None, 0.01, 200), 400)
+        self.assertEqual(sizer.update(self.changes(400, 10), None, 0.01, 400), 800)
+        self.assertEqual(sizer.update(self.changes(800, 10), None, 0.01, 800), 1000)
+        # An empty batch keeps the batch size
+        self.assertEqual(sizer.update([], 100, 60, 1000), 1000)
+
+    def test_bounds(self):
+        self.assertEqual(_BatchSizer(5, 10, 20).batch_size, 10)
+        self.assertEqual(_BatchSizer(50, 10, 20).batch_size, 20)
+        sizer = _BatchSizer(20, 10, 20)
+        self.assertEqual(sizer.update(self.changes(20, 1_000_000), None, 0.1, 20), 10)
+
+    @responses.activate
+    def test_adaptive_limits(self):
+        """
+        Checks that the limit of each request is adjusted
+        to the size of the previous changes.
+        """
+        total = 3000
+        mock = self.prepare_mock_skewed_changes(total, large_from=1000, large_size=100_000)
+        follower = ChangesFollower(self.client, db="db", adaptive_batch_size=True, max_batch_size=500)
+        self.assertEqual(sum(1 for _ in follower.start_one_off()), total)
+        limits = [int(call.request.params["limit"]) for call in mock.calls]
+        self.assertEqual(limits[:2], [500, 500], "The small documents should use the max_batch_size.")
+        self.assertLess(limits[-1], 100, "The large documents should use smaller batches.")
+
+    @responses.activate
+    def test_adaptive_limits_content_length(self):
+        """
+        Checks that the limits are adjusted from the
+        Content-Length of the responses.
+        """
+        dumps_calls = []
+        self.client.set_json_codec(dumps=lambda obj: dumps_calls.append(obj) or json.dumps(obj))
+        self.addCleanup(self.client.set_json_codec)
+        total = 3000
+        mock = self.prepare_mock_skewed_changes(total, large_from=1000, large_size=100_000, content_length=True)
+        follower = ChangesFollower(self.client, db="db", adaptive_batch_size=True, max_batch_size=500)
+        self.assertEqual(sum(1 for _ in follower.start_one_off()), total)
+        limits = [int(call.request.params["limit"]) for call in mock.calls]
+        self.assertEqual(limits[:2], [500, 500])
+        self.assertLess(limits[-1], 100)
+        # Only the request bodies of the changes requests are encoded
+        self.assertEqual(dumps_calls, [{}] * len(mock.calls), "The changes should not be encoded.")
+
+    @responses.activate
+    def test_adaptive_limits_with_limit(self):
+        """
+        Checks that the batch size is not larger than the limit.
+        """
+        mock = self.prepare_mock_skewed_changes(3000, large_from=3000, large_size=0)
+        follower = ChangesFollower(self.client, db="db", adaptive_batch_size=True, limit=300)
+        self.assertEqual(sum(1 for _ in follower.start_one_off()), 300)
+        self.assertEqual(mock.calls[0].request.params["limit"], "300")
+
+
+class TestChangesFollowerDeduplication(ChangesFollowerBaseCase):
+    def prepare_mock_batches(self, batches):
+        """
+        Mocks a FINITE feed of batches of (id, rev) changes.
+        """
+        batches = list(batches)
+        calls = itertools.count()
+
+        def changes_callback(request):
+            batch_num = next(calls)
+            items = []
+            if batch_num < len(batches):
+                items = [{"id": doc_id, "seq": f"{batch_num}-{doc_id}", "changes": [{"rev": rev}]}
+                         for doc_id, rev in batches[batch_num]]
+            pending = max(len(batches) - batch_num - 1, 0)
+            return (200, {}, json.dumps({"results": items, "last_seq": f"{batch_num}-x", "pending": pending}))
+
+        return responses.add_callback(responses.POST, "http://localhost:5984/db/_changes",
+                                      callback=changes_callback, content_type="application/json")
+
+    @responses.activate
+    def test_repeated_changes_dropped(self):
+        """
+        Checks that a replayed change with the same revision is dropped
+        and a new revision of the document is returned.
+        """
+        self.prepare_mock_batches([
+            [("a", "1-a"), ("b", "1-b")],
+            [("a", "1-a"), ("b", "2-b"), ("c", "1-c")],
+        ])
+        follower = ChangesFollower(self.client, db="db", dedup_window=100)
+        received = [(change.id, change.changes[0].rev) for change in follower.start_one_off()]
+        self.assertEqual(received, [("a", "1-a"), ("b", "1-b"), ("b", "2-b"), ("c", "1-c")])
+        self.assertEqual(follower.suppressed_duplicates, 1)
+
+    @responses.activate
+    def test_repeated_batch_dropped(self):
+        """
+        Checks that a batch of only repeated changes is skipped in batch mode.
+        """
+        self.prepare_mock_batches([[("a", "1-a")], [("a", "1-a")], [("b", "1-b")]])
+        follower = ChangesFollower(self.client, db="db", dedup_window=100)
+        results = list(follower.start_one_off_batches())
+        self.assertEqual([[change.id for change in result.results] for result in results], [["a"], ["b"]])
+        self.assertEqual(follower.suppressed_duplicates, 1)
+
+    @responses.activate
+    def test_no_dedup_window(self):
+        """
+        Checks that every change is returned by default.
+        """
+        self.prepare_mock_batches([[("a", "1-a")], [("a", "1-a")]])
+        follower = ChangesFollower(self.client, db="db")
+        self.assertEqual(len(list(follower.start_one_off())), 2)
+        self.assertEqual(follower.suppressed_duplicates, 0)
+
+    def test_window_size(self):
+        window = _DeduplicationWindow(2)
+        changes = [{"id": doc_id, "changes": [{"rev": "1-a"}]} for doc_id in "abc"]
+        self.assertEqual(window.filter(changes), changes)
+        # a was the least recently used and is no longer remembered
+        self.assertEqual(window.filter(changes[:1]), changes[:1])
+        # b and then c were forgotten as a and b were added
+        self.assertEqual(window.filter(changes), changes[1:])
+        self.assertEqual(window.suppressed, 1)
+
+    def test_revisions_key(self):
+        window = _DeduplicationWindow(10)
+        window.filter([{"id": "a", "changes": [{"rev": "2-x"}, {"rev": "2-y"}]}])
+        self.assertEqual(window.filter([{"id": "a", "changes": [{"rev": "2-y"}, {"rev": "2-x"}]}]), [])
+        self.assertEqual(len(window.filter([{"id": "a", "changes": [{"rev": "2-x"}]}])), 1)
+
+    def test_validate_dedup_window(self):
+        with self.assertRaisesRegex(ValueError, "The provided dedup_window -1 must be at least 0."):
+            ChangesFollower(self.client, db="db", dedup_window=-1)
+
+
+class HeartbeatStream(io.RawIOBase):
+    """
+    A response body of heartbeats every 10 ms until it is closed.
+    """
+
+    def __init__(self):
+        self.closed_event = threading.Event()
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if self.closed_event.wait(0.01):
+            return 0
+        buffer[:] = b"\n" * len(buffer)
+        return len(buffer)
+
+    def close(self):
+        self.closed_event.set()
+        super().close()
+
+
+class TestChangesFollowerContinuous(ChangesFollowerBaseCase):
+    _url = "http://localhost:5984/db/_changes"
+
+    def row(self, idx):
+        return json.dumps({"id": f"{idx:06}", "seq": f"{idx}-abcdef", "changes": [{"rev": "1-a"}]})
+
+    def prepare_mock_continuous(self, responses_lines):
+        """
+        Mocks continuous feed responses of the given lines
+        and empty responses after them.
+        """
+        responses_lines = list(responses_lines)
+
+        def changes_callback(request):
+            if not responses_lines:
+                return (200, {}, "")
+            lines = responses_lines.pop(0)
+            if isinstance(lines, int):
+                return (lines, {}, json.dumps({"error": "error"}))
+            return (200, {}, "".join(line + "\n" for line in lines))
+
+        return responses.add_callback(responses.POST, self._url, callback=changes_callback,
+                                      content_type="application/json")
+
+    @responses.activate
+    def test_start_continuous(self):
+        """
+        Checks that the rows of continuous responses are returned and the
+        feed is requested again from the last seq when a response ends.
+        """
+        mock = self.prepare_mock_continuous([
+            [self.row(1), self.row(2), "", self.row(3), '{"last_seq":"3-abcdef","pending":2}'],
+            [self.row(4), self.row(5)],
+        ])
+        follower = ChangesFollower(self.client, db="db", continuous=True)
+        changes = follower.start()
+        received = [next(changes) for _ in range(5)]
+        follower.stop()
+        self.assertIsInstance(received[0], ChangesResultItem)
+        self.assertEqual([change.id for change in received], [f"{idx:06}" for idx in range(1, 6)])
+        params = mock.calls[0].request.params
+        self.assertEqual(params["feed"], "continuous")
+        self.assertEqual(params["heartbeat"], str(_HEARTBEAT))
+        self.assertEqual(params["since"], "now")
+        self.assertNotIn("limit", params)
+        self.assertNotIn("timeout", params)
+        self.assertEqual(mock.calls[1].request.params["since"], "3-abcdef")
+
+    @responses.activate
+    def test_start_continuous_transient_errors(self):
+        """
+        Checks that the feed is requested again from the last
+        row received after a broken response or an error.
+        """
+        mock = self.prepare_mock_continuous([
+            [self.row(1), self.row(2), "{"],
+            500,
+            [self.row(3)],
+        ])
+        follower = ChangesFollower(self.client, db="db", continuous=True, raw=True)
+        changes = follower.start()
+        received = [next(changes)["id"] for _ in range(3)]
+        follower.stop()
+        self.assertEqual(received, ["000001", "000002", "000003"])
+        self.assertEqual(mock.calls[1].request.params["since"], "2-abcdef")
+        self.assertEqual(mock.calls[2].request.params["since"], "2-abcdef")
+
+    @responses.activate
+    def test_start_continuous_terminal_error(self):
+        """
+        Checks that a terminal error ends the iteration.
+        """
+        self.prepare_mock_continuous([[self.row(1)], 403])
+        follower = ChangesFollower(self.client, db="db", continuous=True)
+        changes = follower.start()
+        self.assertEqual(next(changes).id, "000001")
+        with self.assertRaises(ApiException) as cm:
+            next(changes)
+        self.assertEqual(cm.exception.status_code, 403)
+
+    @responses.activate
+    def test_start_continuous_limit(self):
+        """
+        Checks that the limit is requested and ends the iteration.
+        """
+        mock = self.prepare_mock_continuous([[self.row(idx) for idx in range(1, 4)]])
+        follower = ChangesFollower(self.client, db="db", continuous=True, limit=3)
+        self.assertEqual(len(list(follower.start())), 3)
+        self.assertEqual(mock.calls[0].request.params["limit"], "3")
+
+    @responses.activate
+    def test_stop_continuous(self):
+        """
+        Checks that stop closes a response that is waiting for changes
+        at the next heartbeat.
+        """
+        stream = HeartbeatStream()
+        responses.add(responses.POST, self._url, body=io.BufferedReader(stream), content_type="application/json")
+        follower = ChangesFollower(self.client, db="db", continuous=True)
+        changes = follower.start()
+        deadline = time.monotonic() + 5
+        while not responses.calls and time.monotonic() < deadline:
+            time.sleep(0.01)
+        start = timeit.default_timer()
+        follower.stop()
+        self.assertLess(timeit.default_timer() - start, 1, "The stop should not wait for a heartbeat.")
+        self.assertTrue(stream.closed_event.is_set())
+        self.assertEqual(list(changes), [])
+
+    @responses.activate
+    def test_start_one_off_not_continuous(self):
+        """
+        Checks that start_one_off does not use the continuous feed.
+        """
+        mock = self.prepare_mock_changes(batches=1)
+        follower = ChangesFollower(self.client, db="db", continuous=True)
+        self.assertEqual(len(list(follower.start_one_off())), _BATCH_SIZE)
+        self.assertEqual(mock.calls[0].request.params["feed"], "normal")
+
+
 @pytest.mark.usefixtures("limits", "errors")
 class TestChangesFollowerListen(ChangesFollowerBaseCase):
     @responses.activate
@@ -472,6 +1084,24 @@ class TestChangesFollowerListen(ChangesFollowerBaseCase):
             self.fail("There should be no exception.")
         self.assertGreater(count, 2 * _BATCH_SIZE + 1, "There should be some changes.")
 
+    @responses.activate
+    def test_start_batches(self):
+        """
+        Checks that LISTEN mode returns the batches
+        and skips the empty batches.
+        """
+        self.prepare_mock_changes(batches=2)
+        follower = ChangesFollower(self.client, db="db")
+        results = follower.start_batches()
+        first = next(results)
+        second = next(results)
+        self.assertEqual(first.last_seq, f"{_BATCH_SIZE}-abcdef")
+        self.assertEqual(second.last_seq, f"{2 * _BATCH_SIZE}-abcdef")
+        self.assertEqual(second.results[-1].id, f"{2 * _BATCH_SIZE:06}")
+        follower.stop()
+        with self.assertRaises(StopIteration):
+            next(results)
+
     @responses.activate
     def test_start_terminal_errors(self):
         """
@@ -0,0 +1,197 @@
+# coding: utf-8
+
+# © Copyright IBM Corporation 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Test the checkpoint stores
+"""
+
+import gzip
+import json
+import logging
+import os
+import tempfile
+import unittest
+from queue import Queue
+from threading import Event
+
+import responses
+from ibm_cloud_sdk_core import ApiException
+
+from ibmcloudant import CheckpointStore, FileCheckpointStore, LocalDocumentCheckpointStore, MemoryCheckpointStore
+from ibmcloudant.features.checkpoint import _CheckpointSaver
+from ibmcloudant.features.queues import _put_unless_stopped
+from conftest import MockClientBaseCase
+
+
+class TestFileCheckpointStore(MockClientBaseCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.path = os.path.join(self.directory, 'checkpoint')
+
+    def test_missing_file(self):
+        self.assertIsNone(FileCheckpointStore(self.path).load())
+
+    def test_save_and_load(self):
+        FileCheckpointStore(self.path).save('1-abcdef')
+        store = FileCheckpointStore(self.path)
+        self.assertEqual(store.load(), '1-abcdef')
+        store.save('2-abcdef')
+        self.assertEqual(store.load(), '2-abcdef')
+        # No temporary files are left behind
+        self.assertEqual(os.listdir(self.directory), ['checkpoint'])
+
+    def test_no_path(self):
+        with self.assertRaisesRegex(ValueError, 'path must be provided'):
+            FileCheckpointStore('')
+
+
+class TestCheckpointStore(unittest.TestCase):
+
+    def test_incomplete_subclass(self):
+        class LoadOnlyCheckpointStore(CheckpointStore):
+            def load(self):
+                return None
+
+        with self.assertRaisesRegex(TypeError, 'abstract method'):
+            LoadOnlyCheckpointStore()
+
+
+class TestMemoryCheckpointStore(MockClientBaseCase):
+
+    def test_save_and_load(self):
+        store = MemoryCheckpointStore()
+        self.assertIsNone(store.load())
+        store.save('1-abcdef')
+        self.assertEqual(store.load(), '1-abcdef')
+        self.assertEqual(MemoryCheckpointStore('2-abcdef').load(), '2-abcdef')
+
+
+class TestLocalDocumentCheckpointStore(MockClientBaseCase):
+
+    _url = 'http://localhost:5984/db/_local/checkpoint'
+
+    def setUp(self):
+        self.store = LocalDocumentCheckpointStore(self.client, 'db', 'checkpoint')
+
+    def put_body(self, call):
+        return json.loads(gzip.decompress(call.request.body))
+
+    @responses.activate
+    def test_missing_document(self):
+        responses.get(self._url, status=404, json={'error': 'not_found'})
+        responses.put(self._url, status=201, json={'ok': True, 'id': '_local/checkpoint', 'rev': '0-1'})
+        self.assertIsNone(self.store.load())
+        self.store.save('1-abcdef')
+        self.assertEqual(self.put_body(responses.calls[1]), {'seq': '1-abcdef'})
+
+    @responses.activate
+    def test_save_with_rev(self):
+        responses.get(self._url, json={'_id': '_local/checkpoint', '_rev': '0-1', 'seq': '1-abcdef'})
+        responses.put(self._url, status=201, json={'ok': True, 'id': '_local/checkpoint', 'rev': '0-2'})
+        self.assertEqual(self.store.load(), '1-abcdef')
+        self.store.save('2-abcdef')
+        self.store.save('3-abcdef')
+        self.assertEqual(self.put_body(responses.calls[1]), {'seq': '2-abcdef', '_rev': '0-1'})
+        self.assertEqual(self.put_body(responses.calls[2]), {'seq': '3-abcdef', '_rev': '0-2'})
+
+    @responses.activate
+    def test_save_conflict(self):
+        responses.get(self._url, json={'_id': '_local/checkpoint', '_rev': '0-5', 'seq': '1-abcdef'})
+        responses.put(self._url, status=409, json={'error': 'conflict'})
+        responses.put(self._url, status=201, json={'ok': True, 'id': '_local/checkpoint', 'rev': '0-6'})
+        self.store.save('2-abcdef')
+        self.assertEqual(len(responses.calls), 3)
+        self.assertEqual(self.put_body(responses.calls[2]), {'seq': '2-abcdef', '_rev': '0-5'})
+
+    @responses.activate
+    def test_load_error(self):
+        responses.get(self._url, status=403, json={'error': 'forbidden'})
+        with self.assertRaises(ApiException):
+            self.store.load()
+
+    def test_validation(self):
+        for name, args in (('db', ('', 'checkpoint')), ('doc_id', ('db', ''))):
+            with self.subTest(name):
+                with self.assertRaisesRegex(ValueError, f'{name} must be provided'):
+                    LocalDocumentCheckpointStore(self.client, *args)
+
+
+class RecordingStore(MemoryCheckpointStore):
+    def __init__(self, seq=None):
+        super().__init__(seq)
+        self.saves = []
+
+    def save(self, seq):
+        if seq == 'fail':
+            raise OSError('disk full')
+        super().save(seq)
+        self.saves.append(seq)
+
+
+class TestCheckpointSaver(unittest.TestCase):
+
+    logger = logging.getLogger(__name__)
+
+    def test_interval_and_flush(self):
+        store = RecordingStore()
+        saver = _CheckpointSaver(store, 60000, self.logger)
+        saver.checkpoint('1-a')
+        saver.checkpoint('2-a')
+        self.assertEqual(store.saves, [], 'Saves within the interval are skipped.')
+        saver.checkpoint(flush=True)
+        saver.checkpoint(flush=True)
+        self.assertEqual(store.saves, ['2-a'], 'The latest sequence is saved once.')
+
+    def test_no_interval(self):
+        store = RecordingStore()
+        saver = _CheckpointSaver(store, 0, self.logger)
+        saver.checkpoint('1-a')
+        saver.checkpoint('2-a')
+        self.assertEqual(store.saves, ['1-a', '2-a'])
+
+    def test_loaded_sequence_not_saved(self):
+        store = RecordingStore('1-a')
+        saver = _CheckpointSaver(store, 0, self.logger)
+        self.assertEqual(saver.load(), '1-a')
+        saver.checkpoint('1-a', flush=True)
+        self.assertEqual(store.saves, [])
+
+    def test_save_error(self):
+        store = RecordingStore()
+        saver = _CheckpointSaver(store, 0, self.logger)
+        with self.assertLogs(__name__, level='WARNING'):
+            saver.checkpoint('fail')
+        saver.checkpoint('2-a')
+        self.assertEqual(store.saves, ['2-a'])
+
+
+class TestPutUnlessStopped(unittest.TestCase):
+
+    def test_put(self):
+        queue = Queue(maxsize=1)
+        self.assertTrue(_put_unless_stopped(queue, 1, Event(), 0.01))
+        self.assertEqual(queue.get_nowait(), 1)
+
+    def test_stopped(self):
+        queue = Queue(maxsize=1)
+        stop = Event()
+        _put_unless_stopped(queue, 1, stop, 0.01)
+        stop.set()
+        self.assertFalse(_put_unless_stopped(queue, 2, stop, 0.01))
+        self.assertEqual(queue.qsize(), 1)
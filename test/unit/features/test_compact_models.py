@@ -0,0 +1,122 @@
+# coding: utf-8
+
+# © Copyright IBM Corporation 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Test the compact variants of the result row and item models
+"""
+
+import inspect
+import re
+import unittest
+
+from ibmcloudant.cloudant_v1 import (Change, ChangesResultItem, DocsResultRow, DocsResultRowValue, Document,
+                                     DocumentResult, SearchResultRow, ViewResultRow)
+from ibmcloudant.features.compact_models import (CompactChange, CompactChangesResultItem, CompactDocsResultRow,
+                                                 CompactDocsResultRowValue, CompactDocumentResult,
+                                                 CompactSearchResultRow, CompactViewResultRow)
+
+
+class TestCompactModels(unittest.TestCase):
+
+    examples = (
+        (ViewResultRow, CompactViewResultRow,
+         {'id': 'a', 'key': ['a', 1], 'value': {'x': 1}, 'doc': {'_id': 'a', '_rev': '1-a', 'extra': True}}),
+        (DocsResultRow, CompactDocsResultRow,
+         {'id': 'a', 'key': 'a', 'value': {'rev': '1-a', 'deleted': True}}),
+        (ChangesResultItem, CompactChangesResultItem,
+         {'id': 'a', 'seq': '1-a', 'changes': [{'rev': '1-a'}, {'rev': '2-b'}], 'deleted': True}),
+        (SearchResultRow, CompactSearchResultRow,
+         {'id': 'a', 'fields': {'name': 'x'}, 'highlights': {'name': ['<em>x</em>']}}),
+        (DocumentResult, CompactDocumentResult,
+         {'id': 'a', 'rev': '1-a', 'ok': True}),
+    )
+
+    # An example of each model with every property
+    complete_examples = (
+        (Change, CompactChange, {'rev': '1-a'}),
+        (ChangesResultItem, CompactChangesResultItem,
+         {'changes': [{'rev': '1-a'}], 'deleted': True, 'doc': {'_id': 'a', '_rev': '1-a'}, 'id': 'a', 'seq': '1-a'}),
+        (DocsResultRowValue, CompactDocsResultRowValue, {'deleted': True, 'rev': '1-a'}),
+        (DocsResultRow, CompactDocsResultRow,
+         {'caused_by': 'x', 'error': 'not_found', 'reason': 'missing', 'ref': 1, 'doc': {'_id': 'a'}, 'id': 'a',
+          'key': 'a', 'value': {'deleted': True, 'rev': '1-a'}}),
+        (DocumentResult, CompactDocumentResult,
+         {'id': 'a', 'rev': '1-a', 'ok': True, 'caused_by': 'x', 'error': 'conflict', 'reason': 'conflict',
+          'ref': 1}),
+        (SearchResultRow, CompactSearchResultRow,
+         {'doc': {'_id': 'a'}, 'fields': {'name': 'x'}, 'highlights': {'name': ['x']}, 'id': 'a'}),
+        (ViewResultRow, CompactViewResultRow,
+         {'caused_by': 'x', 'error': 'not_found', 'reason': 'missing', 'ref': 1, 'doc': {'_id': 'a'}, 'id': 'a',
+          'key': ['a'], 'value': 1}),
+    )
+
+    def test_matches_source_models(self):
+        for model, compact_model, example in self.complete_examples:
+            with self.subTest(model.__name__):
+                # The constructor and the properties are those of the source model
+                self.assertEqual(
+                    [(p.name, p.kind, p.default) for p in inspect.signature(compact_model).parameters.values()],
+                    [(p.name, p.kind, p.default) for p in inspect.signature(model).parameters.values()])
+                self.assertEqual(list(model.from_dict(example).to_dict()), list(example))
+                compact = compact_model.from_dict(example)
+                self.assertEqual(list(compact.to_dict()), list(example))
+                self.assertEqual(compact.to_dict(), model.from_dict(example).to_dict())
+                self.assertEqual(str(compact), str(model.from_dict(example)))
+                self.assertEqual(compact_model.from_dict(compact.to_dict()), compact)
+
+    def test_required_properties(self):
+        for model, compact_model, example in self.complete_examples:
+            for name in example:
+                partial = {k: v for k, v in example.items() if k != name}
+                with self.subTest(model.__name__, property=name):
+                    try:
+                        expected = model.from_dict(partial).to_dict()
+                    except ValueError as e:
+                        with self.assertRaisesRegex(ValueError, re.escape(str(e))):
+                            compact_model.from_dict(partial)
+                    else:
+                        self.assertEqual(compact_model.from_dict(partial).to_dict(), expected)
+
+    def test_round_trip(self):
+        for model, compact_model, example in self.examples:
+            with self.subTest(model.__name__):
+                compact = compact_model.from_dict(example)
+                self.assertEqual(compact.to_dict(), example)
+                self.assertEqual(compact.to_dict(), model.from_dict(example).to_dict())
+                self.assertEqual(str(compact), str(model.from_dict(example)))
+
+    def test_no_instance_dict(self):
+        for _, compact_model, example in self.examples:
+            with self.subTest(compact_model.__name__):
+                compact = compact_model.from_dict(example)
+                self.assertFalse(hasattr(compact, '__dict__'))
+                with self.assertRaises(AttributeError):
+                    compact.other = 1
+
+    def test_nested_models(self):
+        changes_item = CompactChangesResultItem.from_dict({'id': 'a', 'seq': '1-a', 'changes': [{'rev': '1-a'}]})
+        self.assertIsInstance(changes_item.changes[0], CompactChange)
+        docs_row = CompactDocsResultRow.from_dict({'id': 'a', 'key': 'a', 'value': {'rev': '1-a'}, 'doc': {'_id': 'a'}})
+        self.assertIsInstance(docs_row.value, CompactDocsResultRowValue)
+        # Documents have additional properties so remain the usual model
+        self.assertIsInstance(docs_row.doc, Document)
+
+    def test_constructor_and_equality(self):
+        row = CompactViewResultRow('key', 'value', id='a')
+        self.assertEqual(row.to_dict(), {'id': 'a', 'key': 'key', 'value': 'value'})
+        self.assertEqual(row, CompactViewResultRow('key', 'value', id='a'))
+        self.assertNotEqual(row, CompactViewResultRow('key', 'value', id='b'))
+        self.assertNotEqual(row, ViewResultRow('key', 'value', id='a'))
@@ -0,0 +1,145 @@
+# coding: utf-8
+
+# © Copyright IBM Corporation 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Test the document cache follower
+"""
+
+import json
+import time
+from queue import Empty, Queue
+
+import responses
+from ibm_cloud_sdk_core import ApiException
+
+from ibmcloudant import DocumentCache, DocumentCacheFollower
+from conftest import MockClientBaseCase
+
+
+class TestDocumentCacheFollower(MockClientBaseCase):
+
+    _base_url = 'http://localhost:5984'
+
+    def setUp(self):
+        self.cache = DocumentCache()
+        self.client.set_document_cache(self.cache)
+        self.addCleanup(self.client.set_document_cache, None)
+        self.docs = {'doc': {'_id': 'doc', '_rev': '1-a'}, 'other': {'_id': 'other', '_rev': '1-a'}}
+        self.changes = Queue()
+        self.changes_since = []
+
+    def doc_callback(self, request):
+        doc = self.docs[request.path_url.split('/')[-1]]
+        etag = f'"{doc["_rev"]}"'
+        if request.headers.get('If-None-Match') == etag:
+            return (304, {'ETag': etag}, '')
+        return (200, {'ETag': etag}, json.dumps(doc))
+
+    def changes_callback(self, request):
+        self.changes_since.append(request.params.get('since'))
+        try:
+            results = self.changes.get(timeout=0.05)
+        except Empty:
+            results = []
+        if isinstance(results, int):
+            return (results, {}, json.dumps({'error': 'not_found'}))
+        last_seq = results[-1]['seq'] if results else '5-x'
+        return (200, {}, json.dumps({'results': results, 'last_seq': last_seq, 'pending': 0}))
+
+    def mock_server(self):
+        responses.get(f'{self._base_url}/db', json={'update_seq': '5-x'})
+        for doc_id in self.docs:
+            responses.add_callback(responses.GET, f'{self._base_url}/db/{doc_id}', self.doc_callback,
+                                   content_type='application/json')
+        responses.add_callback(responses.POST, f'{self._base_url}/db/_changes', self.changes_callback,
+                               content_type='application/json')
+
+    def get_doc(self, doc_id='doc'):
+        return self.client.get_document(db='db', doc_id=doc_id).get_result()
+
+    def doc_requests(self):
+        return [call for call in responses.calls if call.request.method == 'GET' and '_changes' not in call.request.url
+                and call.request.url != f'{self._base_url}/db']
+
+    def wait_for(self, condition):
+        deadline = time.monotonic() + 5
+        while not condition():
+            self.assertLess(time.monotonic(), deadline, 'Timed out waiting for the follower')
+            time.sleep(0.01)
+
+    def change(self, doc_id, seq):
+        self.docs[doc_id] = {'_id': doc_id, '_rev': f'{seq}-b'}
+        self.changes.put([{'id': doc_id, 'seq': f'{seq}-x', 'changes': [{'rev': f'{seq}-b'}]}])
+
+    @responses.activate
+    def test_changes_invalidate(self):
+        self.mock_server()
+        self.get_doc()
+        with DocumentCacheFollower(self.cache, self.client, 'db') as follower:
+            # The documents cached before following are removed
+            self.assertEqual(len(self.cache), 0)
+            self.assertEqual(follower.since, '5-x')
+            self.get_doc()
+            self.get_doc('other')
+            # Served from the cache without revalidation
+            self.assertEqual(self.get_doc(), {'_id': 'doc', '_rev': '1-a'})
+            self.assertEqual(len(self.doc_requests()), 3)
+            self.assertEqual(self.cache.get_stats()['hits'], 1)
+
+            self.change('doc', 6)
+            self.wait_for(lambda: follower.since == '6-x')
+            self.assertEqual(len(self.cache), 1)
+            self.assertEqual(self.get_doc(), {'_id': 'doc', '_rev': '6-b'})
+            self.assertEqual(len(self.doc_requests()), 4)
+            self.assertTrue(follower.is_running())
+        self.assertFalse(follower.is_running())
+        self.assertEqual(self.changes_since[0], '5-x')
+        # After stopping the cached documents are revalidated
+        self.get_doc()
+        self.assertEqual(self.doc_requests()[-1].request.headers['If-None-Match'], '"6-b"')
+
+    @responses.activate
+    def test_terminal_error_stops_following(self):
+        self.mock_server()
+        follower = DocumentCacheFollower(self.cache, self.client, 'db')
+        follower.start()
+        self.get_doc()
+        self.changes.put(404)
+        self.wait_for(lambda: not follower.is_running())
+        self.assertIsInstance(follower.error, ApiException)
+        self.get_doc()
+        self.assertEqual(self.doc_requests()[-1].request.headers['If-None-Match'], '"1-a"')
+        follower.stop()
+
+    @responses.activate
+    def test_database_followed_once(self):
+        self.mock_server()
+        with DocumentCacheFollower(self.cache, self.client, 'db'):
+            follower = DocumentCacheFollower(self.cache, self.client, 'db')
+            with self.assertRaisesRegex(ValueError, 'The changes of database db are already followed.'):
+                follower.start()
+            self.assertFalse(follower.is_running())
+
+    @responses.activate
+    def test_start_twice(self):
+        self.mock_server()
+        with DocumentCacheFollower(self.cache, self.client, 'db') as follower:
+            with self.assertRaisesRegex(RuntimeError, 'Cannot start a follower that has already started.'):
+                follower.start()
+
+    def test_no_db(self):
+        with self.assertRaisesRegex(ValueError, 'db must be provided'):
+            DocumentCacheFollower(self.cache, self.client, '')
@@ -0,0 +1,132 @@
+# coding: utf-8
+
+# © Copyright IBM Corporation 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Test the incremental decoding of streamed JSON responses
+"""
+
+import io
+import json
+import unittest
+
+import responses
+from conftest import MockClientBaseCase
+
+from ibmcloudant.features.json_stream import JsonStreamItems
+
+
+def chunked(data: bytes, size: int):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestJsonStreamItems(unittest.TestCase):
+
+    view_result = {
+        'total_rows': 3,
+        'offset': 0,
+        'rows': [
+            {'id': 'a', 'key': ['a', 1], 'value': {'nested': [1, {'x': '}]'}]}},
+            {'id': 'b"q', 'key': 'esc\\"aped é 😀', 'value': None},
+            {'id': 'c', 'key': 1.5e3, 'value': [True, False, None]},
+        ],
+        'update_seq': '3-abc',
+    }
+
+    def test_items_every_chunk_size(self):
+        data = json.dumps(self.view_result, ensure_ascii=False).encode('utf-8')
+        for size in (1, 2, 3, 7, 64, len(data)):
+            with self.subTest(size):
+                items = JsonStreamItems(chunked(data, size), 'rows')
+                self.assertEqual(list(items), self.view_result['rows'])
+                self.assertEqual(items.fields, {'total_rows': 3, 'offset': 0, 'update_seq': '3-abc'})
+
+    def test_items_with_whitespace(self):
+        data = json.dumps(self.view_result, indent=4).encode('utf-8')
+        items = JsonStreamItems(io.BytesIO(data), 'rows', chunk_size=5)
+        self.assertEqual(list(items), self.view_result['rows'])
+
+    def test_scalar_items(self):
+        items = JsonStreamItems([b'{"results": [1, -2.5e3 ,"x", true,null] , "pending":0}'], 'results')
+        self.assertEqual(list(items), [1, -2500.0, 'x', True, None])
+        self.assertEqual(items.fields, {'pending': 0})
+
+    def test_empty_array_and_object(self):
+        self.assertEqual(list(JsonStreamItems([b'{"docs":[]}'], 'docs')), [])
+        self.assertEqual(list(JsonStreamItems([b' {} '], 'docs')), [])
+
+    def test_missing_field(self):
+        items = JsonStreamItems([b'{"error":"not_found"}'], 'rows')
+        self.assertEqual(list(items), [])
+        self.assertEqual(items.fields, {'error': 'not_found'})
+
+    def test_truncated(self):
+        with self.assertRaisesRegex(ValueError, 'Unexpected end of the JSON stream.'):
+            list(JsonStreamItems([b'{"rows":[{"id":"a"},{"id":'], 'rows'))
+
+    def test_invalid(self):
+        with self.assertRaisesRegex(ValueError, "Unexpected '\\[' in the JSON stream."):
+            list(JsonStreamItems([b'[{"id":"a"}]'], 'rows'))
+
+    def test_bounded_buffer(self):
+        rows = [{'id': f'{i:06}', 'value': 'x' * 100} for i in range(5000)]
+        data = json.dumps({'rows': rows}).encode('utf-8')
+        items = JsonStreamItems(chunked(data, 1024), 'rows', chunk_size=1024)
+        count = 0
+        for _ in items:
+            count += 1
+            self.assertLess(len(items._buffer), 4096)
+        self.assertEqual(count, 5000)
+
+    def test_closes_stream(self):
+        stream = io.BytesIO(b'{"rows":[1,2,3]}')
+        items = iter(JsonStreamItems(stream, 'rows'))
+        next(items)
+        items.close()
+        self.assertTrue(stream.closed)
+
+
+class TestServiceStreamItems(MockClientBaseCase):
+
+    @responses.activate
+    def test_iter_view_rows(self):
+        rows = [{'id': f'doc{i}', 'key': i, 'value': 1} for i in range(10)]
+        responses.post('http://localhost:5984/db/_design/ddoc/_view/view',
+                       json={'total_rows': 10, 'offset': 0, 'rows': rows})
+        items = self.client.iter_view_rows(db='db', ddoc='ddoc', view='view')
+        self.assertEqual(list(items), rows)
+        self.assertEqual(items.fields['total_rows'], 10)
+
+    @responses.activate
+    def test_iter_all_docs_rows(self):
+        rows = [{'id': 'a', 'key': 'a', 'value': {'rev': '1-a'}}]
+        responses.post('http://localhost:5984/db/_all_docs', json={'total_rows': 1, 'offset': 0, 'rows': rows})
+        self.assertEqual(list(self.client.iter_all_docs_rows(db='db')), rows)
+
+    @responses.activate
+    def test_iter_find_docs(self):
+        docs = [{'_id': 'a', '_rev': '1-a'}]
+        responses.post('http://localhost:5984/db/_find', json={'docs': docs, 'bookmark': 'b'})
+        items = self.client.iter_find_docs(db='db', selector={})
+        self.assertEqual(list(items), docs)
+        self.assertEqual(items.fields['bookmark'], 'b')
+
+    @responses.activate
+    def test_iter_changes_results(self):
+        results = [{'id': 'a', 'seq': '1-a', 'changes': [{'rev': '1-a'}]}]
+        responses.post('http://localhost:5984/db/_changes', json={'results': results, 'last_seq': '1-a', 'pending': 0})
+        items = self.client.iter_changes_results(db='db')
+        self.assertEqual(list(items), results)
+        self.assertEqual(items.fields, {'last_seq': '1-a', 'pending': 0})
@@ -0,0 +1,96 @@
+# coding: utf-8
+
+# © Copyright IBM Corporation 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Test the lazily materializing models
+"""
+
+import unittest
+
+from ibmcloudant.cloudant_v1 import (Attachment, BulkGetResult, ChangesResultItem, DocsResultRow, Document,
+                                     DocumentResult, Revisions, SearchResultRow, ViewResultRow)
+from ibmcloudant.features.lazy_models import (LazyBulkGetResult, LazyChangesResultItem, LazyDocsResultRow,
+                                              LazyDocument, LazySearchResultRow, LazyViewResultRow)
+
+
+class TestLazyModels(unittest.TestCase):
+
+    document = {
+        '_id': 'a',
+        '_rev': '2-b',
+        '_attachments': {'att.txt': {'content_type': 'text/plain', 'digest': 'md5-x', 'length': 3, 'stub': True}},
+        '_revisions': {'ids': ['b', 'a'], 'start': 2},
+        '_revs_info': [{'rev': '2-b', 'status': 'available'}],
+        'name': 'x',
+        'nested': {'list': [1, 2]},
+        'empty': None,
+    }
+
+    def test_document_properties(self):
+        doc = LazyDocument.from_dict(self.document)
+        self.assertIsInstance(doc, Document)
+        self.assertEqual(doc._id, 'a')
+        self.assertEqual(doc.name, 'x')
+        self.assertIsNone(doc._conflicts)
+        self.assertIsNone(doc.empty)
+        self.assertNotIn('_attachments', vars(doc), 'Unread properties should not be converted.')
+        self.assertIsInstance(doc._attachments['att.txt'], Attachment)
+        self.assertIsInstance(doc._revisions, Revisions)
+        self.assertEqual(doc._revs_info[0].status, 'available')
+        with self.assertRaises(AttributeError):
+            doc.missing
+
+    def test_document_to_dict(self):
+        doc = LazyDocument.from_dict(self.document)
+        self.assertEqual(doc.to_dict(), Document.from_dict(self.document).to_dict())
+        self.assertEqual(doc, Document.from_dict(self.document))
+        self.assertEqual(Document.from_dict(self.document).to_dict(), LazyDocument.from_dict(self.document).to_dict())
+        self.assertEqual(doc.get_properties(), {'name': 'x', 'nested': {'list': [1, 2]}, 'empty': None})
+
+    def test_document_set(self):
+        doc = LazyDocument.from_dict(self.document)
+        doc._rev = '3-c'
+        doc.name = 'y'
+        doc.set_properties({'other': 1})
+        self.assertEqual(doc.to_dict()['_rev'], '3-c')
+        self.assertEqual(doc.get_properties(), {'other': 1})
+        self.assertEqual(LazyDocument(_id='b', name='z').to_dict(), {'_id': 'b', 'name': 'z'})
+
+    def test_rows(self):
+        for model, lazy_model, example in (
+            (ViewResultRow, LazyViewResultRow, {'id': 'a', 'key': 'a', 'value': 1, 'doc': self.document}),
+            (DocsResultRow, LazyDocsResultRow, {'id': 'a', 'key': 'a', 'value': {'rev': '2-b'}, 'doc': self.document}),
+            (ChangesResultItem, LazyChangesResultItem, {'id': 'a', 'seq': '1-a', 'changes': [{'rev': '2-b'}], 'doc': self.document}),
+            (SearchResultRow, LazySearchResultRow, {'id': 'a', 'fields': {'name': 'x'}, 'doc': self.document}),
+        ):
+            with self.subTest(model.__name__):
+                row = lazy_model.from_dict(example)
+                self.assertIsInstance(row, model)
+                self.assertEqual(row.id, 'a')
+                self.assertNotIn('doc', vars(row))
+                self.assertIsInstance(row.doc, LazyDocument)
+                self.assertEqual(row.to_dict(), model.from_dict(example).to_dict())
+                self.assertEqual(row, model.from_dict(example))
+
+    def test_bulk_get(self):
+        example = {'results': [
+            {'id': 'a', 'docs': [{'ok': self.document}]},
+            {'id': 'b', 'docs': [{'error': {'id': 'b', 'error': 'not_found', 'reason': 'missing'}}]},
+        ]}
+        result = LazyBulkGetResult.from_dict(example)
+        self.assertEqual(result.results[0].docs[0].ok._id, 'a')
+        self.assertIsInstance(result.results[1].docs[0].error, DocumentResult)
+        self.assertEqual(result.to_dict(), BulkGetResult.from_dict(example).to_dict())
@@ -0,0 +1,214 @@
+# coding: utf-8
+
+# © Copyright IBM Corporation 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Test the multi-database changes follower
+"""
+
+import json
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+
+import responses
+from conftest import MockClientBaseCase
+
+from ibmcloudant import MultiDatabaseChangesFollower
+from ibmcloudant.cloudant_v1 import ChangesResultItem
+
+
+class TestMultiDatabaseChangesFollower(MockClientBaseCase):
+
+    _base_url = 'http://localhost:5984'
+
+    def setUp(self):
+        # The number of changes of each database
+        self.changes = {}
+        self.errors = {}
+        self.lock = threading.Lock()
+        self.polls = Counter()
+
+    def changes_callback(self, request):
+        db = request.path_url.split('/')[1]
+        with self.lock:
+            self.polls[db] += 1
+            error = self.errors.get(db)
+            if error is not None:
+                if error[1] == 0:
+                    del self.errors[db]
+                else:
+                    self.errors[db] = (error[0], error[1] - 1)
+                    return (error[0], {}, json.dumps({'error': 'error'}))
+            total = self.changes.get(db, 0)
+        since = request.params['since']
+        start = total if since == 'now' else int(since)
+        stop = min(start + int(request.params['limit']), total)
+        items = [{'id': f'{db}-{idx}', 'seq': str(idx), 'changes': [{'rev': '1-a'}]} for idx in range(start + 1, stop + 1)]
+        return (200, {}, json.dumps({'results': items, 'last_seq': str(stop), 'pending': total - stop}))
+
+    def mock_server(self):
+        responses.add_callback(responses.POST, re.compile(rf'{self._base_url}/[^/]+/_changes.*'),
+                               self.changes_callback, content_type='application/json')
+
+    def wait_for_polls(self, *dbs):
+        # Changes made before the first poll from "now" are not received
+        while not all(self.polls[db] for db in dbs):
+            time.sleep(0.01)
+
+    def add_changes(self, db, count):
+        with self.lock:
+            self.changes[db] = self.changes.get(db, 0) + count
+
+    @responses.activate
+    def test_start_one_off(self):
+        self.mock_server()
+        for db, count in (('a', 5), ('b', 3), ('c', 0)):
+            self.add_changes(db, count)
+        follower = MultiDatabaseChangesFollower(self.client, ['a', 'b', 'c'], batch_size=2, workers=2)
+        received = defaultdict(list)
+        for db, change in follower.start_one_off():
+            self.assertIsInstance(change, ChangesResultItem)
+            received[db].append(change.id)
+        self.assertEqual(received, {'a': [f'a-{idx}' for idx in range(1, 6)], 'b': ['b-1', 'b-2', 'b-3']})
+        self.assertEqual(follower.since, {'a': '5', 'b': '3', 'c': '0'})
+        self.assertEqual(follower.errors, {})
+
+    @responses.activate
+    def test_discover_databases(self):
+        self.mock_server()
+        responses.get(f'{self._base_url}/_all_dbs', json=['a', 'b'])
+        self.add_changes('a', 2)
+        self.add_changes('b', 2)
+        follower = MultiDatabaseChangesFollower(self.client, raw=True)
+        received = sorted(change['id'] for _, change in follower.start_one_off())
+        self.assertEqual(received, ['a-1', 'a-2', 'b-1', 'b-2'])
+
+    @responses.activate
+    def test_resume_since(self):
+        self.mock_server()
+        self.add_changes('a', 5)
+        follower = MultiDatabaseChangesFollower(self.client, ['a'], since={'a': '3'})
+        self.assertEqual([change.id for _, change in follower.start_one_off()], ['a-4', 'a-5'])
+
+    @responses.activate
+    def test_since_after_processing(self):
+        self.mock_server()
+        self.add_changes('a', 4)
+        follower = MultiDatabaseChangesFollower(self.client, ['a'], batch_size=2)
+        changes = follower.start_one_off()
+        for _ in range(2):
+            next(changes)
+        self.assertEqual(follower.since, {}, 'The last change of the batch is being processed.')
+        next(changes)
+        self.assertEqual(follower.since, {'a': '2'})
+
+    @responses.activate
+    def test_idle_databases_polled_less(self):
+        self.mock_server()
+        follower = MultiDatabaseChangesFollower(self.client, ['busy', 'idle'], min_interval=10, max_interval=400)
+        changes = follower.start()
+        self.wait_for_polls('busy', 'idle')
+        received = []
+        deadline = time.monotonic() + 1
+        while time.monotonic() < deadline:
+            self.add_changes('busy', 1)
+            db, change = next(changes)
+            received.append(db)
+        follower.stop()
+        self.assertEqual(set(received), {'busy'})
+        self.assertGreater(self.polls['busy'], 20)
+        # 0, 10, 30, 70, 150, 310 and 710 ms
+        self.assertLessEqual(self.polls['idle'], 7)
+
+    @responses.activate
+    def test_listen(self):
+        self.mock_server()
+        self.add_changes('a', 5)
+        follower = MultiDatabaseChangesFollower(self.client, ['a', 'b'], min_interval=10, max_interval=20)
+        changes = follower.start()
+        self.wait_for_polls('a', 'b')
+        self.add_changes('b', 1)
+        # The changes before start are skipped
+        self.assertEqual(next(changes)[1].id, 'b-1')
+        self.add_changes('a', 1)
+        self.assertEqual(next(changes)[1].id, 'a-6')
+        follower.stop()
+        self.assertEqual(list(changes), [])
+
+    @responses.activate
+    def test_terminal_error(self):
+        self.mock_server()
+        self.add_changes('a', 2)
+        self.errors['gone'] = (404, 1)
+        follower = MultiDatabaseChangesFollower(self.client, ['a', 'gone'])
+        with self.assertLogs('ibmcloudant.features.multi_database_changes_follower', level='WARNING'):
+            received = [db for db, _ in follower.start_one_off()]
+        self.assertEqual(received, ['a', 'a'])
+        self.assertEqual(list(follower.errors), ['gone'])
+        self.assertEqual(follower.errors['gone'].status_code, 404)
+
+    @responses.activate
+    def test_transient_error(self):
+        self.mock_server()
+        self.add_changes('a', 2)
+        self.errors['a'] = (500, 2)
+        follower = MultiDatabaseChangesFollower(self.client, ['a'], min_interval=1, max_interval=10)
+        self.assertEqual(len(list(follower.start_one_off())), 2)
+        self.assertEqual(self.polls['a'], 3)
+        self.assertEqual(follower.errors, {})
+
+    @responses.activate
+    def test_error_tolerance(self):
+        self.mock_server()
+        self.add_changes('a', 2)
+        self.add_changes('b', 2)
+        self.errors['b'] = (500, 1000)
+        follower = MultiDatabaseChangesFollower(self.client, ['a', 'b'], min_interval=1, max_interval=10,
+                                                error_tolerance=50)
+        with self.assertLogs('ibmcloudant.features.multi_database_changes_follower', level='WARNING'):
+            received = [db for db, _ in follower.start_one_off()]
+        self.assertEqual(received, ['a', 'a'])
+        self.assertEqual(follower.errors['b'].status_code, 500)
+        self.assertGreater(self.polls['b'], 1, 'The transient errors should be retried within the tolerance.')
+
+    @responses.activate
+    def test_invalid_response(self):
+        responses.post(f'{self._base_url}/a/_changes', json={'results': []})
+        follower = MultiDatabaseChangesFollower(self.client, ['a'], min_interval=1, max_interval=10)
+        with self.assertLogs('ibmcloudant.features.multi_database_changes_follower', level='WARNING'):
+            self.assertEqual(list(follower.start_one_off()), [])
+        self.assertIsInstance(follower.errors['a'], KeyError)
+        self.assertEqual(len(responses.calls), 1, 'The error should not be retried.')
+
+    @responses.activate
+    def test_start_twice(self):
+        self.mock_server()
+        follower = MultiDatabaseChangesFollower(self.client, ['a'])
+        list(follower.start_one_off())
+        with self.assertRaisesRegex(RuntimeError, 'Cannot start a feed that has already started.'):
+            follower.start()
+
+    def test_validation(self):
+        for name, value, minimum in (('workers', 0, 1), ('batch_size', 0, 1), ('min_interval', -1, 0),
+                                     ('max_interval', 999, 1000)):
+            with self.subTest(name):
+                with self.assertRaisesRegex(ValueError, f'The provided {name} {value} must be at least {minimum}.'):
+                    MultiDatabaseChangesFollower(self.client, ['a'], **{name: value})
+        with self.assertRaisesRegex(ValueError, 'The provided error_tolerance -1 must be at least 0.'):
+            MultiDatabaseChangesFollower(self.client, ['a'], error_tolerance=-1)
+        with self.assertRaisesRegex(ValueError, 'The options feed, limit are invalid'):
+            MultiDatabaseChangesFollower(self.client, ['a'], feed='longpoll', limit=1)
@@ -205,3 +205,16 @@ class TestPaginationOperations(MockClientBaseCase):
           pager.get_next()
           # Assert second page has no skip option
           self.assertIsNone(pager._iterator._next_page_opts.get('skip'), 'The skip option should be absent for the next page')
+
+  def test_rows_raw(self):
+    for pager_type in PagerType:
+      with self.subTest(pager_type):
+        for page_set in self.page_sets:
+          with self.subTest(page_set):
+            expected_items_count: int = page_set[0]
+            page_size: int = page_set[1]
+            mock = PaginationMockResponse(expected_items_count, page_size, pager_type)
+            with patch(PaginationMockSupport.operation_map[pager_type], mock.get_next_page):
+              actual_rows = list(Pagination.new_pagination(self.client, pager_type, raw=True, limit=page_size).rows())
+            self.assertTrue(all(isinstance(row, dict) for row in actual_rows), 'The rows should be dicts.')
+            self.assertEqual(actual_rows, [row.to_dict() for row in mock.all_expected_items()], 'The rows should match the expected rows.')
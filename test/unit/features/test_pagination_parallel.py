@@ -0,0 +1,150 @@
+# coding: utf-8
+
+# © Copyright IBM Corporation 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from threading import Lock
+from unittest.mock import patch
+
+from conftest import MockClientBaseCase, PaginationMockSupport
+from ibm_cloud_sdk_core import DetailedResponse
+from ibmcloudant.features.pagination import PagerType, Pagination
+
+class KeyRangeMockOperation:
+  """
+  Test class for mocking key based operations that honor key ranges, skip and limit.
+  """
+  def __init__(self, rows: list[dict]):
+    self.rows: list[dict] = sorted(rows, key=lambda row: (row['key'], row['id']))
+    self.requests: list[dict] = []
+    self.lock = Lock()
+
+  def __call__(self, *args, **kwargs) -> DetailedResponse:
+    with self.lock:
+      self.requests.append(kwargs)
+    rows = self.rows
+    if 'start_key' in kwargs:
+      start = (kwargs['start_key'], kwargs.get('start_key_doc_id', ''))
+      rows = [row for row in rows if (row['key'], row['id']) >= start]
+    if 'end_key' in kwargs:
+      if kwargs.get('inclusive_end', True):
+        rows = [row for row in rows if row['key'] <= kwargs['end_key']]
+      else:
+        rows = [row for row in rows if row['key'] < kwargs['end_key']]
+    skip = kwargs.get('skip', 0)
+    rows = rows[skip:skip + kwargs['limit']]
+    return DetailedResponse(response={'total_rows': len(self.rows), 'rows': rows})
+
+class TestPaginationParallel(MockClientBaseCase):
+
+  def make_rows(self, pager_type: PagerType, total: int) -> list[dict]:
+    rows = []
+    for i in range(total):
+      row = PaginationMockSupport.make_row(pager_type, i)
+      if pager_type in PaginationMockSupport.all_docs_pagers:
+        row['key'] = row['id'] = f'testdoc{i:04}'
+      rows.append(row)
+    return rows
+
+  def test_parallel_rows_all_rows(self):
+    for pager_type in PaginationMockSupport.key_pagers:
+      with self.subTest(pager_type):
+        mock = KeyRangeMockOperation(self.make_rows(pager_type, 95))
+        with patch(PaginationMockSupport.operation_map[pager_type], mock):
+          actual_ids = [row.id for row in Pagination.new_pagination(self.client, pager_type, limit=10).parallel_rows(ranges=4)]
+        self.assertEqual(len(actual_ids), 95, 'There should be the expected number of rows.')
+        self.assertEqual(set(actual_ids), {row['id'] for row in mock.rows}, 'All the rows should be returned.')
+
+  def test_parallel_rows_ordered(self):
+    mock = KeyRangeMockOperation(self.make_rows(PagerType.POST_VIEW, 123))
+    pagination = Pagination.new_pagination(self.client, PagerType.POST_VIEW, limit=7)
+    with patch(PaginationMockSupport.operation_map[PagerType.POST_VIEW], mock):
+      expected_rows = list(pagination.rows())
+      actual_rows = list(pagination.parallel_rows(ranges=5, ordered=True))
+    self.assertSequenceEqual(actual_rows, expected_rows, 'The ordered rows should match the serial rows.')
+
+  def test_parallel_rows_duplicate_keys(self):
+    # Groups of 10 rows have the same key so sampled boundaries repeat
+    rows = [{'id': f'testdoc{i:04}', 'key': i // 10, 'value': 1} for i in range(50)]
+    mock = KeyRangeMockOperation(rows)
+    with patch(PaginationMockSupport.operation_map[PagerType.POST_VIEW], mock):
+      actual_rows = list(Pagination.new_pagination(self.client, PagerType.POST_VIEW, limit=3).parallel_rows(ranges=8, ordered=True))
+    self.assertEqual([row.id for row in actual_rows], [row['id'] for row in mock.rows], 'The rows should not be repeated or missing.')
+
+  def test_parallel_rows_boundaries(self):
+    mock = KeyRangeMockOperation(self.make_rows(PagerType.POST_ALL_DOCS, 30))
+    boundaries = ['testdoc0010', 'testdoc0020']
+    with patch(PaginationMockSupport.operation_map[PagerType.POST_ALL_DOCS], mock):
+      actual_rows = list(Pagination.new_pagination(self.client, PagerType.POST_ALL_DOCS, limit=20, start_key='testdoc0005').parallel_rows(boundaries=boundaries, ordered=True))
+    self.assertEqual([row.id for row in actual_rows], [f'testdoc{i:04}' for i in range(5, 30)], 'The rows should start from the start key.')
+    # No sampling requests are made with boundaries
+    self.assertFalse(any('skip' in request for request in mock.requests), 'There should be no sampling requests.')
+    first_requests = sorted((r.get('start_key'), r.get('end_key'), r.get('inclusive_end')) for r in mock.requests)
+    self.assertEqual(first_requests, [
+      ('testdoc0005', 'testdoc0010', False),
+      ('testdoc0010', 'testdoc0020', False),
+      ('testdoc0020', None, None),
+    ], 'Each range should request the expected keys.')
+
+  def test_parallel_rows_more_ranges_than_workers(self):
+    mock = KeyRangeMockOperation(self.make_rows(PagerType.POST_VIEW, 100))
+    lock = Lock()
+    active = [0, 0]
+    def counting_operation(*args, **kwargs):
+      with lock:
+        active[0] += 1
+        active[1] = max(active)
+      try:
+        time.sleep(0.001)
+        return mock(*args, **kwargs)
+      finally:
+        with lock:
+          active[0] -= 1
+    boundaries = list(range(10, 100, 10))
+    for ordered in (False, True):
+      with self.subTest(ordered=ordered):
+        active[1] = 0
+        with patch(PaginationMockSupport.operation_map[PagerType.POST_VIEW], counting_operation):
+          actual_rows = list(Pagination.new_pagination(self.client, PagerType.POST_VIEW, limit=3).parallel_rows(boundaries=boundaries, ordered=ordered, workers=2))
+        self.assertEqual(sorted(row.id for row in actual_rows), sorted(row['id'] for row in mock.rows), 'All the rows should be returned.')
+        self.assertLessEqual(active[1], 2, 'There should be at most workers concurrent requests.')
+
+  def test_parallel_rows_error(self):
+    mock = KeyRangeMockOperation(self.make_rows(PagerType.POST_VIEW, 30))
+    def failing_operation(*args, **kwargs):
+      if kwargs.get('start_key') == 20:
+        raise Exception('test exception')
+      return mock(*args, **kwargs)
+    with patch(PaginationMockSupport.operation_map[PagerType.POST_VIEW], failing_operation):
+      with self.assertRaisesRegex(Exception, 'test exception'):
+        list(Pagination.new_pagination(self.client, PagerType.POST_VIEW, limit=5).parallel_rows(boundaries=[10, 20]))
+
+  def test_parallel_rows_invalid_pager_type(self):
+    for pager_type in PaginationMockSupport.find_pagers + PaginationMockSupport.search_pagers:
+      with self.subTest(pager_type):
+        with self.assertRaisesRegex(ValueError, 'Parallel rows are only available for the key based pager types.'):
+          Pagination.new_pagination(self.client, pager_type).parallel_rows()
+
+  def test_parallel_rows_invalid_skip(self):
+    with self.assertRaisesRegex(ValueError, "The option 'skip' is invalid when using pagination."):
+      Pagination.new_pagination(self.client, PagerType.POST_VIEW, skip=10).parallel_rows()
+
+  def test_parallel_rows_invalid_ranges(self):
+    with self.assertRaisesRegex(ValueError, 'The provided ranges 0 must be at least 1.'):
+      Pagination.new_pagination(self.client, PagerType.POST_VIEW).parallel_rows(ranges=0)
+
+  def test_parallel_rows_invalid_workers(self):
+    with self.assertRaisesRegex(ValueError, 'The provided workers 0 must be at least 1.'):
+      Pagination.new_pagination(self.client, PagerType.POST_VIEW).parallel_rows(workers=0)
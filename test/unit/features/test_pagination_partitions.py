@@ -0,0 +1,104 @@
+# coding: utf-8
+
+# © Copyright IBM Corporation 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from threading import Lock
+from time import sleep
+from unittest.mock import patch
+
+from conftest import MockClientBaseCase, PaginationMockSupport, PaginationMockResponse
+from ibmcloudant.features.pagination import PagerType, Pagination
+
+class PartitionMockOperation:
+  """
+  Test class for mocking page responses for each partition.
+  """
+  def __init__(self, partition_keys: list[str], total_items: int, page_size: int, pager_type: PagerType):
+    self.responses: dict[str, PaginationMockResponse] = {
+      partition_key: PaginationMockResponse(total_items, page_size, pager_type) for partition_key in partition_keys
+    }
+    self.lock = Lock()
+    self.in_flight = 0
+    self.max_in_flight = 0
+
+  def __call__(self, *args, **kwargs):
+    with self.lock:
+      self.in_flight += 1
+      self.max_in_flight = max(self.max_in_flight, self.in_flight)
+    try:
+      sleep(0.001)
+      return self.responses[kwargs['partition_key']].get_next_page(**kwargs)
+    finally:
+      with self.lock:
+        self.in_flight -= 1
+
+  def expected_rows(self) -> set[tuple[str, str]]:
+    return {(partition_key, self.row_id(row))
+            for partition_key, response in self.responses.items()
+            for row in response.all_expected_items()}
+
+  @staticmethod
+  def row_id(row) -> str:
+    return row._id if hasattr(row, '_id') else row.id
+
+class TestPaginationPartitions(MockClientBaseCase):
+
+  partition_pagers = (
+    PagerType.POST_PARTITION_ALL_DOCS,
+    PagerType.POST_PARTITION_FIND,
+    PagerType.POST_PARTITION_SEARCH,
+    PagerType.POST_PARTITION_VIEW,
+  )
+
+  def test_partition_rows(self):
+    partition_keys = [f'partition{i}' for i in range(10)]
+    for pager_type in self.partition_pagers:
+      with self.subTest(pager_type):
+        mock = PartitionMockOperation(partition_keys, 25, 10, pager_type)
+        with patch(PaginationMockSupport.operation_map[pager_type], mock):
+          actual_rows = [(partition_key, mock.row_id(row))
+                         for partition_key, row in Pagination.partition_rows(self.client, pager_type, partition_keys, limit=10)]
+        self.assertEqual(len(actual_rows), 250, 'There should be the expected number of rows.')
+        self.assertEqual(set(actual_rows), mock.expected_rows(), 'The rows should be tagged with their partition.')
+
+  def test_partition_rows_bounded_workers(self):
+    partition_keys = (f'partition{i}' for i in range(20))
+    mock = PartitionMockOperation([f'partition{i}' for i in range(20)], 30, 10, PagerType.POST_PARTITION_FIND)
+    with patch(PaginationMockSupport.operation_map[PagerType.POST_PARTITION_FIND], mock):
+      actual_rows = list(Pagination.partition_rows(self.client, PagerType.POST_PARTITION_FIND, partition_keys, workers=3, limit=10))
+    self.assertEqual(len(actual_rows), 600, 'There should be the expected number of rows.')
+    self.assertLessEqual(mock.max_in_flight, 3, 'There should be no more requests in flight than workers.')
+
+  def test_partition_rows_error(self):
+    mock = PartitionMockOperation(['partition0'], 25, 10, PagerType.POST_PARTITION_VIEW)
+    with patch(PaginationMockSupport.operation_map[PagerType.POST_PARTITION_VIEW], mock):
+      with self.assertRaises(KeyError):
+        list(Pagination.partition_rows(self.client, PagerType.POST_PARTITION_VIEW, ['partition0', 'unknown'], limit=10))
+
+  def test_partition_rows_invalid_pager_type(self):
+    with self.assertRaisesRegex(ValueError, 'The pager type POST_VIEW is not a partitioned pager type.'):
+      Pagination.partition_rows(self.client, PagerType.POST_VIEW, ['partition0'])
+
+  def test_partition_rows_invalid_partition_key(self):
+    with self.assertRaisesRegex(ValueError, "The option 'partition_key' is invalid when using pagination. Use 'partition_keys' instead."):
+      Pagination.partition_rows(self.client, PagerType.POST_PARTITION_FIND, ['partition0'], partition_key='partition1')
+
+  def test_partition_rows_invalid_workers(self):
+    with self.assertRaisesRegex(ValueError, 'The provided workers 0 must be at least 1.'):
+      Pagination.partition_rows(self.client, PagerType.POST_PARTITION_FIND, ['partition0'], workers=0)
+
+  def test_partition_rows_invalid_options(self):
+    with self.assertRaisesRegex(ValueError, 'The provided limit 201 exceeds the maximum page size value of 200.'):
+      Pagination.partition_rows(self.client, PagerType.POST_PARTITION_FIND, ['partition0'], limit=201)
@@ -0,0 +1,111 @@
+# coding: utf-8
+
+# © Copyright IBM Corporation 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gc
+import time
+from threading import Event
+from unittest.mock import Mock, patch
+
+from conftest import MockClientBaseCase, PaginationMockSupport, PaginationMockResponse
+from ibmcloudant.features.pagination import _PrefetchPageIterator, PagerType, Pagination
+
+class TestPaginationPrefetch(MockClientBaseCase):
+
+  page_size = 10
+
+  def test_prefetch_rows_match(self):
+    for pager_type in PagerType:
+      with self.subTest(pager_type):
+        for prefetch in (1, 2, 5):
+          with self.subTest(prefetch):
+            mock = PaginationMockResponse(3 * self.page_size + 1, self.page_size, pager_type)
+            with patch(PaginationMockSupport.operation_map[pager_type], mock.get_next_page):
+              actual_rows = list(Pagination.new_pagination(self.client, pager_type, limit=self.page_size).rows(prefetch=prefetch))
+            self.assertSequenceEqual(actual_rows, mock.all_expected_items(), 'The rows should match the expected rows.')
+
+  def test_prefetch_pages_match(self):
+    mock = PaginationMockResponse(3 * self.page_size, self.page_size, PagerType.POST_VIEW)
+    with patch(PaginationMockSupport.operation_map[PagerType.POST_VIEW], mock.get_next_page):
+      pages = Pagination.new_pagination(self.client, PagerType.POST_VIEW, limit=self.page_size).pages(prefetch=2)
+      self.assertIsInstance(pages, _PrefetchPageIterator)
+      actual_pages = list(pages)
+    self.assertEqual(len(actual_pages), 3, 'There should be the expected number of pages.')
+    for page_number, page in enumerate(actual_pages, start=1):
+      self.assertSequenceEqual(page, mock.get_expected_page(page_number), 'The page should match the expected page.')
+
+  def test_prefetch_requests_ahead(self):
+    mock = PaginationMockResponse(5 * self.page_size, self.page_size, PagerType.POST_FIND)
+    requested = Event()
+    def get_next_page(*args, **kwargs):
+      page = mock.get_next_page(**kwargs)
+      if len(mock.expected_pages) == 3:
+        requested.set()
+      return page
+    with patch(PaginationMockSupport.operation_map[PagerType.POST_FIND], get_next_page):
+      pages = Pagination.new_pagination(self.client, PagerType.POST_FIND, limit=self.page_size).pages(prefetch=2)
+      next(pages)
+      # The two pages after the first are requested without consuming them
+      self.assertTrue(requested.wait(5), 'The following pages should be requested in the background.')
+      pages.close()
+    self.assertEqual(len(mock.expected_pages), 3, 'Only the prefetch pages should be requested.')
+
+  def test_prefetch_abandoned_stops_requests(self):
+    for abandon in ('pages', 'rows', 'context'):
+      with self.subTest(abandon):
+        mock = PaginationMockResponse(10 * self.page_size, self.page_size, PagerType.POST_VIEW)
+        second_requested = Event()
+        release = Event()
+        calls = []
+        def get_next_page(*args, **kwargs):
+          calls.append(kwargs)
+          if len(calls) == 2:
+            # Hold the second request until the iteration is abandoned
+            second_requested.set()
+            release.wait(5)
+          return mock.get_next_page(**kwargs)
+        with patch(PaginationMockSupport.operation_map[PagerType.POST_VIEW], get_next_page):
+          pagination = Pagination.new_pagination(self.client, PagerType.POST_VIEW, limit=self.page_size)
+          if abandon == 'pages':
+            for _ in pagination.pages(prefetch=3):
+              self.assertTrue(second_requested.wait(5))
+              break
+          elif abandon == 'rows':
+            for _ in pagination.rows(prefetch=3):
+              self.assertTrue(second_requested.wait(5))
+              break
+          else:
+            with pagination.pages(prefetch=3) as pages:
+              next(pages)
+              self.assertTrue(second_requested.wait(5))
+          gc.collect()
+          release.set()
+          time.sleep(0.2)
+        self.assertEqual(len(calls), 2, 'The queued page requests should not be made.')
+
+  def test_prefetch_error_stops_requests(self):
+    mock = Mock(side_effect=Exception('test exception'))
+    with patch(PaginationMockSupport.operation_map[PagerType.POST_VIEW], mock):
+      with self.assertRaisesRegex(Exception, 'test exception'):
+        list(Pagination.new_pagination(self.client, PagerType.POST_VIEW, limit=self.page_size).rows(prefetch=3))
+    self.assertEqual(mock.call_count, 1, 'There should be no requests after an error.')
+
+  def test_prefetch_zero_is_not_wrapped(self):
+    pages = Pagination.new_pagination(self.client, PagerType.POST_VIEW, limit=self.page_size).pages(prefetch=0)
+    self.assertNotIsInstance(pages, _PrefetchPageIterator)
+
+  def test_prefetch_negative(self):
+    with self.assertRaisesRegex(ValueError, 'The provided prefetch -1 must not be negative.'):
+      Pagination.new_pagination(self.client, PagerType.POST_VIEW).pages(prefetch=-1)
@@ -0,0 +1,193 @@
+# coding: utf-8
+
+# © Copyright IBM Corporation 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Test the parallel changes follower
+"""
+
+import json
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import responses
+from conftest import ChangesFollowerBaseCase
+
+from ibmcloudant import MemoryCheckpointStore, ParallelChangesFollower
+from ibmcloudant.cloudant_v1 import ChangesResultItem
+from ibmcloudant.features.changes_follower import _BATCH_SIZE
+
+
+class RecordingCheckpointStore(MemoryCheckpointStore):
+    def __init__(self, seq=None):
+        super().__init__(seq)
+        self.saves = []
+
+    def save(self, seq):
+        super().save(seq)
+        self.saves.append(seq)
+
+
+class TestParallelChangesFollower(ChangesFollowerBaseCase):
+
+    def setUp(self):
+        self.lock = threading.Lock()
+        self.handled = []
+
+    def record(self, change):
+        with self.lock:
+            self.handled.append((threading.current_thread().name, change))
+
+    def prepare_mock_repeated_changes(self, batches):
+        """
+        Mocks batches of changes of the same documents a, b, c and d.
+        """
+        def changes_callback(request):
+            batch_num = len(mock.calls)
+            items = []
+            if batch_num < batches:
+                items = [{'id': doc_id, 'seq': f'{batch_num}{doc_id}', 'changes': [{'rev': f'{batch_num}-x'}]}
+                         for doc_id in 'abcd']
+            resp = {'results': items, 'last_seq': f'{batch_num}-x', 'pending': max(batches - batch_num - 1, 0)}
+            return (200, {}, json.dumps(resp))
+
+        mock = responses.add_callback(
+            responses.POST,
+            'http://localhost:5984/db/_changes',
+            content_type='application/json',
+            callback=changes_callback,
+        )
+        return mock
+
+    @responses.activate
+    def test_start_one_off(self):
+        self.prepare_mock_changes(batches=3)
+        follower = ParallelChangesFollower(self.client, self.record, db='db', workers=3)
+        follower.start_one_off()
+        self.assertTrue(follower.join(10), 'The follower should finish.')
+        self.assertIsNone(follower.error)
+        self.assertEqual(len(self.handled), 3 * _BATCH_SIZE)
+        self.assertIsInstance(self.handled[0][1], ChangesResultItem)
+        self.assertEqual(len({change.id for _, change in self.handled}), 3 * _BATCH_SIZE)
+        self.assertEqual(len({thread for thread, _ in self.handled}), 3, 'Every worker should handle changes.')
+        self.assertEqual(follower.since, f'{3 * _BATCH_SIZE}-abcdef')
+
+    @responses.activate
+    def test_document_order(self):
+        self.prepare_mock_repeated_changes(batches=20)
+        follower = ParallelChangesFollower(self.client, self.record, db='db', workers=2, raw=True)
+        follower.start_one_off()
+        self.assertTrue(follower.join(10), 'The follower should finish.')
+        threads = defaultdict(set)
+        seqs = defaultdict(list)
+        for thread, change in self.handled:
+            threads[change['id']].add(thread)
+            seqs[change['id']].append(change['seq'])
+        for doc_id in 'abcd':
+            self.assertEqual(len(threads[doc_id]), 1, 'A document should be handled by one worker.')
+            self.assertEqual(seqs[doc_id], [f'{batch_num}{doc_id}' for batch_num in range(20)])
+
+    @responses.activate
+    def test_checkpoint_waits_for_every_worker(self):
+        self.prepare_mock_changes(batches=3)
+        blocked = threading.Event()
+        release = threading.Event()
+
+        def handler(change):
+            if change.id == '000001':
+                blocked.set()
+                release.wait(10)
+            self.record(change)
+
+        store = RecordingCheckpointStore()
+        follower = ParallelChangesFollower(
+            self.client, handler, db='db', checkpoint_store=store, checkpoint_interval=0, queue_size=3 * _BATCH_SIZE
+        )
+        follower.start_one_off()
+        self.assertTrue(blocked.wait(10))
+        # The other workers process the changes after the blocked change
+        while len(self.handled) < 2 * _BATCH_SIZE:
+            self.assertTrue(follower.is_running())
+            threading.Event().wait(0.01)
+        self.assertIsNone(follower.since)
+        self.assertEqual(store.saves, [])
+        release.set()
+        self.assertTrue(follower.join(10), 'The follower should finish.')
+        self.assertEqual(follower.since, f'{3 * _BATCH_SIZE}-abcdef')
+        self.assertEqual(store.saves[-1], f'{3 * _BATCH_SIZE}-abcdef')
+
+    @responses.activate
+    def test_handler_error(self):
+        self.prepare_mock_changes(batches=3)
+        error = ValueError('bad change')
+
+        def handler(change):
+            if change.id == f'{_BATCH_SIZE + 1:06}':
+                raise error
+            self.record(change)
+
+        store = RecordingCheckpointStore()
+        follower = ParallelChangesFollower(self.client, handler, db='db', checkpoint_store=store)
+        follower.start_one_off()
+        self.assertTrue(follower.join(10), 'The follower should stop.')
+        self.assertIs(follower.error, error)
+        self.assertNotIn(f'{_BATCH_SIZE + 1:06}', [change.id for _, change in self.handled])
+        # The checkpoint does not pass the batch of the failed change
+        self.assertIn(store.seq, (None, f'{_BATCH_SIZE}-abcdef'))
+        follower.stop()
+
+    @responses.activate
+    def test_feed_error(self):
+        self.prepare_mock_with_error('forbidden')
+        follower = ParallelChangesFollower(self.client, self.record, db='db')
+        follower.start_one_off()
+        self.assertTrue(follower.join(10), 'The follower should stop.')
+        self.assertEqual(follower.error.status_code, 403)
+
+    @responses.activate
+    def test_executor(self):
+        self.prepare_mock_changes(batches=1)
+        with ThreadPoolExecutor(2, thread_name_prefix='executor') as executor:
+            follower = ParallelChangesFollower(self.client, self.record, db='db', executor=executor)
+            follower.start_one_off()
+            self.assertTrue(follower.join(10), 'The follower should finish.')
+        self.assertEqual(len(self.handled), _BATCH_SIZE)
+        self.assertTrue(all(thread.startswith('executor') for thread, _ in self.handled))
+
+    @responses.activate
+    def test_resume_from_checkpoint(self):
+        mock = self.prepare_mock_changes(batches=1)
+        store = MemoryCheckpointStore('5-abcdef')
+        follower = ParallelChangesFollower(self.client, self.record, db='db', since='1-abcdef', checkpoint_store=store)
+        follower.start_one_off()
+        self.assertTrue(follower.join(10), 'The follower should finish.')
+        self.assertEqual(mock.calls[0].request.params['since'], '5-abcdef')
+
+    @responses.activate
+    def test_stop(self):
+        self.prepare_mock_changes(batches=1000)
+        with ParallelChangesFollower(self.client, self.record, db='db') as follower:
+            self.assertRaisesRegex(RuntimeError, 'Cannot start a follower that has already started.', follower.start)
+        self.assertFalse(follower.is_running())
+        self.assertIsNone(follower.error)
+
+    def test_validation(self):
+        for name, minimum in (('workers', 1), ('queue_size', 1), ('checkpoint_interval', 0)):
+            with self.subTest(name):
+                with self.assertRaisesRegex(ValueError, f'The provided {name} -1 must be at least {minimum}.'):
+                    ParallelChangesFollower(self.client, self.record, db='db', **{name: -1})
+        with self.assertRaisesRegex(ValueError, 'The option db must be provided'):
+            ParallelChangesFollower(self.client, self.record)
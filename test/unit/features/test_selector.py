@@ -0,0 +1,154 @@
+# coding: utf-8
+
+# © Copyright IBM Corporation 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Test the client-side selector evaluation
+"""
+
+import unittest
+
+from ibmcloudant import Selector
+
+
+class TestSelector(unittest.TestCase):
+
+    doc = {
+        '_id': 'movie1',
+        'title': 'Alien',
+        'year': 1979,
+        'rating': 8.5,
+        'watched': True,
+        'sequel': None,
+        'genre': ['horror', 'sci-fi'],
+        'cast': [{'name': 'Sigourney Weaver', 'role': 'Ripley'}, {'name': 'Ian Holm', 'role': 'Ash'}],
+        'imdb': {'votes': 900000, 'tags': {'classic': 1, 'space': 2}},
+        'a.b': 'dotted',
+    }
+
+    def assertMatches(self, selector, doc=None):
+        self.assertTrue(Selector(selector).matches(self.doc if doc is None else doc), selector)
+
+    def assertNotMatches(self, selector, doc=None):
+        self.assertFalse(Selector(selector).matches(self.doc if doc is None else doc), selector)
+
+    def test_equality(self):
+        self.assertMatches({})
+        self.assertMatches({'title': 'Alien'})
+        self.assertMatches({'title': {'$eq': 'Alien'}, 'year': 1979.0})
+        self.assertMatches({'genre': ['horror', 'sci-fi']})
+        self.assertMatches({'sequel': None})
+        self.assertNotMatches({'title': 'Aliens'})
+        self.assertNotMatches({'genre': ['horror']})
+        # true is not equal to 1
+        self.assertNotMatches({'watched': 1})
+        self.assertMatches({'watched': {'$ne': 1}})
+        self.assertNotMatches({'title': {'$ne': 'Alien'}})
+
+    def test_field_paths(self):
+        self.assertMatches({'imdb.votes': {'$gt': 100}})
+        self.assertMatches({'imdb': {'tags': {'space': 2}}})
+        self.assertMatches({'cast.0.role': 'Ripley'})
+        self.assertMatches({'a\\.b': 'dotted'})
+        self.assertNotMatches({'cast.2.role': 'Ripley'})
+        self.assertNotMatches({'title.length': 5})
+
+    def test_comparison(self):
+        self.assertMatches({'year': {'$gt': 1970, '$lt': 1980}})
+        self.assertMatches({'year': {'$gte': 1979, '$lte': 1979}})
+        self.assertMatches({'title': {'$gte': 'A', '$lt': 'B'}})
+        self.assertNotMatches({'rating': {'$gt': 9}})
+        # Values of different types are ordered by the collation
+        self.assertMatches({'title': {'$gt': 1000000}})
+        self.assertMatches({'year': {'$lt': 'a'}})
+        self.assertMatches({'sequel': {'$lt': False}})
+        self.assertMatches({'watched': {'$lt': 0}})
+        self.assertMatches({'genre': {'$gt': ['horror']}})
+        self.assertMatches({'imdb': {'$gt': ['z']}})
+
+    def test_missing_fields(self):
+        self.assertNotMatches({'director': {'$ne': 'Scott'}})
+        self.assertNotMatches({'director': {'$nin': ['Scott']}})
+        self.assertNotMatches({'director': {'$exists': True}})
+        self.assertMatches({'director': {'$exists': False}})
+        self.assertMatches({'title': {'$exists': True}})
+        self.assertNotMatches({'title': {'$exists': False}})
+        self.assertMatches({'director': {'$not': {'$eq': 'Scott'}}})
+
+    def test_combinations(self):
+        self.assertMatches({'$and': [{'year': 1979}, {'title': 'Alien'}]})
+        self.assertMatches({'$or': [{'year': 1986}, {'title': 'Alien'}]})
+        self.assertNotMatches({'$or': [{'year': 1986}, {'title': 'Aliens'}]})
+        self.assertMatches({'$nor': [{'year': 1986}, {'title': 'Aliens'}]})
+        self.assertNotMatches({'$not': {'year': 1979}})
+        self.assertMatches({'year': {'$or': [{'$eq': 1986}, {'$eq': 1979}]}})
+        self.assertMatches({'year': {'$not': {'$gt': 1980}}})
+
+    def test_in(self):
+        self.assertMatches({'year': {'$in': [1979.0, 1986]}})
+        self.assertMatches({'genre': {'$in': ['comedy', 'horror']}})
+        self.assertMatches({'genre': {'$in': [['horror', 'sci-fi']]}}, {'genre': [['horror', 'sci-fi']]})
+        self.assertNotMatches({'watched': {'$in': [1]}})
+        self.assertNotMatches({'genre': {'$nin': ['comedy', 'horror']}})
+        self.assertMatches({'title': {'$nin': ['Aliens']}})
+
+    def test_array_operators(self):
+        self.assertMatches({'genre': {'$all': ['sci-fi', 'horror']}})
+        self.assertNotMatches({'genre': {'$all': ['sci-fi', 'comedy']}})
+        self.assertMatches({'genre': {'$size': 2}})
+        self.assertNotMatches({'title': {'$size': 5}})
+        self.assertMatches({'genre': {'$elemMatch': {'$eq': 'horror'}}})
+        self.assertMatches({'cast': {'$elemMatch': {'name': {'$regex': '^Ian'}, 'role': 'Ash'}}})
+        self.assertNotMatches({'cast': {'$elemMatch': {'name': {'$regex': '^Ian'}, 'role': 'Ripley'}}})
+        self.assertMatches({'cast': {'$allMatch': {'role': {'$exists': True}}}})
+        self.assertNotMatches({'cast': {'$allMatch': {'role': 'Ripley'}}})
+        self.assertNotMatches({'cast': {'$allMatch': {'role': 'Ripley'}}}, {'cast': []})
+        self.assertMatches({'imdb.tags': {'$keyMapMatch': {'$eq': 'space'}}})
+        self.assertNotMatches({'imdb.tags': {'$keyMapMatch': {'$eq': 'drama'}}})
+
+    def test_value_operators(self):
+        self.assertMatches({'title': {'$regex': 'li'}})
+        self.assertMatches({'title': {'$regex': '(?i)^alien$'}})
+        self.assertNotMatches({'year': {'$regex': '1979'}})
+        self.assertMatches({'title': {'$beginsWith': 'Al'}})
+        self.assertMatches({'year': {'$mod': [10, 9]}})
+        self.assertMatches({'n': {'$mod': [10, -1]}}, {'n': -11})
+        self.assertNotMatches({'rating': {'$mod': [2, 0]}})
+        for field, json_type in [('sequel', 'null'), ('watched', 'boolean'), ('year', 'number'),
+                                 ('rating', 'number'), ('title', 'string'), ('genre', 'array'),
+                                 ('imdb', 'object')]:
+            self.assertMatches({field: {'$type': json_type}})
+        self.assertNotMatches({'watched': {'$type': 'number'}})
+
+    def test_filter(self):
+        docs = [{'_id': str(i), 'n': i} for i in range(10)]
+        selector = Selector({'n': {'$gte': 7}})
+        self.assertEqual([doc['_id'] for doc in selector.filter(docs)], ['7', '8', '9'])
+        self.assertEqual(len([doc for doc in docs if selector(doc)]), 3)
+
+    def test_invalid_selectors(self):
+        for selector, message in [
+            ([], 'A selector must be an object.'),
+            ({'$or': {'a': 1}}, 'The argument of \\$or must be an array.'),
+            ({'a': {'$in': 1}}, 'The argument of \\$in must be an array.'),
+            ({'a': {'$exists': 1}}, 'The argument of \\$exists must be a boolean.'),
+            ({'a': {'$type': 'integer'}}, 'The argument of \\$type must be one of'),
+            ({'a': {'$size': '2'}}, 'The argument of \\$size must be an integer.'),
+            ({'a': {'$mod': [0, 1]}}, 'The argument of \\$mod must be an array'),
+            ({'a': {'$regex': 1}}, 'The argument of \\$regex must be a string.'),
+            ({'a': {'$text': 'alien'}}, 'The operator \\$text is not supported.'),
+        ]:
+            with self.assertRaisesRegex(ValueError, message):
+                Selector(selector)
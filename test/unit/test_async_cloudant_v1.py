@@ -0,0 +1,158 @@
+# coding: utf-8
+
+# © Copyright IBM Corporation 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the asyncio variant of the Cloudant service
+"""
+
+import asyncio
+import json
+import unittest
+
+import pytest
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+
+from ibmcloudant.async_cloudant_v1 import AsyncCloudantV1
+
+web = pytest.importorskip('aiohttp.web')
+test_utils = pytest.importorskip('aiohttp.test_utils')
+
+
+class TestAsyncCloudantV1(unittest.TestCase):
+
+    def setUp(self):
+        self.requests = []
+
+    async def _all_docs(self, request):
+        body = await request.json()
+        self.requests.append((request.method, request.path, body))
+        # Yield to the loop to allow concurrent requests to overlap
+        await asyncio.sleep(0.01)
+        return web.json_response({'total_rows': 1, 'rows': [{'id': 'a', 'key': 'a', 'value': {'rev': '1-a'}}]})
+
+    async def _get_document(self, request):
+        self.requests.append((request.method, request.path, None))
+        if request.match_info['doc_id'] == 'missing':
+            return web.json_response({'error': 'not_found', 'reason': 'missing'},
+                                     status=404, headers={'x-couch-request-id': 'abc123'})
+        return web.json_response({'_id': request.match_info['doc_id'], '_rev': '1-a'})
+
+    async def _get_attachment(self, request):
+        self.requests.append((request.method, request.path, None))
+        return web.Response(body=b'attachment', content_type='text/plain')
+
+    async def _head_database(self, request):
+        self.requests.append((request.method, request.path, None))
+        return web.Response(status=200)
+
+    def run_with_client(self, test_coroutine, **kwargs):
+        async def run():
+            app = web.Application()
+            app.router.add_post('/{db}/_all_docs', self._all_docs)
+            app.router.add_get('/{db}/{doc_id}', self._get_document)
+            app.router.add_get('/{db}/{doc_id}/{attachment_name}', self._get_attachment)
+            app.router.add_head('/{db}', self._head_database)
+            server = test_utils.TestServer(app)
+            await server.start_server()
+            client = AsyncCloudantV1(authenticator=NoAuthAuthenticator(), **kwargs)
+            client.set_service_url(str(server.make_url('')))
+            try:
+                async with client:
+                    return await test_coroutine(client)
+            finally:
+                await server.close()
+        return asyncio.run(run())
+
+    def test_operation_returns_coroutine(self):
+        async def test(client):
+            call = client.get_document(db='db', doc_id='doc')
+            self.assertTrue(asyncio.iscoroutine(call))
+            return (await call).get_result()
+        result = self.run_with_client(test)
+        self.assertEqual(result, {'_id': 'doc', '_rev': '1-a'})
+
+    def test_post_request_body(self):
+        async def test(client):
+            return await client.post_all_docs(db='db', limit=1, start_key='a')
+        response = self.run_with_client(test)
+        self.assertEqual(response.get_status_code(), 200)
+        self.assertEqual(response.get_result()['rows'][0]['id'], 'a')
+        self.assertEqual(self.requests, [('POST', '/db/_all_docs', {'limit': 1, 'start_key': 'a'})])
+
+    def test_head_request(self):
+        async def test(client):
+            return await client.head_database(db='db')
+        response = self.run_with_client(test)
+        self.assertEqual(response.get_status_code(), 200)
+        self.assertIsNone(response.get_result())
+
+    def test_non_json_response(self):
+        async def test(client):
+            return await client.get_attachment(db='db', doc_id='doc', attachment_name='att')
+        response = self.run_with_client(test)
+        self.assertEqual(response.get_status_code(), 200)
+        self.assertEqual(response.get_result().content, b'attachment')
+        self.assertEqual(response.get_result().headers['Content-Type'], 'text/plain')
+
+    def test_stream_response(self):
+        async def test(client):
+            response = await client.post_all_docs_as_stream(db='db')
+            async with response.get_result() as result:
+                return json.loads(await result.read())
+        result = self.run_with_client(test)
+        self.assertEqual(result['rows'][0]['id'], 'a')
+
+    def test_concurrent_requests(self):
+        async def test(client):
+            calls = [client.post_all_docs(db='db') for _ in range(50)]
+            return await asyncio.gather(*calls)
+        responses = self.run_with_client(test, max_connections=10)
+        self.assertEqual(len(responses), 50)
+        self.assertEqual(len(self.requests), 50)
+
+    def test_error_augmented(self):
+        async def test(client):
+            with self.assertRaises(ApiException) as cm:
+                await client.get_document(db='db', doc_id='missing')
+            return cm.exception
+        error = self.run_with_client(test)
+        self.assertEqual(error.status_code, 404)
+        self.assertEqual(error.message, 'not_found: missing')
+        self.assertEqual(json.loads(error.http_response.text)['trace'], 'abc123')
+
+    def test_ssl_change_closes_session(self):
+        async def test(client):
+            await client.head_database(db='db')
+            session = client._async_session
+            client.set_disable_ssl_verification(True)
+            self.assertFalse(session.closed)
+            await client.head_database(db='db')
+            self.assertTrue(session.closed)
+            self.assertIsNot(client._async_session, session)
+            return client._async_session
+        session = self.run_with_client(test)
+        self.assertTrue(session.closed)
+
+    def test_validation_before_await(self):
+        client = AsyncCloudantV1(authenticator=NoAuthAuthenticator())
+        client.set_service_url('https://cloudant.example')
+        with self.assertRaisesRegex(ValueError, '.+_testDocument.+'):
+            client.get_document('testDatabase', '_testDocument')
+
+    def test_invalid_pool_size(self):
+        with self.assertRaisesRegex(ValueError, 'max_connections must be at least 1.'):
+            AsyncCloudantV1(authenticator=NoAuthAuthenticator(), max_connections=0)
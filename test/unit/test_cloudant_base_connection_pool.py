@@ -0,0 +1,116 @@
+# coding: utf-8
+
+# © Copyright IBM Corporation 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Test the connection pool options of the base service
+"""
+
+import socket
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+from requests import Session
+
+from ibmcloudant import CouchDbSessionAuthenticator
+from ibmcloudant.cloudant_v1 import CloudantV1
+
+
+class _ServerInformationHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        time.sleep(0.01)
+        body = b'{"couchdb":"Welcome","version":"3.3.3"}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestConnectionPool(unittest.TestCase):
+
+    def setUp(self):
+        self.service = CloudantV1(authenticator=NoAuthAuthenticator())
+        self.service.set_service_url('http://localhost:5984')
+
+    def test_pool_options(self):
+        self.service.set_connection_pool(pool_connections=2, pool_maxsize=64, pool_block=True)
+        adapter = self.service.http_adapter
+        self.assertEqual((adapter._pool_connections, adapter._pool_maxsize, adapter._pool_block), (2, 64, True))
+        self.assertIs(self.service.get_http_client().get_adapter('https://example.com'), adapter)
+
+    def test_pool_options_kept(self):
+        self.service.set_connection_pool(pool_maxsize=32)
+        self.assertEqual(self.service.http_adapter.max_retries.total, 0)
+        self.service.enable_retries(max_retries=3)
+        self.assertEqual(self.service.http_adapter._pool_maxsize, 32)
+        self.assertEqual(self.service.http_adapter.max_retries.total, 3)
+        self.service.set_disable_ssl_verification(True)
+        self.assertEqual(self.service.http_adapter._pool_maxsize, 32)
+        self.assertTrue(self.service.http_adapter._disable_ssl_verification)
+        self.service.disable_retries()
+        self.assertEqual(self.service.http_adapter._pool_maxsize, 32)
+        self.assertEqual(self.service.http_adapter.max_retries.total, 0)
+        session = Session()
+        self.service.set_http_client(session)
+        self.assertIs(session.get_adapter('http://localhost:5984'), self.service.http_adapter)
+
+    def test_keep_alive(self):
+        self.service.set_connection_pool(keep_alive_idle=30)
+        socket_options = self.service.http_adapter.poolmanager.connection_pool_kw['socket_options']
+        self.assertIn((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1), socket_options)
+
+    def test_session_authenticator_shares_pool(self):
+        service = CloudantV1(authenticator=CouchDbSessionAuthenticator('user', 'pass'))
+        service.set_service_url('http://localhost:5984')
+        service.set_connection_pool(pool_maxsize=16)
+        token_manager_client = service.authenticator.token_manager.http_client
+        self.assertIs(token_manager_client, service.get_http_client())
+        self.assertIs(token_manager_client.get_adapter('http://localhost:5984'), service.http_adapter)
+
+    def test_invalid_options(self):
+        with self.assertRaisesRegex(ValueError, 'The provided pool_maxsize 0 must be at least 1.'):
+            self.service.set_connection_pool(pool_maxsize=0)
+        with self.assertRaisesRegex(ValueError, 'The provided keep_alive_idle 0 must be at least 1.'):
+            self.service.set_connection_pool(keep_alive_idle=0)
+
+    def test_pool_stats(self):
+        server = ThreadingHTTPServer(('127.0.0.1', 0), _ServerInformationHandler)
+        server_thread = Thread(target=server.serve_forever, daemon=True)
+        server_thread.start()
+        try:
+            self.service.set_service_url(f'http://127.0.0.1:{server.server_port}')
+            self.service.set_connection_pool(pool_maxsize=8)
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(lambda _: self.service.get_server_information(), range(80)))
+            stats = self.service.get_connection_pool_stats()
+        finally:
+            server.shutdown()
+            server.server_close()
+        pool_stats = stats[f'http://127.0.0.1:{server.server_port}']
+        self.assertEqual(pool_stats['maxsize'], 8)
+        self.assertEqual(pool_stats['in_use'], 0)
+        self.assertEqual(pool_stats['requests'], 80)
+        self.assertLessEqual(pool_stats['connections'], 8)
+        self.assertEqual(pool_stats['idle'], pool_stats['connections'])
@@ -0,0 +1,265 @@
+# coding: utf-8
+
+# © Copyright IBM Corporation 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Test the document cache of the base service
+"""
+
+import json
+import re
+import unittest
+
+import responses
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+
+from ibmcloudant import DocumentCache
+from ibmcloudant.cloudant_v1 import CloudantV1, Document
+
+
+class TestDocumentCache(unittest.TestCase):
+
+    _base_url = 'http://localhost:5984'
+
+    def setUp(self):
+        self.service = CloudantV1(authenticator=NoAuthAuthenticator())
+        self.service.set_service_url(self._base_url)
+        self.cache = DocumentCache()
+        self.service.set_document_cache(self.cache)
+        self.docs = {}
+
+    def add_doc(self, doc_id, rev, **fields):
+        self.docs[doc_id] = dict(_id=doc_id, _rev=rev, **fields)
+
+    def get_doc_callback(self, request):
+        doc_id = request.path_url.split('?')[0].split('/')[-1]
+        doc = self.docs.get(doc_id)
+        if doc is None:
+            return (404, {}, json.dumps({'error': 'not_found', 'reason': 'missing'}))
+        etag = f'"{doc["_rev"]}"'
+        if request.headers.get('If-None-Match') == etag:
+            return (304, {'ETag': etag}, '')
+        return (200, {'ETag': etag}, json.dumps(doc))
+
+    def mock_get(self):
+        responses.add_callback(
+            responses.GET,
+            re.compile(rf'{self._base_url}/db/[^_/][^/]*(\?.*)?$'),
+            self.get_doc_callback,
+            content_type='application/json')
+
+    def get_doc(self, doc_id='doc', **kwargs):
+        return self.service.get_document(db='db', doc_id=doc_id, **kwargs).get_result()
+
+    @responses.activate
+    def test_revalidation(self):
+        self.mock_get()
+        self.add_doc('doc', '1-a', value=1)
+        self.assertEqual(self.get_doc(), self.docs['doc'])
+        self.assertEqual(self.get_doc(), self.docs['doc'])
+        self.assertEqual(len(responses.calls), 2)
+        self.assertNotIn('If-None-Match', responses.calls[0].request.headers)
+        self.assertEqual(responses.calls[1].request.headers['If-None-Match'], '"1-a"')
+        self.assertEqual(responses.calls[1].response.status_code, 304)
+        stats = self.cache.get_stats()
+        self.assertEqual((stats['entries'], stats['hits'], stats['revalidations'], stats['misses']), (1, 0, 1, 1))
+
+    @responses.activate
+    def test_changed_document(self):
+        self.mock_get()
+        self.add_doc('doc', '1-a', value=1)
+        self.get_doc()
+        self.add_doc('doc', '2-b', value=2)
+        self.assertEqual(self.get_doc()['value'], 2)
+        self.assertEqual(responses.calls[1].response.status_code, 200)
+        self.get_doc()
+        self.assertEqual(responses.calls[2].request.headers['If-None-Match'], '"2-b"')
+
+    @responses.activate
+    def test_result_changes_do_not_change_cache(self):
+        self.mock_get()
+        self.add_doc('doc', '1-a', value=1)
+        self.get_doc()['value'] = 'changed'
+        self.assertEqual(self.get_doc()['value'], 1)
+
+    @responses.activate
+    def test_ttl(self):
+        self.cache.ttl = 60
+        self.mock_get()
+        self.add_doc('doc', '1-a', value=1)
+        self.get_doc()
+        self.add_doc('doc', '2-b', value=2)
+        # Served without a request until the ttl has passed
+        self.assertEqual(self.get_doc()['value'], 1)
+        self.assertEqual(len(responses.calls), 1)
+        self.assertEqual(self.cache.get_stats()['hits'], 1)
+        self.cache.ttl = 0
+        self.assertEqual(self.get_doc()['value'], 2)
+        self.assertEqual(len(responses.calls), 2)
+
+    @responses.activate
+    def test_options_are_cached_separately(self):
+        self.mock_get()
+        self.add_doc('doc', '1-a', value=1)
+        self.get_doc()
+        self.get_doc(conflicts=True)
+        self.assertEqual(len(self.cache), 2)
+        self.assertNotIn('If-None-Match', responses.calls[1].request.headers)
+
+    @responses.activate
+    def test_if_none_match_argument_is_not_cached(self):
+        self.mock_get()
+        self.add_doc('doc', '1-a', value=1)
+        with self.assertRaises(ApiException) as cm:
+            self.get_doc(if_none_match='"1-a"')
+        self.assertEqual(cm.exception.status_code, 304)
+        self.assertEqual(len(self.cache), 0)
+
+    @responses.activate
+    def test_errors_are_not_cached(self):
+        self.mock_get()
+        for _ in range(2):
+            with self.assertRaises(ApiException) as cm:
+                self.get_doc('missing')
+            self.assertEqual(cm.exception.status_code, 404)
+        self.assertEqual(len(self.cache), 0)
+
+    @responses.activate
+    def test_put_and_delete_invalidate(self):
+        self.mock_get()
+        responses.put(f'{self._base_url}/db/doc', status=201, json={'ok': True, 'id': 'doc', 'rev': '2-b'})
+        responses.delete(f'{self._base_url}/db/doc', json={'ok': True, 'id': 'doc', 'rev': '3-c'})
+        self.add_doc('doc', '1-a')
+        self.add_doc('other', '1-a')
+        self.get_doc()
+        self.get_doc('other')
+        self.service.put_document(db='db', doc_id='doc', document=Document(rev='1-a'))
+        self.assertEqual(len(self.cache), 1)
+        self.get_doc()
+        self.service.delete_document(db='db', doc_id='doc', rev='2-b')
+        self.assertEqual(len(self.cache), 1)
+        self.get_doc('other')
+        self.assertEqual(responses.calls[-1].request.headers['If-None-Match'], '"1-a"')
+
+    @responses.activate
+    def test_post_bulk_docs_invalidates(self):
+        self.mock_get()
+        responses.post(f'{self._base_url}/db/_bulk_docs', status=201,
+                       json=[{'ok': True, 'id': 'doc', 'rev': '2-b'}, {'id': 'b', 'error': 'conflict'}])
+        self.add_doc('doc', '1-a')
+        self.add_doc('other', '1-a')
+        self.get_doc()
+        self.get_doc('other')
+        self.service.post_bulk_docs(db='db', bulk_docs={'docs': [{'_id': 'doc'}, {'_id': 'b'}]})
+        self.assertEqual(len(self.cache), 1)
+
+    @responses.activate
+    def test_post_bulk_docs_without_results_invalidates_database(self):
+        self.mock_get()
+        responses.post(f'{self._base_url}/db/_bulk_docs', status=201, json=[])
+        self.add_doc('doc', '1-a')
+        self.get_doc()
+        self.service.post_bulk_docs(db='db', bulk_docs={'docs': [{'_id': 'doc'}], 'new_edits': False})
+        self.assertEqual(len(self.cache), 0)
+
+    @responses.activate
+    def test_failed_write_does_not_invalidate(self):
+        self.mock_get()
+        responses.put(f'{self._base_url}/db/doc', status=409, json={'error': 'conflict', 'reason': 'conflict'})
+        self.add_doc('doc', '1-a')
+        self.get_doc()
+        with self.assertRaises(ApiException):
+            self.service.put_document(db='db', doc_id='doc', document=Document(rev='0-x'))
+        self.assertEqual(len(self.cache), 1)
+
+    @responses.activate
+    def test_write_during_get_is_not_cached(self):
+        def get_with_write(request):
+            # A write that completes while the get is in flight
+            self.cache.invalidate('db', 'doc')
+            return self.get_doc_callback(request)
+        responses.add_callback(responses.GET, f'{self._base_url}/db/doc', get_with_write,
+                               content_type='application/json')
+        self.add_doc('doc', '1-a')
+        self.get_doc()
+        self.assertEqual(len(self.cache), 0)
+
+    @responses.activate
+    def test_lru_eviction_by_entries(self):
+        self.mock_get()
+        self.cache.max_entries = 2
+        for doc_id in ('a', 'b', 'c'):
+            self.add_doc(doc_id, '1-a')
+        self.get_doc('a')
+        self.get_doc('b')
+        # Use a so that b is the least recently used
+        self.get_doc('a')
+        self.get_doc('c')
+        self.assertEqual(len(self.cache), 2)
+        self.assertEqual(self.cache.get_stats()['evictions'], 1)
+        self.get_doc('a')
+        self.assertEqual(responses.calls[-1].response.status_code, 304)
+        self.get_doc('b')
+        self.assertEqual(responses.calls[-1].response.status_code, 200)
+
+    @responses.activate
+    def test_lru_eviction_by_bytes(self):
+        self.mock_get()
+        self.add_doc('a', '1-a', value='x' * 100)
+        self.add_doc('b', '1-a', value='x' * 100)
+        size = len(json.dumps(self.docs['a']).encode('utf-8'))
+        self.cache.max_bytes = size + size // 2
+        self.get_doc('a')
+        self.get_doc('b')
+        self.assertEqual(len(self.cache), 1)
+        self.assertEqual(self.cache.get_stats()['bytes'], size)
+        # A document larger than max_bytes is not cached
+        self.add_doc('c', '1-a', value='x' * (2 * size))
+        self.get_doc('c')
+        self.assertEqual(len(self.cache), 1)
+
+    @responses.activate
+    def test_clear_and_invalidate_database(self):
+        self.mock_get()
+        self.add_doc('a', '1-a')
+        self.add_doc('b', '1-a')
+        self.get_doc('a')
+        self.get_doc('b')
+        self.cache.invalidate('other')
+        self.assertEqual(len(self.cache), 2)
+        self.cache.invalidate('db')
+        self.assertEqual(len(self.cache), 0)
+        self.get_doc('a')
+        self.cache.clear()
+        self.assertEqual(self.cache.get_stats()['bytes'], 0)
+
+    @responses.activate
+    def test_no_cache(self):
+        self.mock_get()
+        self.service.set_document_cache(None)
+        self.add_doc('doc', '1-a')
+        self.get_doc()
+        self.get_doc()
+        self.assertEqual(len(self.cache), 0)
+        self.assertNotIn('If-None-Match', responses.calls[1].request.headers)
+
+    def test_validation(self):
+        for name in ('max_entries', 'max_bytes'):
+            with self.subTest(name):
+                with self.assertRaisesRegex(ValueError, f'The provided {name} 0 must be at least 1.'):
+                    DocumentCache(**{name: 0})
+        with self.assertRaisesRegex(ValueError, 'The provided ttl -1 must be at least 0.'):
+            DocumentCache(ttl=-1)
@@ -0,0 +1,134 @@
+# coding: utf-8
+
+# © Copyright IBM Corporation 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Test the pluggable JSON codec of the base service
+"""
+
+import gzip
+import json
+import unittest
+
+import responses
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+
+from ibmcloudant import cloudant_v1
+from ibmcloudant.cloudant_v1 import BulkDocs, CloudantV1, Document
+from ibmcloudant.features.bulk_writer import BulkWriter
+from ibmcloudant.features.pagination import Pagination, PagerType
+
+
+class CountingCodec:
+    """
+    Test class for a JSON codec that counts the calls.
+    """
+    def __init__(self):
+        self.dumps_calls = 0
+        self.loads_calls = 0
+
+    def dumps(self, obj) -> bytes:
+        self.dumps_calls += 1
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+    def loads(self, data: bytes):
+        self.loads_calls += 1
+        return json.loads(data)
+
+
+class TestJsonCodec(unittest.TestCase):
+
+    _base_url = 'http://localhost:5984'
+
+    def setUp(self):
+        self.codec = CountingCodec()
+        self.service = CloudantV1(authenticator=NoAuthAuthenticator())
+        self.service.set_service_url(self._base_url)
+        self.service.set_json_codec(dumps=self.codec.dumps, loads=self.codec.loads)
+
+    @responses.activate
+    def test_request_and_response(self):
+        responses.post(f'{self._base_url}/db/_find', json={'docs': [{'_id': 'doc'}]})
+        result = self.service.post_find(db='db', selector={'value': 1}).get_result()
+        self.assertEqual(result, {'docs': [{'_id': 'doc'}]})
+        self.assertEqual(gzip.decompress(responses.calls[0].request.body), b'{"selector":{"value":1}}')
+        self.assertEqual((self.codec.dumps_calls, self.codec.loads_calls), (1, 1))
+
+    @responses.activate
+    def test_bulk_docs_request(self):
+        responses.post(f'{self._base_url}/db/_bulk_docs', json=[{'id': 'doc', 'rev': '1-abc', 'ok': True}])
+        bulk_docs = BulkDocs(docs=[Document.from_dict({'_id': 'doc', 'value': 1})])
+        self.service.post_bulk_docs(db='db', bulk_docs=bulk_docs).get_result()
+        self.assertEqual(gzip.decompress(responses.calls[0].request.body), b'{"docs":[{"_id":"doc","value":1}]}')
+        self.assertEqual(self.codec.dumps_calls, 1)
+
+    @responses.activate
+    def test_default_codec(self):
+        responses.post(f'{self._base_url}/db/_find', json={'docs': [{'_id': 'doc'}]})
+        self.service.set_json_codec()
+        result = self.service.post_find(db='db', selector={'value': 1}).get_result()
+        self.assertEqual(result, {'docs': [{'_id': 'doc'}]})
+        self.assertEqual(gzip.decompress(responses.calls[0].request.body), b'{"selector": {"value": 1}}')
+        self.assertEqual((self.codec.dumps_calls, self.codec.loads_calls), (0, 0))
+
+    @responses.activate
+    def test_non_json_and_stream_responses(self):
+        responses.get(f'{self._base_url}/db/doc/att', body=b'attachment', content_type='text/plain')
+        responses.post(f'{self._base_url}/db/_all_docs', json={'rows': []})
+        attachment = self.service.get_attachment(db='db', doc_id='doc', attachment_name='att').get_result()
+        self.assertEqual(attachment.content, b'attachment')
+        stream = self.service.post_all_docs_as_stream(db='db').get_result()
+        self.assertEqual(json.loads(stream.content), {'rows': []})
+        self.assertEqual(self.codec.loads_calls, 0)
+
+    @responses.activate
+    def test_invalid_json_response(self):
+        responses.get(f'{self._base_url}/db/doc', body='{', content_type='application/json')
+        with self.assertRaisesRegex(ApiException, 'Error processing the HTTP response'):
+            self.service.get_document(db='db', doc_id='doc')
+
+    @responses.activate
+    def test_features(self):
+        rows = [{'id': f'doc{i}', 'key': i, 'value': 1} for i in range(3)]
+        responses.post(f'{self._base_url}/db/_design/ddoc/_view/view', json={'total_rows': 3, 'rows': rows})
+        responses.post(f'{self._base_url}/db/_bulk_docs', json=[{'id': 'doc', 'rev': '1-abc', 'ok': True}])
+        pagination = Pagination.new_pagination(self.service, PagerType.POST_VIEW, db='db', ddoc='ddoc', view='view')
+        self.assertEqual(len(list(pagination.rows())), 3)
+        self.assertEqual(list(self.service.iter_view_rows(db='db', ddoc='ddoc', view='view')), rows)
+        with BulkWriter(self.service, 'db') as writer:
+            writer.write({'_id': 'doc'})
+        # the pagination and stream requests and the bulk document, then the
+        # pagination response, stream rows and fields and bulk response
+        self.assertEqual(self.codec.dumps_calls, 1 + 1 + 1)
+        self.assertEqual(self.codec.loads_calls, 1 + 3 + 1 + 1)
+
+    def test_prepared_json_body(self):
+        request = self.service.prepare_request('POST', '/db/_find', headers={'Content-Type': 'application/json'},
+                                               data='{"selector": {"value": 1}}')
+        self.assertEqual(gzip.decompress(request['data']), b'{"selector":{"value":1}}')
+        self.assertEqual(self.codec.dumps_calls, 1)
+
+    def test_prepared_non_json_body(self):
+        request = self.service.prepare_request('PUT', '/db/doc/att', headers={'Content-Type': 'text/plain'},
+                                               data='{"selector": {"value": 1}}')
+        self.assertEqual(gzip.decompress(request['data']), b'{"selector": {"value": 1}}')
+        request = self.service.prepare_request('POST', '/db/_find', data={'selector': {'value': 1}})
+        self.assertEqual(gzip.decompress(request['data']), b'{"selector": {"value": 1}}')
+        self.assertEqual(self.codec.dumps_calls, 0)
+
+    def test_operations_module_unchanged(self):
+        self.assertIs(cloudant_v1.json, json)
+        self.assertEqual(str(cloudant_v1.Change(rev='1-abc')), '{\n  "rev": "1-abc"\n}')
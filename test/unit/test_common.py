@@ -37,6 +37,30 @@ class TestCommon(unittest.TestCase):
         self.assertIn('cloudant-python-sdk', headers.get('User-Agent'))
         self.assertRegex(headers.get('User-Agent'), r'^cloudant-python-sdk/[\d\.]* \(.*\)$')
 
+    def test_get_sdk_headers_cached(self):
+        """
+        Test the get_sdk_headers method returns an independent copy of the cached headers
+        """
+        headers = common.get_sdk_headers(service_name='ibmcloudant', service_version='V1', operation_id='operation2')
+        headers['Accept'] = 'application/json'
+        self.assertEqual(
+            common.get_sdk_headers(service_name='ibmcloudant', service_version='V1', operation_id='operation2'),
+            {
+                'X-IBMCloud-SDK-Analytics': 'service_name=ibmcloudant;service_version=V1;operation_id=operation2',
+                'User-Agent': common.get_user_agent(),
+            })
+
+    def test_get_operation_id(self):
+        """
+        Test the get_operation_id method
+        """
+        headers = common.get_sdk_headers(service_name='ibmcloudant', service_version='V1', operation_id='operation3')
+        self.assertEqual(common.get_operation_id(headers), 'operation3')
+        self.assertEqual(common.get_operation_id(
+            {'X-IBMCloud-SDK-Analytics': 'service_name=other;service_version=V2;operation_id=operation4'}), 'operation4')
+        self.assertIsNone(common.get_operation_id({'Accept': 'application/json'}))
+        self.assertIsNone(common.get_operation_id(None))
+
     def test_get_system_info(self):
         """
         Test the get_system_info method
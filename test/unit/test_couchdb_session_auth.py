@@ -21,6 +21,7 @@ import unittest
 import os
 import requests
 import responses
+import threading
 import time
 
 from ibmcloudant import CouchDbSessionAuthenticator
@@ -192,6 +193,123 @@ class TestCouchDbSessionAuth(unittest.TestCase):
         self.assertEqual(responses.calls[-1].request.method, "GET")
 
 
+class TestCouchDbSessionAuthBackgroundRefresh(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.cookie_value = "foobar"
+        self.cookie_expire_time = datetime.datetime.fromtimestamp(
+            time.time() + 10 * 60, datetime.timezone.utc).strftime("%a, %d-%b-%Y %H:%M:%S GMT")
+        # Set to block session requests until the event is set
+        self.session_released = None
+        self.session_requests = 0
+        # A mock per test so the refresh thread never sees other mocked responses
+        self.responses = responses.RequestsMock(assert_all_requests_are_fired=False)
+        self.responses.start()
+        self.addCleanup(self.responses.stop)
+
+        self.authenticator = CouchDbSessionAuthenticator("adm", "pass", background_refresh=True)
+        self.addCleanup(self.authenticator.stop_background_refresh)
+        self.token_manager = self.authenticator.token_manager
+        self.client = CloudantV1(self.authenticator)
+
+        def post_session(request):
+            self.session_requests += 1
+            cookie_value = self.cookie_value
+            if self.session_released is not None:
+                self.session_released.wait(10)
+            return (200, {
+                "Set-Cookie": "AuthSession=" + cookie_value + ";  Version=1; Expires=" +
+                              self.cookie_expire_time + "; Max-Age=600; Path=/; HttpOnly"},
+                    json.dumps({"ok": True, "name": "adm", "roles": ["_admin"]}))
+
+        self.responses.add_callback(responses.POST, 'http://cloudant.example/_session', post_session)
+        self.responses.add(responses.GET, 'http://cloudant.example/_session',
+                      json={"ok": True, "userCtx": {"name": "adm", "roles": ["_admin"]}},
+                      status=200)
+        self.client.set_service_url('http://cloudant.example')
+
+    def session_cookie(self):
+        return next(x.value for x in self.token_manager.access_token if x.name == 'AuthSession')
+
+    def refresh_in_background(self):
+        self.token_manager.refresh_time = 0
+        self.token_manager._refresher_wakeup.set()
+
+    def wait_for(self, condition):
+        deadline = time.monotonic() + 5
+        while not condition():
+            self.assertLess(time.monotonic(), deadline, 'Timed out waiting for the background refresh')
+            time.sleep(0.01)
+
+    def test_invalid_background_refresh_type(self):
+        with self.assertRaisesRegex(TypeError, 'background_refresh must be a bool'):
+            CouchDbSessionAuthenticator("adm", "pass", background_refresh='True')
+
+    def test_background_refresh(self):
+        self.client.get_session_information()
+        self.assertEqual(1, self.session_requests)
+        self.assertEqual(self.responses.calls[-1].request.headers["Cookie"], "AuthSession=foobar")
+        self.assertTrue(self.token_manager._refresher.is_alive())
+
+        self.cookie_value = "bar"
+        self.refresh_in_background()
+        self.wait_for(lambda: self.session_cookie() == "bar")
+        self.assertGreater(self.token_manager.refresh_time, time.time())
+        self.client.get_session_information()
+        self.assertEqual(2, self.session_requests)
+        self.assertEqual(self.responses.calls[-1].request.headers["Cookie"], "AuthSession=bar")
+
+    def test_requests_do_not_wait_for_background_refresh(self):
+        self.client.get_session_information()
+        self.session_released = threading.Event()
+        self.cookie_value = "bar"
+        self.refresh_in_background()
+        self.wait_for(lambda: self.session_requests == 2)
+
+        # The refresh is in flight, requests use the current session
+        # and do not make further session requests
+        threads = [threading.Thread(target=self.client.get_session_information) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+            self.assertFalse(thread.is_alive())
+        self.assertEqual(2, self.session_requests)
+        self.assertEqual(self.responses.calls[-1].request.headers["Cookie"], "AuthSession=foobar")
+
+        self.session_released.set()
+        self.wait_for(lambda: self.session_cookie() == "bar")
+        self.client.get_session_information()
+        self.assertEqual(2, self.session_requests)
+        self.assertEqual(self.responses.calls[-1].request.headers["Cookie"], "AuthSession=bar")
+
+    def test_expired_session_single_request(self):
+        self.client.get_session_information()
+        self.cookie_value = "bar"
+        self.token_manager.expire_time = 0
+        threads = [threading.Thread(target=self.client.get_session_information) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(2, self.session_requests)
+        self.assertEqual(self.responses.calls[-1].request.headers["Cookie"], "AuthSession=bar")
+
+    def test_stop_background_refresh(self):
+        self.client.get_session_information()
+        refresher = self.token_manager._refresher
+        self.authenticator.stop_background_refresh()
+        self.assertFalse(refresher.is_alive())
+        self.assertIsNone(self.token_manager._refresher)
+
+        # Requests renew the session again
+        self.cookie_value = "bar"
+        self.token_manager.refresh_time = 0
+        self.client.get_session_information()
+        self.assertEqual(2, self.session_requests)
+        self.assertEqual(self.responses.calls[-1].request.headers["Cookie"], "AuthSession=bar")
+
+
 class TestCouchDbSessionAuthPatch(unittest.TestCase):
 
     def setUp(self) -> None:
@@ -231,3 +349,12 @@ class TestCouchDbSessionAuthPatch(unittest.TestCase):
         self.assertTrue(service.disable_ssl_verification)
         self.assertTrue(
             service.authenticator.token_manager.disable_ssl_verification)
+
+    def test_background_refresh(self):
+        os.environ['TEST_SERVICE_AUTHTYPE'] = 'couchdb_session'
+        os.environ['TEST_SERVICE_USERNAME'] = 'adm'
+        os.environ['TEST_SERVICE_PASSWORD'] = 'pass'
+        os.environ['TEST_SERVICE_BACKGROUND_REFRESH'] = 'true'
+        service = CloudantV1.new_instance(service_name='TEST_SERVICE')
+        self.assertEqual('COUCHDB_SESSION', service.authenticator.authentication_type())
+        self.assertTrue(service.authenticator.token_manager.background_refresh)